@@ -11,6 +11,9 @@ sys.path.insert(0, "/opt/airflow")
 # All imports at the top
 from sqlalchemy import text
 from src.db.factory import make_database
+from src.db.schema import initialize_schema
+from src.metrics import push_metrics
+from src.repositories.paper_stats import PaperStatsRepository, processing_stats
 from src.services.arxiv.factory import make_arxiv_client
 from src.services.metadata_fetcher import make_metadata_fetcher
 from src.services.pdf_parser.factory import make_pdf_parser_service
@@ -31,7 +34,8 @@ def get_cached_services() -> Tuple[Any, Any, Any, Any]:
     # Initialize core services
     arxiv_client = make_arxiv_client()
     pdf_parser = make_pdf_parser_service()
-    database = make_database()
+    # Task processes are short-lived: skip the connection test and DDL, setup_environment owns the schema
+    database = make_database(fast_start=True)
 
     # Create metadata fetcher with dependencies
     metadata_fetcher = make_metadata_fetcher(arxiv_client, pdf_parser)
@@ -69,6 +73,19 @@ async def run_paper_ingestion_pipeline(
         )
 
 
+async def run_failed_paper_retries() -> dict:
+    """
+    Async wrapper for retrying papers with a due failure record.
+
+    Returns:
+        Dictionary with retry statistics
+    """
+    _arxiv_client, _pdf_parser, database, metadata_fetcher = get_cached_services()
+
+    with database.get_session() as session:
+        return await metadata_fetcher.retry_failed_papers(db_session=session)
+
+
 def setup_environment():
     """Setup environment and verify dependencies."""
     logger.info("Setting up environment for arXiv paper ingestion")
@@ -82,6 +99,9 @@ def setup_environment():
             session.execute(text("SELECT 1"))
             logger.info("Database connection verified")
 
+        # Create/upgrade the schema once per run instead of in every task process
+        initialize_schema(database.engine)
+
         logger.info(f"arXiv client ready: {arxiv_client.base_url}")
         logger.info("PDF parser service ready (Docling models cached)")
 
@@ -133,42 +153,39 @@ def fetch_daily_papers(**context):
         logger.error(error_msg)
         raise Exception(error_msg)
 
+    finally:
+        # Task processes are short-lived, so push stage metrics instead of waiting for a scrape
+        push_metrics("fetch_daily_papers")
+
 
 def process_failed_pdfs(**context):
     """
-    Retry processing of PDFs that failed in the main fetch task.
+    Retry papers that failed a pipeline stage in this or earlier runs.
 
     This function:
-    1. Gets failed PDF list from the main task
-    2. Retries processing with different settings
-    3. Reports final success/failure statistics
+    1. Loads failures that are due for retry from the paper_failures table
+    2. Re-runs only the failed stage (cached PDFs and saved records are reused)
+    3. Reschedules with exponential backoff or moves exhausted papers to the dead-letter table
     """
     logger.info("Processing failed PDFs")
 
     try:
-        fetch_results = context["task_instance"].xcom_pull(task_ids="fetch_daily_papers", key="fetch_results")
-
-        if not fetch_results or not fetch_results.get("errors"):
-            logger.info("No failed PDFs to retry")
-            return {"status": "skipped", "message": "No failures to retry"}
+        results = asyncio.run(run_failed_paper_retries())
 
-        logger.info(f"Found {len(fetch_results['errors'])} errors to investigate")
+        if not results["due"]:
+            return {"status": "skipped", "message": "No failures due for retry", **results}
 
-        for error in fetch_results["errors"]:
-            # TODO: Implement retry logic
-            logger.warning(f"Error to investigate: {error}")
-
-        return {
-            "status": "analyzed",
-            "errors_logged": len(fetch_results["errors"]),
-            "message": "Errors logged for investigation",
-        }
+        logger.info(f"Failed paper retry completed: {results}")
+        return {"status": "retried", **results}
 
     except Exception as e:
         error_msg = f"Failed PDF processing error: {str(e)}"
         logger.error(error_msg)
         raise Exception(error_msg)
 
+    finally:
+        push_metrics("process_failed_pdfs")
+
 
 def create_opensearch_placeholders(**context):
     """
@@ -228,6 +245,11 @@ def generate_daily_report(**context):
 
         opensearch_results = context["task_instance"].xcom_pull(task_ids="create_opensearch_placeholders")
 
+        # Corpus totals come from the maintained counters instead of counting papers
+        _arxiv_client, _pdf_parser, database, _metadata_fetcher = get_cached_services()
+        with database.get_session() as session:
+            corpus_stats = PaperStatsRepository(session).get_totals() or processing_stats(0, 0, 0)
+
         report = {
             "date": context["ds"],
             "execution_time": datetime.now().isoformat(),
@@ -240,8 +262,12 @@ def generate_daily_report(**context):
             "processing": {
                 "processing_time_seconds": fetch_results.get("processing_time", 0) if fetch_results else 0,
                 "errors": len(fetch_results.get("errors", [])) if fetch_results else 0,
-                "failed_pdf_retries": failed_pdf_results.get("errors_logged", 0) if failed_pdf_results else 0,
+                "failures_recorded": fetch_results.get("failures_recorded", 0) if fetch_results else 0,
+                "failed_pdf_retries": failed_pdf_results.get("due", 0) if failed_pdf_results else 0,
+                "failed_pdfs_recovered": failed_pdf_results.get("recovered", 0) if failed_pdf_results else 0,
+                "failed_pdfs_dead_lettered": failed_pdf_results.get("dead_lettered", 0) if failed_pdf_results else 0,
             },
+            "corpus": corpus_stats,
             "opensearch": {
                 "placeholders_created": opensearch_results.get("papers_ready_for_indexing", 0) if opensearch_results else 0,
                 "status": opensearch_results.get("status", "unknown") if opensearch_results else "unknown",
@@ -256,6 +282,15 @@ def generate_daily_report(**context):
         logger.info(f"Papers stored: {report['papers']['stored']}")
         logger.info(f"Processing time: {report['processing']['processing_time_seconds']:.1f}s")
         logger.info(f"Errors encountered: {report['processing']['errors']}")
+        logger.info(
+            f"Failed paper retries: {report['processing']['failed_pdf_retries']} due, "
+            f"{report['processing']['failed_pdfs_recovered']} recovered, "
+            f"{report['processing']['failed_pdfs_dead_lettered']} dead-lettered"
+        )
+        logger.info(
+            f"Corpus: {corpus_stats['total_papers']} papers, {corpus_stats['processed_papers']} processed "
+            f"({corpus_stats['processing_rate']:.1f}%), {corpus_stats['papers_with_text']} with text"
+        )
         logger.info(f"OpenSearch placeholders: {report['opensearch']['placeholders_created']}")
         logger.info("=== END REPORT ===")
 
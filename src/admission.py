@@ -0,0 +1,208 @@
+"""Admission control for the API: bounded concurrency with a bounded, prioritized wait queue per route."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Coroutine, Deque, Dict, Iterable
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from src.metrics import ADMISSION_QUEUE_DEPTH, ADMISSION_REJECTED_TOTAL, ADMISSION_WAIT_SECONDS
+from starlette.types import Receive, Scope, Send
+
+# Why a request was not admitted (the "reason" label of rejections)
+REJECT_QUEUE_FULL = "queue_full"
+REJECT_TIMEOUT = "timeout"
+REJECT_SHED = "shed"
+
+
+class Overloaded(Exception):
+    """A request was not admitted; reason is one of the REJECT_* constants."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class AdmissionLimiter:
+    """
+    Runs at most limit requests at once; up to max_queue more wait for a slot, priority ones first.
+
+    Rejecting beyond the queue makes a burst fail fast instead of piling every request onto the
+    connection pool until they all time out. When the queue is full, a priority request takes the
+    place of the newest waiting normal request, which is rejected. Meant for one event loop (one
+    per API worker), so there is no locking.
+    """
+
+    def __init__(self, name: str, limit: int, max_queue: int, timeout_seconds: float):
+        """
+        Args:
+            name: Limiter name for metrics (the route template, or "default")
+            limit: Requests admitted at once
+            max_queue: Requests that may wait for a slot
+            timeout_seconds: Longest wait for a slot before the request is rejected
+        """
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.timeout_seconds = timeout_seconds
+        self.active = 0
+        self._priority: Deque[asyncio.Future] = deque()
+        self._normal: Deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._priority) + len(self._normal)
+
+    def _report_queue(self) -> None:
+        ADMISSION_QUEUE_DEPTH.labels(limiter=self.name).set(self.queued)
+
+    async def acquire(self, priority: bool = False) -> None:
+        """
+        Wait for a slot; release() it when the request is done.
+
+        Raises:
+            Overloaded: The queue is full, the wait timed out, or a priority request took the place in the queue
+        """
+        if self.active < self.limit:
+            self.active += 1
+            return
+        if self.queued >= self.max_queue:
+            if not (priority and self._normal):
+                raise Overloaded(REJECT_QUEUE_FULL)
+            # The newest normal request has waited least
+            self._normal.pop().set_exception(Overloaded(REJECT_SHED))
+
+        waiter = asyncio.get_running_loop().create_future()
+        queue = self._priority if priority else self._normal
+        queue.append(waiter)
+        self._report_queue()
+        try:
+            await asyncio.wait_for(waiter, self.timeout_seconds)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                # Handed a slot just as the wait ended: pass it on
+                self.release()
+            elif waiter in queue:
+                queue.remove(waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                raise Overloaded(REJECT_TIMEOUT) from None
+            raise
+        finally:
+            self._report_queue()
+
+    def release(self) -> None:
+        """Give the slot to the next waiting request (priority first), or free it."""
+        for queue in (self._priority, self._normal):
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.done():
+                    # The slot passes to the waiter, so active stays the same
+                    waiter.set_result(None)
+                    return
+        self.active -= 1
+
+
+class _ReleasingResponse:
+    """Sends a response, then gives its admission slot back (streamed bodies hold it while they stream)."""
+
+    def __init__(self, response: Response, limiter: AdmissionLimiter):
+        self.response = response
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.response(scope, receive, send)
+        finally:
+            self.limiter.release()
+
+
+class AdmissionControl:
+    """
+    Per-route concurrency limits with bounded wait queues, shedding load with 503.
+
+    Requests to a route in route_limits share that route's limiter, all others share a default one.
+    Requests to priority routes wait ahead of the others; exempt routes are never limited. A request
+    that is not admitted gets 503 with Retry-After before any work is done for it (not even request
+    validation). A slot is held until the response is sent completely, so streamed responses count
+    for as long as they stream.
+
+    Applied by AdmittedRoute to the route the router matched, found in app.state.admission.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout_seconds: float,
+        retry_after_seconds: int,
+        route_limits: Dict[str, int],
+        priority_routes: Iterable[str] = (),
+        exempt_routes: Iterable[str] = (),
+    ):
+        """
+        Args:
+            max_concurrent: Requests admitted at once to routes without their own limit
+            max_queue: Requests that may wait for a slot, per limiter
+            queue_timeout_seconds: Longest wait for a slot
+            retry_after_seconds: Retry-After of 503 responses
+            route_limits: Requests admitted at once, by route template (e.g. /api/v1/papers/search)
+            priority_routes: Route templates whose requests are admitted first
+            exempt_routes: Route templates that are never limited
+        """
+        self.retry_after_seconds = retry_after_seconds
+        self.default = AdmissionLimiter("default", max_concurrent, max_queue, queue_timeout_seconds)
+        self.limiters = {
+            route: AdmissionLimiter(route, limit, max_queue, queue_timeout_seconds) for route, limit in route_limits.items()
+        }
+        self.priority_routes = frozenset(priority_routes)
+        self.exempt_routes = frozenset(exempt_routes)
+
+    async def admit(
+        self, path: str, handler: Callable[[Request], Coroutine[Any, Any, Response]], request: Request
+    ) -> Response:
+        """Run a route's request handler once the route's limiter admits the request."""
+        if path in self.exempt_routes:
+            return await handler(request)
+
+        limiter = self.limiters.get(path, self.default)
+        start = time.perf_counter()
+        try:
+            await limiter.acquire(priority=path in self.priority_routes)
+        except Overloaded as e:
+            ADMISSION_REJECTED_TOTAL.labels(limiter=limiter.name, reason=e.reason).inc()
+            return JSONResponse(
+                {"detail": "Server is overloaded, retry later"},
+                status_code=503,
+                headers={"Retry-After": str(self.retry_after_seconds)},
+            )
+
+        ADMISSION_WAIT_SECONDS.labels(limiter=limiter.name).observe(time.perf_counter() - start)
+        try:
+            response = await handler(request)
+        except BaseException:
+            limiter.release()
+            raise
+        return _ReleasingResponse(response, limiter)
+
+
+class AdmittedRoute(APIRoute):
+    """
+    APIRoute whose requests pass the app's admission control (app.state.admission, if set) first.
+
+    Use it as the route_class of routers; limits are looked up by the route's path, which is its full
+    template because routers carry the API prefix (see src.routers).
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        path = self.path
+
+        async def admitted_handler(request: Request) -> Response:
+            admission = getattr(request.app.state, "admission", None)
+            if admission is None:
+                return await handler(request)
+            return await admission.admit(path, handler, request)
+
+        return admitted_handler
@@ -0,0 +1,284 @@
+"""
+Parallel backfill of historical arXiv papers.
+
+Partitions a date range into day windows and runs them across worker processes.
+All workers share one arXiv rate limit and one parse concurrency budget.
+
+Usage:
+    python -m src.backfill --from 2023-01-01 --to 2025-01-01 --workers 4
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Per-process state, populated by _init_worker in each worker process
+_worker: Dict[str, Any] = {}
+
+
+class ProcessSemaphore:
+    """asyncio.Semaphore-compatible wrapper around a multiprocessing semaphore."""
+
+    def __init__(self, semaphore: Any, poll_interval: float = 0.1):
+        self._semaphore = semaphore
+        self._poll_interval = poll_interval
+
+    async def acquire(self) -> bool:
+        # Poll instead of blocking a thread so cancellation never leaks a slot
+        while not self._semaphore.acquire(block=False):
+            await asyncio.sleep(self._poll_interval)
+        return True
+
+    def release(self) -> None:
+        self._semaphore.release()
+
+
+class BackfillProgress:
+    """Tracks completed day windows and reports throughput and ETA."""
+
+    def __init__(self, total_days: int):
+        self.total_days = total_days
+        self.days_done = 0
+        self.days_failed: List[str] = []
+        self.papers_fetched = 0
+        self.papers_stored = 0
+        self.pdfs_parsed = 0
+        self.start_time = time.monotonic()
+
+    def record(self, results: Dict[str, Any]) -> None:
+        self.days_done += 1
+        self.papers_fetched += results.get("papers_fetched", 0)
+        self.papers_stored += results.get("papers_stored", 0)
+        self.pdfs_parsed += results.get("pdfs_parsed", 0)
+
+    def record_failure(self, day: str) -> None:
+        self.days_done += 1
+        self.days_failed.append(day)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.start_time
+
+    def eta_seconds(self) -> Optional[float]:
+        if not self.days_done:
+            return None
+        return (self.total_days - self.days_done) * self.elapsed / self.days_done
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = self.elapsed
+        return {
+            "days_total": self.total_days,
+            "days_done": self.days_done,
+            "days_failed": sorted(self.days_failed),
+            "papers_fetched": self.papers_fetched,
+            "papers_stored": self.papers_stored,
+            "pdfs_parsed": self.pdfs_parsed,
+            "elapsed_seconds": elapsed,
+            "papers_per_second": self.papers_stored / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def log(self, day: str) -> None:
+        elapsed = self.elapsed
+        eta = self.eta_seconds()
+        logger.info(
+            f"[{self.days_done}/{self.total_days} days] {day} done - "
+            f"{self.papers_stored} papers stored, {self.papers_stored / elapsed:.2f} papers/s, "
+            f"{self.days_done / elapsed * 3600:.1f} days/h, "
+            f"ETA {timedelta(seconds=int(eta)) if eta is not None else 'unknown'}"
+        )
+
+
+def day_windows(start: date, end: date) -> List[str]:
+    """
+    Split an inclusive date range into single-day windows.
+
+    Returns:
+        List of dates in arXiv query format (YYYYMMDD), newest first
+    """
+    if end < start:
+        raise ValueError(f"--to ({end}) must not be before --from ({start})")
+    days = (end - start).days + 1
+    return [(end - timedelta(days=offset)).strftime("%Y%m%d") for offset in range(days)]
+
+
+def _init_worker(rate_limit_lock: Any, rate_limit_slot: Any, parse_semaphore: Any, process_pdfs: bool) -> None:
+    """Build the services of one worker process, wired to the shared rate limit and parse pool."""
+    # Imported here so the parent process never loads Docling/PyTorch
+    from src.db.factory import make_database
+    from src.services.arxiv.factory import make_arxiv_client
+    from src.services.arxiv.rate_limiter import SharedRateLimiter
+    from src.services.metadata_fetcher import make_metadata_fetcher
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s")
+
+    settings = get_settings()
+    rate_limiter = SharedRateLimiter(settings.arxiv.rate_limit_delay, lock=rate_limit_lock, next_slot=rate_limit_slot)
+    arxiv_client = make_arxiv_client(rate_limiter=rate_limiter)
+
+    pdf_parser = None
+    if process_pdfs:
+        from src.services.pdf_parser.factory import make_pdf_parser_service
+
+        pdf_parser = make_pdf_parser_service()
+
+    # The parent already set up the schema; workers only need a lazily connecting engine
+    _worker["database"] = make_database(fast_start=True)
+    _worker["fetcher"] = make_metadata_fetcher(arxiv_client, pdf_parser, parse_semaphore=ProcessSemaphore(parse_semaphore))
+
+
+def _run_day(day: str, max_results: int, process_pdfs: bool) -> Dict[str, Any]:
+    """Ingest a single day window inside a worker process."""
+    from src.metrics import push_metrics
+
+    database = _worker["database"]
+    fetcher = _worker["fetcher"]
+
+    try:
+        with database.get_session() as session:
+            results = asyncio.run(
+                fetcher.fetch_and_process_papers(
+                    max_results=max_results,
+                    from_date=day,
+                    to_date=day,
+                    process_pdfs=process_pdfs,
+                    store_to_db=True,
+                    db_session=session,
+                )
+            )
+    finally:
+        push_metrics(f"backfill_worker_{os.getpid()}")
+
+    if results["papers_fetched"] >= max_results:
+        logger.warning(f"{day}: fetched {results['papers_fetched']} papers, the window may be truncated at --max-per-day")
+
+    return results
+
+
+def run_backfill(
+    from_date: date,
+    to_date: date,
+    workers: int,
+    parse_concurrency: int,
+    max_results: int,
+    process_pdfs: bool = True,
+) -> Dict[str, Any]:
+    """
+    Backfill every day in [from_date, to_date] using a pool of worker processes.
+
+    Args:
+        from_date: First day to ingest (inclusive)
+        to_date: Last day to ingest (inclusive)
+        workers: Number of worker processes
+        parse_concurrency: Maximum PDFs parsed at once across all workers
+        max_results: Maximum papers fetched per day window
+        process_pdfs: Whether to download and parse PDFs
+
+    Returns:
+        Summary with totals, throughput and failed days
+    """
+    days = day_windows(from_date, to_date)
+    progress = BackfillProgress(total_days=len(days))
+    logger.info(
+        f"Backfilling {len(days)} days ({from_date} to {to_date}) with {workers} workers, "
+        f"parse concurrency {parse_concurrency}, PDFs {'on' if process_pdfs else 'off'}"
+    )
+
+    # Connect and set up the schema once here; workers start their engines in fast-start mode
+    from src.db.factory import make_database
+
+    make_database().teardown()
+
+    # Spawn keeps workers free of inherited sockets and PyTorch thread state
+    ctx = multiprocessing.get_context("spawn")
+    rate_limit_lock = ctx.Lock()
+    rate_limit_slot = ctx.Value("d", 0.0, lock=False)
+    parse_semaphore = ctx.BoundedSemaphore(parse_concurrency)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(rate_limit_lock, rate_limit_slot, parse_semaphore, process_pdfs),
+    ) as executor:
+        futures = {executor.submit(_run_day, day, max_results, process_pdfs): day for day in days}
+        for future in as_completed(futures):
+            day = futures[future]
+            try:
+                progress.record(future.result())
+            except Exception as e:
+                logger.error(f"Backfill failed for {day}: {e}")
+                progress.record_failure(day)
+            progress.log(day)
+
+    summary = progress.summary()
+    logger.info(
+        f"Backfill completed in {timedelta(seconds=int(summary['elapsed_seconds']))}: "
+        f"{summary['papers_stored']} papers stored ({summary['papers_per_second']:.2f} papers/s), "
+        f"{len(summary['days_failed'])} failed days"
+    )
+    return summary
+
+
+def _parse_date(value: str) -> date:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date '{value}', expected YYYY-MM-DD")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m src.backfill", description="Backfill historical arXiv papers in parallel.")
+    parser.add_argument("--from", dest="from_date", type=_parse_date, required=True, help="First day (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="to_date", type=_parse_date, required=True, help="Last day, inclusive (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes (default: 4)")
+    parser.add_argument(
+        "--parse-concurrency",
+        type=int,
+        default=None,
+        help="PDFs parsed at once across all workers (default: half the workers, at least 1)",
+    )
+    parser.add_argument("--max-per-day", type=int, default=2000, help="Maximum papers per day window (arXiv caps at 2000)")
+    parser.add_argument("--no-pdfs", action="store_true", help="Store metadata only, skip PDF download and parsing")
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.parse_concurrency is None:
+        args.parse_concurrency = max(1, args.workers // 2)
+    if args.parse_concurrency < 1:
+        parser.error("--parse-concurrency must be at least 1")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    args = parse_args(argv)
+
+    summary = run_backfill(
+        from_date=args.from_date,
+        to_date=args.to_date,
+        workers=args.workers,
+        parse_concurrency=args.parse_concurrency,
+        max_results=args.max_per_day,
+        process_pdfs=not args.no_pdfs,
+    )
+
+    if summary["days_failed"]:
+        logger.error(f"Failed days: {', '.join(summary['days_failed'])}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
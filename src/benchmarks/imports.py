@@ -0,0 +1,111 @@
+"""
+Profile the import time of the API.
+
+Starts fresh interpreters that import src.main (what every uvicorn worker does before serving),
+reports the median import time and the slowest modules, and fails when the import exceeds the
+budget or loads a module that must stay lazy (docling and PyTorch belong to the PDF parser, which
+API workers build on first use). tests/unit/test_import_budget.py enforces the same in the test suite.
+
+Usage:
+    python -m src.benchmarks.imports
+    python -m src.benchmarks.imports --budget-ms 1500 --repeat 10 --lifespan
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# Top-level packages API workers must not import at startup
+FORBIDDEN_MODULES = ("docling", "torch", "transformers", "pypdfium2")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def _child(lifespan: bool) -> None:
+    """Import the API (and optionally run its startup) in this fresh process, and report as JSON."""
+    import time
+
+    start = time.perf_counter()
+    from src.main import app
+
+    result: Dict[str, object] = {"import_ms": (time.perf_counter() - start) * 1000}
+
+    if lifespan:
+        import asyncio
+
+        async def startup() -> float:
+            started = time.perf_counter()
+            async with app.router.lifespan_context(app):
+                return (time.perf_counter() - started) * 1000
+
+        result["lifespan_ms"] = asyncio.run(startup())
+
+    result["forbidden"] = sorted({name.split(".")[0] for name in sys.modules} & set(FORBIDDEN_MODULES))
+    print(json.dumps(result))
+
+
+def _run_child(lifespan: bool) -> Dict[str, object]:
+    command = [sys.executable, "-m", "src.benchmarks.imports", "--child"] + (["--lifespan"] if lifespan else [])
+    completed = subprocess.run(command, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _slowest_imports(top: int) -> List[Tuple[str, float]]:
+    """Modules with the highest cumulative import time (top-level imports only), from python -X importtime."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"], capture_output=True, text=True, check=True
+    )
+    modules = []
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        # Only modules imported directly by src.* or at the first nesting level, so packages are not counted twice
+        if match and len(match.group(3)) <= 3:
+            modules.append((match.group(4), int(match.group(2)) / 1000))
+    return sorted(modules, key=lambda module: module[1], reverse=True)[:top]
+
+
+def run(budget_ms: float, repeat: int, lifespan: bool, top: int) -> bool:
+    runs = [_run_child(lifespan) for _ in range(repeat)]
+    import_ms = statistics.median(run["import_ms"] for run in runs)
+    forbidden = sorted({name for run in runs for name in run["forbidden"]})
+
+    print(f"import src.main: median {import_ms:.0f}ms over {repeat} fresh processes (budget {budget_ms:.0f}ms)")
+    if lifespan:
+        print(f"lifespan startup: median {statistics.median(run['lifespan_ms'] for run in runs):.0f}ms")
+    print(f"\nSlowest imports (cumulative, one -X importtime run):")
+    for name, ms in _slowest_imports(top):
+        print(f"  {ms:>8.1f}ms  {name}")
+
+    ok = True
+    if import_ms > budget_ms:
+        print(f"\nFAIL: import took {import_ms:.0f}ms, over the {budget_ms:.0f}ms budget")
+        ok = False
+    if forbidden:
+        print(f"\nFAIL: importing the API loaded {', '.join(forbidden)}; import them where they are used")
+        ok = False
+    if ok:
+        print("\nOK: within budget, no heavy modules loaded")
+    return ok
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.benchmarks.imports", description="Profile and enforce API import time.")
+    parser.add_argument("--budget-ms", type=float, default=2000.0, help="Maximum median import time (default: 2000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh processes to time (default: 5)")
+    parser.add_argument("--lifespan", action="store_true", help="Also time the API startup (needs the database)")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list (default: 15)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args.lifespan)
+        return 0
+    return 0 if run(args.budget_ms, args.repeat, args.lifespan, args.top) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+Benchmark PostgreSQL full-text search over papers.
+
+Seeds a synthetic corpus (arXiv IDs prefixed "bench."), then times first and deep pages
+for queries of different selectivity.
+
+Usage:
+    python -m src.benchmarks.search --seed 100000
+    python -m src.benchmarks.search --repeat 20
+    python -m src.benchmarks.search --cleanup
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import select
+from src.db.factory import make_database
+from src.models.paper import Paper
+from src.repositories.paper import PaperRepository
+from src.repositories.paper_stats import PaperStatsRepository
+from src.schemas.arxiv.paper import PaperBase, PaperCreate
+
+logger = logging.getLogger(__name__)
+
+BENCH_PREFIX = "bench."
+VOCABULARY_SIZE = 20_000
+
+# Corpus-independent topic words, injected at known rates to get predictable selectivity
+TOPIC_WORDS = {"transformer": 0.2, "diffusion": 0.05, "retrieval": 0.01, "hypergraph": 0.001}
+
+
+def _vocabulary(rng: random.Random) -> List[str]:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choices(letters, k=rng.randint(3, 10))) for _ in range(VOCABULARY_SIZE)]
+
+
+def _words(rng: random.Random, vocabulary: List[str], count: int) -> str:
+    # Zipf-like: low indexes are far more frequent, like natural text
+    return " ".join(vocabulary[min(int(rng.paretovariate(1.2)) - 1, VOCABULARY_SIZE - 1)] for _ in range(count))
+
+
+def _synthetic_papers(count: int, body_words: int, seed: int = 42) -> Iterator[PaperCreate]:
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng)
+    start = datetime(2020, 1, 1)
+    for i in range(count):
+        topics = [word for word, rate in TOPIC_WORDS.items() if rng.random() < rate]
+        yield PaperCreate(
+            arxiv_id=f"{BENCH_PREFIX}{i:07d}",
+            title=" ".join([_words(rng, vocabulary, 8)] + topics),
+            authors=["Bench Author"],
+            abstract=" ".join([_words(rng, vocabulary, 150)] + topics),
+            categories=["cs.AI"],
+            published_date=start + timedelta(minutes=i),
+            pdf_url="https://arxiv.org/pdf/bench",
+            raw_text=_words(rng, vocabulary, body_words),
+            pdf_processed=True,
+        )
+
+
+def _bench_ids(session) -> List[str]:
+    return list(session.scalars(select(Paper.arxiv_id).where(Paper.arxiv_id.startswith(BENCH_PREFIX))))
+
+
+def seed(database, count: int, body_words: int) -> None:
+    with database.get_session() as session:
+        stats_repo = PaperStatsRepository(session)
+        ids = [f"{BENCH_PREFIX}{i:07d}" for i in range(count)]
+        before = stats_repo.snapshot(ids)
+        counts = PaperRepository(session).copy_upsert(
+            _synthetic_papers(count, body_words),
+            columns=[*PaperBase.model_fields, "raw_text", "pdf_processed"],
+            progress_callback=lambda rows: logger.info(f"Seeded {rows}/{count} papers"),
+        )
+        stats_repo.apply_changes(before, stats_repo.snapshot(ids))
+        session.commit()
+        session.connection().exec_driver_sql("ANALYZE papers")
+        session.commit()
+    logger.info(f"Seeded corpus: {counts['inserted']} inserted, {counts['updated']} updated")
+
+
+def cleanup(database) -> None:
+    with database.get_session() as session:
+        stats_repo = PaperStatsRepository(session)
+        ids = _bench_ids(session)
+        before = stats_repo.snapshot(ids)
+        session.execute(Paper.__table__.delete().where(Paper.arxiv_id.startswith(BENCH_PREFIX)))
+        stats_repo.apply_changes(before, {})
+        session.commit()
+    logger.info(f"Removed {len(ids)} benchmark papers")
+
+
+def _time_query(paper_repo: PaperRepository, query: str, pages: int, limit: int) -> Dict[str, float]:
+    """Time the first page and the last of `pages` consecutive pages of one query."""
+    after = None
+    timings = []
+    hits = 0
+    for _ in range(pages):
+        start = time.perf_counter()
+        rows = paper_repo.search(query, limit=limit, after=after)
+        timings.append(time.perf_counter() - start)
+        hits += len(rows)
+        if len(rows) < limit:
+            break
+        after = (rows[-1][1], rows[-1][0].id)
+    return {"first": timings[0], "last": timings[-1], "hits": hits}
+
+
+def run(database, repeat: int, pages: int, limit: int) -> Dict[str, Dict[str, float]]:
+    queries = {
+        "common (20%)": "transformer",
+        "medium (5%)": "diffusion",
+        "rare (1%)": "retrieval",
+        "very rare (0.1%)": "hypergraph",
+        "AND": "transformer diffusion",
+        "OR": "retrieval or hypergraph",
+        "exclusion": "diffusion -transformer",
+        "no match": "zzzzqqqq",
+    }
+    results = {}
+    with database.get_session() as session:
+        paper_repo = PaperRepository(session)
+        for name, query in queries.items():
+            runs = [_time_query(paper_repo, query, pages, limit) for _ in range(repeat)]
+            first = sorted(r["first"] for r in runs)
+            last = sorted(r["last"] for r in runs)
+            results[name] = {
+                "first_p50_ms": statistics.median(first) * 1000,
+                "first_p95_ms": first[int(0.95 * (len(first) - 1))] * 1000,
+                "last_page_p50_ms": statistics.median(last) * 1000,
+                "hits": runs[0]["hits"],
+            }
+
+    print(f"{'query':<18} {'first p50':>10} {'first p95':>10} {f'page {pages} p50':>12} {'hits':>6}")
+    for name, result in results.items():
+        print(
+            f"{name:<18} {result['first_p50_ms']:>8.1f}ms {result['first_p95_ms']:>8.1f}ms "
+            f"{result['last_page_p50_ms']:>10.1f}ms {result['hits']:>6}"
+        )
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(prog="python -m src.benchmarks.search", description="Benchmark full-text paper search.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed this many synthetic papers before benchmarking")
+    parser.add_argument("--body-words", type=int, default=3000, help="Words of raw text per seeded paper (default: 3000)")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per query (default: 10)")
+    parser.add_argument("--pages", type=int, default=5, help="Consecutive pages fetched per run (default: 5)")
+    parser.add_argument("--limit", type=int, default=10, help="Hits per page (default: 10)")
+    parser.add_argument("--cleanup", action="store_true", help="Remove the seeded papers and exit")
+    args = parser.parse_args(argv)
+
+    database = make_database()
+    try:
+        if args.cleanup:
+            cleanup(database)
+            return 0
+        if args.seed:
+            seed(database, args.seed, args.body_words)
+        run(database, args.repeat, args.pages, args.limit)
+    finally:
+        database.teardown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
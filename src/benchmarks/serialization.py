@@ -0,0 +1,140 @@
+"""
+Benchmark serialization of paper listing responses.
+
+Serves in-memory Paper rows through two minimal routes, one returning the response model
+(FastAPI dumps, re-validates and jsonable_encodes it) and one returning ModelResponse, and
+compares per-request CPU time. No database is needed.
+
+Usage:
+    python -m src.benchmarks.serialization
+    python -m src.benchmarks.serialization --papers 100 --body-words 20000 --repeat 50
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.models.paper import Paper
+from src.responses import ModelResponse
+from src.schemas.arxiv.paper import PaperResponse, PaperSearchResponse, PaperSummary, PaperSummaryListResponse
+
+
+def _synthetic_papers(count: int, body_words: int, sections: int, seed: int = 42) -> List[Paper]:
+    rng = random.Random(seed)
+    words = ["".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(2, 10))) for _ in range(5000)]
+
+    def text(count: int) -> str:
+        return " ".join(rng.choices(words, k=count))
+
+    now = datetime.now(timezone.utc)
+    section_words = max(body_words // max(sections, 1), 1)
+    return [
+        Paper(
+            id=uuid.uuid4(),
+            arxiv_id=f"2401.{i:05d}",
+            title=text(10),
+            authors=[text(2) for _ in range(5)],
+            abstract=text(200),
+            categories=["cs.AI", "cs.CL"],
+            published_date=now - timedelta(hours=i),
+            pdf_url=f"https://arxiv.org/pdf/2401.{i:05d}",
+            raw_text=text(body_words),
+            sections=[{"title": text(3), "content": text(section_words), "level": 1} for _ in range(sections)],
+            references=[{"text": text(20)} for _ in range(30)],
+            parser_used="docling",
+            parser_metadata={"pages": 12, "tables": 3},
+            pdf_processed=True,
+            pdf_processing_date=now,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def _make_app(papers: List[Paper]) -> FastAPI:
+    app = FastAPI()
+
+    # How list_papers serialized before: models validated one by one, then re-encoded by FastAPI
+    @app.get("/model/summary", response_model=PaperSummaryListResponse)
+    def model_summary() -> PaperSummaryListResponse:
+        return PaperSummaryListResponse(papers=[PaperSummary.model_validate(paper) for paper in papers], total=len(papers))
+
+    @app.get("/model/full", response_model=PaperSearchResponse)
+    def model_full() -> PaperSearchResponse:
+        return PaperSearchResponse(papers=[PaperResponse.model_validate(paper) for paper in papers], total=len(papers))
+
+    # Fast path used by the papers router
+    @app.get("/fast/summary", response_model=PaperSummaryListResponse)
+    def fast_summary() -> ModelResponse:
+        return ModelResponse(PaperSummaryListResponse.model_validate({"papers": papers, "total": len(papers)}, from_attributes=True))
+
+    @app.get("/fast/full", response_model=PaperSearchResponse)
+    def fast_full() -> ModelResponse:
+        return ModelResponse(PaperSearchResponse.model_validate({"papers": papers, "total": len(papers)}, from_attributes=True))
+
+    return app
+
+
+def _cpu_ms(request: Callable[[], object], repeat: int) -> List[float]:
+    request()  # Warm-up
+    timings = []
+    for _ in range(repeat):
+        start = time.process_time()
+        request()
+        timings.append((time.process_time() - start) * 1000)
+    return timings
+
+
+def run(papers: int, body_words: int, sections: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    rows = _synthetic_papers(papers, body_words, sections)
+    client = TestClient(_make_app(rows))
+
+    results: Dict[str, Dict[str, float]] = {}
+    for view in ("summary", "full"):
+        model_response = client.get(f"/model/{view}")
+        fast_response = client.get(f"/fast/{view}")
+        if model_response.json() != fast_response.json():
+            raise RuntimeError(f"The two serialization paths disagree for view={view}")
+
+        for path in ("model", "fast"):
+            timings = _cpu_ms(lambda: client.get(f"/{path}/{view}"), repeat)
+            results[f"{view}/{path}"] = {
+                "p50_ms": statistics.median(timings),
+                "p95_ms": sorted(timings)[int(0.95 * (len(timings) - 1))],
+                "bytes": len(fast_response.content),
+            }
+
+    print(f"{papers} papers per page, {body_words} words of raw text each, CPU time per request over {repeat} requests")
+    print(f"{'view/path':<14} {'p50':>9} {'p95':>9} {'response MB':>12}")
+    for name, result in results.items():
+        print(f"{name:<14} {result['p50_ms']:>7.1f}ms {result['p95_ms']:>7.1f}ms {result['bytes'] / 1e6:>12.2f}")
+    for view in ("summary", "full"):
+        speedup = results[f"{view}/model"]["p50_ms"] / results[f"{view}/fast"]["p50_ms"]
+        print(f"{view}: fast path {speedup:.1f}x less CPU")
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.benchmarks.serialization", description="Benchmark paper listing serialization."
+    )
+    parser.add_argument("--papers", type=int, default=100, help="Papers per page (default: 100)")
+    parser.add_argument("--body-words", type=int, default=8000, help="Words of raw text per paper (default: 8000)")
+    parser.add_argument("--sections", type=int, default=20, help="Sections per paper (default: 20)")
+    parser.add_argument("--repeat", type=int, default=30, help="Requests per path (default: 30)")
+    args = parser.parse_args(argv)
+
+    run(args.papers, args.body_words, args.sections, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
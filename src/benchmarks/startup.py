@@ -0,0 +1,93 @@
+"""
+Benchmark database startup of a cold process, with and without fast start.
+
+Each run starts a fresh interpreter, like an Airflow task process, and times importing the
+database factory, make_database() and the first query.
+
+Usage:
+    python -m src.benchmarks.startup
+    python -m src.benchmarks.startup --repeat 20
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+MODES = {"full": False, "fast": True}
+
+
+def _measure(fast_start: bool) -> Dict[str, float]:
+    """Time one cold startup in this (fresh) process."""
+    start = time.perf_counter()
+    from sqlalchemy import text
+    from src.db.factory import make_database
+
+    imported = time.perf_counter()
+    database = make_database(fast_start=fast_start)
+    started = time.perf_counter()
+    with database.get_session() as session:
+        session.execute(text("SELECT 1"))
+    queried = time.perf_counter()
+    database.teardown()
+    return {
+        "import_ms": (imported - start) * 1000,
+        "startup_ms": (started - imported) * 1000,
+        "first_query_ms": (queried - started) * 1000,
+        "total_ms": (queried - start) * 1000,
+    }
+
+
+def _run_child(mode: str) -> Dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-m", "src.benchmarks.startup", "--child", mode],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(repeat: int) -> Dict[str, Dict[str, float]]:
+    # Warm-up run so the first measured process does not pay for a cold OS page cache
+    _run_child("full")
+
+    runs: Dict[str, List[Dict[str, float]]] = {mode: [] for mode in MODES}
+    for _ in range(repeat):
+        # Interleaved so both modes see the same database load
+        for mode in MODES:
+            runs[mode].append(_run_child(mode))
+
+    results = {
+        mode: {key: statistics.median(run[key] for run in mode_runs) for key in mode_runs[0]} for mode, mode_runs in runs.items()
+    }
+
+    print(f"Cold process startup, median of {repeat} runs")
+    print(f"{'mode':<6} {'import':>9} {'startup':>9} {'1st query':>10} {'total':>9}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<6} {result['import_ms']:>7.1f}ms {result['startup_ms']:>7.1f}ms "
+            f"{result['first_query_ms']:>8.1f}ms {result['total_ms']:>7.1f}ms"
+        )
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.benchmarks.startup", description="Benchmark cold database startup.")
+    parser.add_argument("--repeat", type=int, default=10, help="Processes started per mode (default: 10)")
+    parser.add_argument("--child", choices=list(MODES), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_measure(MODES[args.child])))
+        return 0
+
+    run(args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,5 @@
 #
-from typing import List
+from typing import Dict, List, Literal, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -41,6 +41,110 @@ class PDFParserSettings(DefaultSettings):
     do_table_structure: bool = True
 
 
+class IngestionRetrySettings(DefaultSettings):
+    """Retry policy for papers that failed a pipeline stage."""
+
+    max_attempts: int = 5  # Move to the dead-letter table after this many failures
+    backoff_base_seconds: int = 600  # First retry delay, doubled on every further attempt
+    backoff_max_seconds: int = 86400  # Upper bound for the retry delay
+    batch_size: int = 50  # Failures retried per run
+
+
+class ContentStorageSettings(DefaultSettings):
+    """Storage format of parsed PDF content (raw_text, sections)."""
+
+    compression: Literal["none", "zstd"] = "none"  # Changing it requires python -m src.db.content_storage migrate
+    zstd_level: int = 3
+
+
+class PaperCacheSettings(DefaultSettings):
+    """Cache of serialized GET /papers/{arxiv_id} responses."""
+
+    enabled: bool = True
+    max_entries: int = 10_000  # In-process LRU entries per API worker
+    ttl_seconds: float = 30.0  # In-process lifetime; bounds staleness, ingestion can only invalidate the shared tier
+    redis_url: Optional[str] = None  # Optional shared tier (e.g. redis://redis:6379/0)
+    redis_ttl_seconds: int = 3600
+    tombstone_ttl_seconds: int = 60  # Invalidated papers are not cached again in the shared tier for this long
+    redis_timeout_seconds: float = 0.25  # A slow shared tier falls back to the database
+    key_prefix: str = "paper:v1:"  # Bump the version when the response schema changes
+
+
+class CompressionSettings(DefaultSettings):
+    """HTTP response compression."""
+
+    enabled: bool = True
+    minimum_size: int = 1024  # Smaller bodies are sent uncompressed
+    encodings: List[str] = Field(default=["zstd", "br", "gzip"])  # Preference order when a client accepts several
+    gzip_level: int = 6
+    brotli_quality: int = 4
+    zstd_level: int = 3
+    precompute_encodings: List[str] = Field(default=["zstd", "br", "gzip"])  # Paper content compressed at ingestion
+    # Levels of the precompressed content: paid once per paper, inside the ingestion store step (zstd 19
+    # or brotli 11 take 10-50x longer than these for a few percent smaller bodies)
+    precompute_gzip_level: int = 6
+    precompute_brotli_quality: int = 6
+    precompute_zstd_level: int = 9
+
+    @field_validator("encodings", "precompute_encodings", mode="before")
+    @classmethod
+    def parse_encodings(cls, v):
+        """Parse comma-separated string into list of content codings."""
+        if isinstance(v, str):
+            return [encoding.strip() for encoding in v.split(",") if encoding.strip()]
+        return v
+
+
+class HealthSettings(DefaultSettings):
+    """Background dependency health checks."""
+
+    interval_seconds: float = 15.0  # Between probe rounds; /health serves the last round
+    timeout_seconds: float = 2.0  # Per probe; a slower dependency is reported unhealthy
+
+
+class AdmissionSettings(DefaultSettings):
+    """API admission control: concurrency limits and load shedding (per worker process)."""
+
+    enabled: bool = True
+    # Requests processed at once by routes without their own limit; with route_limits, keep the sum
+    # below postgres_pool_size (background tasks need connections too)
+    max_concurrent: int = 10
+    max_queue: int = 32  # Requests waiting for a slot, per limit; more are rejected with 503
+    queue_timeout_seconds: float = 5.0  # Requests still waiting after this long are rejected with 503
+    retry_after_seconds: int = 2  # Retry-After of 503 responses
+    # Route templates with their own limit, so heavy endpoints cannot take every slot
+    route_limits: Dict[str, int] = Field(
+        default={
+            "/api/v1/papers/": 2,
+            "/api/v1/papers/search": 2,
+            "/api/v1/papers/export": 2,
+            "/api/v1/papers/batch": 2,
+        }
+    )
+    # Cheap lookups served before other waiting requests, and never displaced from the queue
+    priority_routes: List[str] = Field(default=["/api/v1/papers/{arxiv_id}", "/api/v1/papers/{arxiv_id}/content"])
+    # Never limited (answered from memory)
+    exempt_routes: List[str] = Field(default=["/api/v1/ping", "/api/v1/health", "/metrics"])
+
+    @field_validator("priority_routes", "exempt_routes", mode="before")
+    @classmethod
+    def parse_routes(cls, v):
+        """Parse comma-separated string into list of route templates."""
+        if isinstance(v, str):
+            return [route.strip() for route in v.split(",") if route.strip()]
+        return v
+
+
+class MetricsSettings(DefaultSettings):
+    """Prometheus metrics settings."""
+
+    enabled: bool = True  # Expose /metrics on the API
+    server_timing: bool = True  # Add Server-Timing (total and database time) to API responses
+    pushgateway_url: Optional[str] = None  # Pushgateway for Airflow tasks (e.g. http://pushgateway:9091)
+    push_job_name: str = "arxiv_ingestion"
+    push_timeout_seconds: float = 5.0
+
+
 class Settings(DefaultSettings):
     """Application settings."""
 
@@ -54,6 +158,14 @@ class Settings(DefaultSettings):
     postgres_echo_sql: bool = False
     postgres_pool_size: int = 20
     postgres_max_overflow: int = 0
+    postgres_pool_timeout: float = 30.0  # Seconds to wait for a pooled connection
+    postgres_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
+    postgres_pgbouncer: bool = False  # Transaction pooling mode: NullPool, no server-side prepared statements
+    postgres_fast_start: bool = False  # Skip connection test and schema setup on startup (run `python -m src.db.schema`)
+
+    # Paper listing: cached total count
+    paper_count_refresh_seconds: float = 60.0
+    paper_count_exact_threshold: int = 100_000  # Counts above this many rows (total or filtered) are planner estimates
 
     # OpenSearch configuration
     opensearch_host: str = "http://localhost:9200"
@@ -70,6 +182,27 @@ class Settings(DefaultSettings):
     # PDF parser settings
     pdf_parser: PDFParserSettings = Field(default_factory=PDFParserSettings)
 
+    # Failed paper retry settings
+    ingestion_retry: IngestionRetrySettings = Field(default_factory=IngestionRetrySettings)
+
+    # Parsed content storage settings
+    content_storage: ContentStorageSettings = Field(default_factory=ContentStorageSettings)
+
+    # Paper response cache settings
+    paper_cache: PaperCacheSettings = Field(default_factory=PaperCacheSettings)
+
+    # HTTP response compression settings
+    compression: CompressionSettings = Field(default_factory=CompressionSettings)
+
+    # Dependency health check settings
+    health: HealthSettings = Field(default_factory=HealthSettings)
+
+    # Admission control settings
+    admission: AdmissionSettings = Field(default_factory=AdmissionSettings)
+
+    # Metrics settings
+    metrics: MetricsSettings = Field(default_factory=MetricsSettings)
+
     @field_validator("ollama_models", mode="before")
     @classmethod
     def parse_ollama_models(cls, v):
@@ -0,0 +1,132 @@
+"""HTTP content codings (gzip, br, zstd): negotiation and codecs shared by the API and ingestion."""
+
+import gzip
+import logging
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+GZIP = "gzip"
+BROTLI = "br"
+ZSTD = "zstd"
+
+
+@lru_cache
+def available_encodings() -> Tuple[str, ...]:
+    """Codings whose codec is installed (gzip always; br needs brotli, zstd needs zstandard)."""
+    encodings = [GZIP]
+    for encoding, module in ((BROTLI, "brotli"), (ZSTD, "zstandard")):
+        try:
+            __import__(module)
+            encodings.append(encoding)
+        except ImportError:
+            logger.warning(f"{module} is not installed, '{encoding}' content coding disabled")
+    return tuple(encodings)
+
+
+def acceptable(accept_encoding: Optional[str], offered: Sequence[str]) -> List[str]:
+    """
+    Offered content codings the client accepts (q > 0), best first.
+
+    Higher q wins; ties keep the order of offered (the server preference).
+    """
+    if not accept_encoding:
+        return []
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding.strip().lower()] = q
+
+    wildcard = weights.get("*", 0.0)
+    ranked = [(weights.get(coding, wildcard), index, coding) for index, coding in enumerate(offered)]
+    return [coding for q, _, coding in sorted(ranked, key=lambda item: (-item[0], item[1])) if q > 0]
+
+
+def negotiate(accept_encoding: Optional[str], offered: Sequence[str]) -> Optional[str]:
+    """
+    Pick the content coding for a response.
+
+    Returns:
+        The best offered coding the client accepts, or None to send the body unencoded
+    """
+    codings = acceptable(accept_encoding, offered)
+    return codings[0] if codings else None
+
+
+def offered_encodings(preferred: Sequence[str]) -> Tuple[str, ...]:
+    """The configured codings, in preference order, that are available in this process."""
+    return tuple(encoding for encoding in preferred if encoding in available_encodings())
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    if encoding == GZIP:
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if encoding == BROTLI:
+        import brotli
+
+        return brotli.compress(data, quality=level)
+    if encoding == ZSTD:
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    raise ValueError(f"Unsupported content coding: {encoding}")
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    if encoding == GZIP:
+        return gzip.decompress(data)
+    if encoding == BROTLI:
+        import brotli
+
+        return brotli.decompress(data)
+    if encoding == ZSTD:
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    raise ValueError(f"Unsupported content coding: {encoding}")
+
+
+class StreamCompressor:
+    """Incremental compressor for streamed bodies; every compress() output is sent as is."""
+
+    def __init__(self, encoding: str, level: int):
+        self._compressor: Any
+        if encoding == GZIP:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31: gzip container
+        elif encoding == BROTLI:
+            import brotli
+
+            self._compressor = brotli.Compressor(quality=level)
+        elif encoding == ZSTD:
+            import zstandard
+
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            raise ValueError(f"Unsupported content coding: {encoding}")
+        self.encoding = encoding
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == BROTLI:
+            # Flush per chunk so streamed rows reach the client without waiting for the next ones
+            return self._compressor.process(chunk) + self._compressor.flush()
+        if self.encoding == ZSTD:
+            import zstandard
+
+            return self._compressor.compress(chunk) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == BROTLI:
+            return self._compressor.finish()
+        return self._compressor.flush()
@@ -0,0 +1,228 @@
+"""
+Migrate and benchmark the storage format of parsed paper content (raw_text, sections).
+
+Usage:
+    python -m src.db.content_storage migrate --to zstd
+    python -m src.db.content_storage migrate --to none
+    python -m src.db.content_storage benchmark --sample 500
+
+Stop ingestion while migrating: rows written during the copy would keep the old format.
+After migrating, set CONTENT_STORAGE__COMPRESSION to the new mode and restart the API and Airflow.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from src.config import get_settings
+from src.db.types import COMPRESSION_NONE, COMPRESSION_ZSTD, compress, decompress
+
+logger = logging.getLogger(__name__)
+
+# Column types of each storage mode
+_COLUMN_TYPES = {
+    COMPRESSION_NONE: {"raw_text": "text", "sections": "json"},
+    COMPRESSION_ZSTD: {"raw_text": "bytea", "sections": "bytea"},
+}
+
+
+def _decode(raw_text: Any, sections: Any) -> Tuple[Optional[str], Optional[str]]:
+    """Read stored content in either format as (text, JSON string)."""
+    if isinstance(raw_text, (bytes, memoryview)):
+        raw_text = decompress(bytes(raw_text)).decode("utf-8")
+    if isinstance(sections, (bytes, memoryview)):
+        sections = decompress(bytes(sections)).decode("utf-8")
+    elif sections is not None:
+        sections = json.dumps(sections)
+    return raw_text, sections
+
+
+def _encode(mode: str, raw_text: Optional[str], sections: Optional[str]) -> Tuple[Any, Any]:
+    if mode == COMPRESSION_NONE:
+        return raw_text, sections
+    return (
+        compress(raw_text.encode("utf-8")) if raw_text is not None else None,
+        compress(sections.encode("utf-8")) if sections is not None else None,
+    )
+
+
+def current_mode(conn: Connection) -> str:
+    """Detect the storage mode of the papers table from the raw_text column type."""
+    data_type = conn.execute(
+        text("SELECT data_type FROM information_schema.columns WHERE table_name = 'papers' AND column_name = 'raw_text'")
+    ).scalar()
+    return COMPRESSION_ZSTD if data_type == "bytea" else COMPRESSION_NONE
+
+
+def _table_size(conn: Connection, table: str) -> int:
+    return conn.execute(text("SELECT pg_total_relation_size(CAST(:table AS regclass))"), {"table": table}).scalar() or 0
+
+
+def migrate(engine: Engine, target: str, batch_size: int = 200) -> Dict[str, Any]:
+    """
+    Rewrite raw_text and sections of every paper in the target storage format.
+
+    Content is copied batch by batch into new columns, which then replace the old ones in one transaction.
+
+    Args:
+        engine: Database engine
+        target: Target mode ("none" or "zstd")
+        batch_size: Papers converted per transaction
+
+    Returns:
+        Summary with rows converted and table size before and after
+    """
+    with engine.connect() as conn:
+        source = current_mode(conn)
+        size_before = _table_size(conn, "papers")
+    if source == target:
+        logger.info(f"papers already uses '{target}' content storage, nothing to migrate")
+        return {"rows": 0, "size_before": size_before, "size_after": size_before}
+
+    types = _COLUMN_TYPES[target]
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                f"ALTER TABLE papers ADD COLUMN IF NOT EXISTS raw_text_migrated {types['raw_text']}, "
+                f"ADD COLUMN IF NOT EXISTS sections_migrated {types['sections']}"
+            )
+        )
+
+    rows = 0
+    last_id = None
+    start = time.perf_counter()
+    while True:
+        with engine.begin() as conn:
+            batch = conn.execute(
+                text(
+                    "SELECT id, raw_text, sections FROM papers "
+                    + ("WHERE id > :last_id " if last_id is not None else "")
+                    + "ORDER BY id LIMIT :limit"
+                ),
+                {"last_id": last_id, "limit": batch_size},
+            ).fetchall()
+            if not batch:
+                break
+
+            updates = []
+            for paper_id, raw_text, sections in batch:
+                raw_text, sections = _encode(target, *_decode(raw_text, sections))
+                updates.append({"id": paper_id, "raw_text": raw_text, "sections": sections})
+            conn.execute(
+                text(
+                    "UPDATE papers SET raw_text_migrated = :raw_text, "
+                    f"sections_migrated = CAST(:sections AS {types['sections']}) WHERE id = :id"
+                ),
+                updates,
+            )
+
+        rows += len(batch)
+        last_id = batch[-1][0]
+        logger.info(f"Converted {rows} papers ({rows / (time.perf_counter() - start):.0f} papers/s)")
+
+    with engine.begin() as conn:
+        # search_vector is generated from raw_text; services re-add it for the new mode on startup
+        conn.execute(text("ALTER TABLE papers DROP COLUMN IF EXISTS search_vector, DROP COLUMN raw_text, DROP COLUMN sections"))
+        conn.execute(text("ALTER TABLE papers RENAME COLUMN raw_text_migrated TO raw_text"))
+        conn.execute(text("ALTER TABLE papers RENAME COLUMN sections_migrated TO sections"))
+
+    # Reclaim the space of the old columns so the size comparison is meaningful
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM FULL papers"))
+        size_after = _table_size(conn, "papers")
+
+    logger.info(
+        f"Migrated {rows} papers from '{source}' to '{target}' in {time.perf_counter() - start:.1f}s, "
+        f"table size {size_before / 1e6:.1f} MB -> {size_after / 1e6:.1f} MB. "
+        f"Set CONTENT_STORAGE__COMPRESSION={target} before restarting services."
+    )
+    return {"rows": rows, "size_before": size_before, "size_after": size_after}
+
+
+def _benchmark_mode(conn: Connection, mode: str, sample: List[Tuple[Optional[str], Optional[str]]]) -> Dict[str, float]:
+    types = _COLUMN_TYPES[mode]
+    table = f"content_benchmark_{mode}"
+    conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+    conn.execute(text(f"CREATE TEMP TABLE {table} (raw_text {types['raw_text']}, sections {types['sections']})"))
+
+    start = time.perf_counter()
+    rows = []
+    for raw_text, sections in sample:
+        raw_text, sections = _encode(mode, raw_text, sections)
+        rows.append({"raw_text": raw_text, "sections": sections})
+    conn.execute(text(f"INSERT INTO {table} VALUES (:raw_text, CAST(:sections AS {types['sections']}))"), rows)
+    write_seconds = time.perf_counter() - start
+
+    conn.execute(text(f"ANALYZE {table}"))
+    size = _table_size(conn, table)
+
+    start = time.perf_counter()
+    for raw_text, sections in conn.execute(text(f"SELECT raw_text, sections FROM {table}")):
+        _decode(raw_text, sections)
+    read_seconds = time.perf_counter() - start
+
+    return {"write_seconds": write_seconds, "read_seconds": read_seconds, "size_bytes": size}
+
+
+def benchmark(engine: Engine, sample_size: int = 500) -> Dict[str, Dict[str, float]]:
+    """
+    Compare write/read throughput and on-disk size of both storage modes on a sample of stored papers.
+
+    Postgres already TOAST-compresses large values, so the size comparison is against that, not raw text.
+    """
+    with engine.connect() as conn:
+        sample = [
+            _decode(raw_text, sections)
+            for raw_text, sections in conn.execute(
+                text("SELECT raw_text, sections FROM papers WHERE raw_text IS NOT NULL ORDER BY id LIMIT :limit"),
+                {"limit": sample_size},
+            )
+        ]
+        if not sample:
+            raise RuntimeError("No papers with raw_text to benchmark, ingest some papers first")
+
+        content_bytes = sum(len((raw_text or "").encode("utf-8")) + len(sections or "") for raw_text, sections in sample)
+        results = {mode: _benchmark_mode(conn, mode, sample) for mode in (COMPRESSION_NONE, COMPRESSION_ZSTD)}
+
+    print(f"Sample: {len(sample)} papers, {content_bytes / 1e6:.1f} MB of uncompressed content")
+    print(f"{'mode':<6} {'write MB/s':>11} {'read MB/s':>10} {'on disk MB':>11} {'ratio':>6}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<6} {content_bytes / 1e6 / result['write_seconds']:>11.1f} "
+            f"{content_bytes / 1e6 / result['read_seconds']:>10.1f} "
+            f"{result['size_bytes'] / 1e6:>11.2f} {content_bytes / max(result['size_bytes'], 1):>6.2f}"
+        )
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(prog="python -m src.db.content_storage", description=__doc__.split("\n\n")[0].strip())
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser("migrate", help="Convert stored content to another storage mode")
+    migrate_parser.add_argument("--to", dest="target", choices=[COMPRESSION_NONE, COMPRESSION_ZSTD], required=True)
+    migrate_parser.add_argument("--batch-size", type=int, default=200, help="Papers per transaction (default: 200)")
+
+    benchmark_parser = commands.add_parser("benchmark", help="Compare plain and zstd storage on a sample of papers")
+    benchmark_parser.add_argument("--sample", type=int, default=500, help="Papers to sample (default: 500)")
+
+    args = parser.parse_args(argv)
+    engine = create_engine(get_settings().postgres_database_url)
+    try:
+        if args.command == "migrate":
+            migrate(engine, args.target, batch_size=args.batch_size)
+        else:
+            benchmark(engine, sample_size=args.sample)
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import json
+from typing import Any, Dict, Iterator, List, Union
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class Explain(Executable, ClauseElement):
+    """
+    EXPLAIN (FORMAT JSON) of a statement, with the statement's bound parameters.
+
+    Execute it like any statement; the single result value is the plan (see plan_root()).
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def plan_root(result: Union[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Top plan node of an Explain result (asyncpg returns the JSON as text, psycopg2 parsed)."""
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]["Plan"]
+
+
+def plan_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """A plan node and all nodes below it."""
+    yield node
+    for child in node.get("Plans", ()):
+        yield from plan_nodes(child)
@@ -1,12 +1,19 @@
+from typing import Optional
+
 from src.config import get_settings
 from src.db.interfaces.base import BaseDatabase
 from src.db.interfaces.postgresql import PostgreSQLDatabase, PostgreSQLSettings
 
 
-def make_database() -> BaseDatabase:
+def make_database(enable_async: bool = False, fast_start: Optional[bool] = None) -> BaseDatabase:
     """
     Factory function to create a database instance.
 
+    Args:
+        enable_async: Also create the asyncpg engine used by async API endpoints
+        fast_start: Skip the connection test and schema setup and connect on first use
+            (uses settings.postgres_fast_start if None)
+
     Returns:
         BaseDatabase: An instance of the database.
     """
@@ -19,6 +26,11 @@ def make_database() -> BaseDatabase:
         echo_sql=settings.postgres_echo_sql,
         pool_size=settings.postgres_pool_size,
         max_overflow=settings.postgres_max_overflow,
+        pool_timeout=settings.postgres_pool_timeout,
+        pool_recycle=settings.postgres_pool_recycle,
+        pgbouncer=settings.postgres_pgbouncer,
+        enable_async=enable_async,
+        fast_start=settings.postgres_fast_start if fast_start is None else fast_start,
     )
 
     database = PostgreSQLDatabase(config=config)
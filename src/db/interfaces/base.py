@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any, ContextManager, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncContextManager, ContextManager, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 
 class BaseDatabase(ABC):
     """Base class for database operations."""
@@ -19,6 +22,14 @@ class BaseDatabase(ABC):
     def get_session(self) -> ContextManager[Session]:
         """Get a database session."""
 
+    @abstractmethod
+    async def teardown_async(self) -> None:
+        """Close the async database connections."""
+
+    @abstractmethod
+    def get_async_session(self) -> AsyncContextManager["AsyncSession"]:
+        """Get an async database session."""
+
 
 class BaseRepository(ABC):
     """Base repository pattern for data access."""
@@ -1,14 +1,28 @@
 import logging
-from contextlib import contextmanager
-from typing import Generator, Optional
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Generator, Optional, Type
+from uuid import uuid4
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
-from sqlalchemy import create_engine, inspect, text
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import Pool
 from src.db.interfaces.base import BaseDatabase
+from src.db.pool import (
+    ENGINE_ASYNC,
+    ENGINE_SYNC,
+    InstrumentedAsyncQueuePool,
+    InstrumentedNullPool,
+    InstrumentedQueuePool,
+    instrument_engine,
+)
+from src.db.timing import instrument_query_timing
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +36,15 @@ class PostgreSQLSettings(BaseSettings):
     echo_sql: bool = Field(default=False, description="Enable SQL query logging")
     pool_size: int = Field(default=20, description="Database connection pool size")
     max_overflow: int = Field(default=0, description="Maximum pool overflow")
+    pool_timeout: float = Field(default=30.0, description="Seconds to wait for a free pooled connection before failing")
+    pool_recycle: int = Field(default=1800, description="Replace pooled connections older than this many seconds (-1 disables)")
+    pgbouncer: bool = Field(
+        default=False, description="Run behind PgBouncer transaction pooling: no client-side pool, no server-side prepared statements"
+    )
+    enable_async: bool = Field(default=False, description="Also create an asyncpg engine for async sessions")
+    fast_start: bool = Field(
+        default=False, description="Skip the connection test and schema setup on startup and connect on first use"
+    )
 
     class Config:
         env_prefix = "POSTGRES_"
@@ -37,6 +60,8 @@ class PostgreSQLDatabase(BaseDatabase):
         self.config = config
         self.engine: Optional[Engine] = None
         self.session_factory: Optional[sessionmaker] = None
+        self.async_engine: Optional["AsyncEngine"] = None
+        self.async_session_factory: Optional[sessionmaker] = None
 
     def startup(self) -> None:
         """Initialize the database connection."""
@@ -49,51 +74,89 @@ class PostgreSQLDatabase(BaseDatabase):
             self.engine = create_engine(
                 self.config.database_url,
                 echo=self.config.echo_sql,
-                pool_size=self.config.pool_size,
-                max_overflow=self.config.max_overflow,
-                pool_pre_ping=True,  # Verify connections before use
+                **self._pool_options(InstrumentedQueuePool),
             )
+            instrument_engine(self.engine, ENGINE_SYNC)
+            instrument_query_timing(self.engine)
 
             self.session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
 
+            if self.config.enable_async:
+                # Imported here: sqlalchemy.ext.asyncio adds ~0.1s to every sync-only process start
+                from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+                # Same database through asyncpg, so async endpoints do not hold a threadpool thread per query
+                async_url = make_url(self.config.database_url).set(drivername="postgresql+asyncpg")
+                connect_args = {}
+                if self.config.pgbouncer:
+                    # PgBouncer may run each transaction on a different server connection, where a
+                    # prepared statement of another client (or none) exists: disable both statement caches
+                    # and give the statements asyncpg still prepares per query unique names
+                    async_url = async_url.update_query_dict({"prepared_statement_cache_size": "0"})
+                    connect_args = {
+                        "statement_cache_size": 0,
+                        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+                    }
+                self.async_engine = create_async_engine(
+                    async_url,
+                    echo=self.config.echo_sql,
+                    connect_args=connect_args,
+                    **self._pool_options(InstrumentedAsyncQueuePool),
+                )
+                instrument_engine(self.async_engine.sync_engine, ENGINE_ASYNC)
+                instrument_query_timing(self.async_engine.sync_engine)
+                self.async_session_factory = sessionmaker(bind=self.async_engine, class_=AsyncSession, expire_on_commit=False)
+
+            if self.config.fast_start:
+                # Engines connect lazily; the schema is managed by `python -m src.db.schema`
+                logger.info("PostgreSQL engine created (fast start, connecting on first use)")
+                return
+
             # Test the connection
             assert self.engine is not None
             with self.engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
                 logger.info("Database connection test successful")
 
-            # Check which tables exist before creating
-            inspector = inspect(self.engine)
-            existing_tables = inspector.get_table_names()
-
-            # Create tables if they don't exist (idempotent operation)
-            Base.metadata.create_all(bind=self.engine)
-
-            # Check if any new tables were created
-            updated_tables = inspector.get_table_names()
-            new_tables = set(updated_tables) - set(existing_tables)
+            from src.db.schema import initialize_schema
 
-            if new_tables:
-                logger.info(f"Created new tables: {', '.join(new_tables)}")
-            else:
-                logger.info("All tables already exist - no new tables created")
+            initialize_schema(self.engine)
 
             logger.info("PostgreSQL database initialized successfully")
-            assert self.engine is not None
             logger.info(f"Database: {self.engine.url.database}")
-            logger.info(f"Total tables: {', '.join(updated_tables) if updated_tables else 'None'}")
             logger.info("Database connection established")
 
         except Exception as e:
             logger.error(f"Failed to initialize PostgreSQL database: {e}")
             raise
 
+    def _pool_options(self, queue_pool_class: Type[Pool]) -> Dict[str, Any]:
+        """Engine pool arguments for the configured pooling mode."""
+        if self.config.pgbouncer:
+            # PgBouncer does the pooling; every checkout is a fresh, already-pooled connection
+            # to it, so pre-pinging would only add a round trip per session
+            return {"poolclass": InstrumentedNullPool, "pool_pre_ping": False}
+        return {
+            "poolclass": queue_pool_class,
+            "pool_size": self.config.pool_size,
+            "max_overflow": self.config.max_overflow,
+            "pool_timeout": self.config.pool_timeout,
+            "pool_recycle": self.config.pool_recycle,
+            "pool_pre_ping": True,  # Verify connections before use
+        }
+
     def teardown(self) -> None:
         """Close the database connection."""
         if self.engine:
             self.engine.dispose()
             logger.info("PostgreSQL database connections closed")
 
+    async def teardown_async(self) -> None:
+        """Close the async engine connections (must run on the event loop that used them)."""
+        if self.async_engine:
+            await self.async_engine.dispose()
+            logger.info("PostgreSQL async database connections closed")
+
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
         """Get a database session."""
@@ -108,3 +171,16 @@ class PostgreSQLDatabase(BaseDatabase):
             raise
         finally:
             session.close()
+
+    @asynccontextmanager
+    async def get_async_session(self) -> AsyncGenerator["AsyncSession", None]:
+        """Get an async database session."""
+        if not self.async_session_factory:
+            raise RuntimeError("Async database not initialized. Start it with enable_async=True.")
+
+        async with self.async_session_factory() as session:
+            try:
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
@@ -0,0 +1,82 @@
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+from src.metrics import (
+    DB_POOL_CAPACITY,
+    DB_POOL_CHECKOUT_SECONDS,
+    DB_POOL_CONNECTIONS_OPENED_TOTAL,
+    DB_POOL_IN_USE,
+    DB_POOL_TIMEOUTS_TOTAL,
+)
+
+# Values of the "engine" label on the pool metrics
+ENGINE_SYNC = "sync"
+ENGINE_ASYNC = "async"
+
+
+class _InstrumentedPoolMixin:
+    """
+    Times every checkout and counts pool timeouts.
+
+    SQLAlchemy has no pool event that fires before a checkout starts waiting, so the wait is
+    measured around Pool._do_get. The label is copied when the pool is recreated (on dispose
+    or after a disconnect invalidates it).
+    """
+
+    metrics_label = ENGINE_SYNC
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        except exc.TimeoutError:
+            DB_POOL_TIMEOUTS_TOTAL.labels(engine=self.metrics_label).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.labels(engine=self.metrics_label).observe(time.perf_counter() - start)
+
+    def recreate(self) -> Pool:
+        pool = super().recreate()  # type: ignore[misc]
+        pool.metrics_label = self.metrics_label
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class InstrumentedNullPool(_InstrumentedPoolMixin, NullPool):
+    """NullPool opens a connection per checkout, so its checkout time is the connect time."""
+
+
+def instrument_engine(engine: Engine, label: str) -> None:
+    """
+    Report pool usage of an engine under the given "engine" label.
+
+    The engine must have been created with one of the Instrumented*Pool classes.
+    Pass AsyncEngine.sync_engine for async engines.
+    """
+    pool = engine.pool
+    pool.metrics_label = label  # type: ignore[attr-defined]
+    bounded = isinstance(pool, QueuePool) and pool._max_overflow >= 0
+    DB_POOL_CAPACITY.labels(engine=label).set(pool.size() + pool._max_overflow if bounded else 0)
+
+    # Listeners registered on the engine carry over to recreated pools
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        DB_POOL_CONNECTIONS_OPENED_TOTAL.labels(engine=label).inc()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        DB_POOL_IN_USE.labels(engine=label).inc()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+        DB_POOL_IN_USE.labels(engine=label).dec()
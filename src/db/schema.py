@@ -0,0 +1,124 @@
+"""
+Create and upgrade the database schema.
+
+Usage:
+    python -m src.db.schema
+
+Run once per deployment (and after upgrades) when services start with POSTGRES_FAST_START=true,
+which skips schema setup on startup.
+"""
+
+import logging
+import sys
+
+from sqlalchemy import Column, Table, create_engine, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateColumn
+from src.config import get_settings
+from src.db.interfaces.postgresql import Base
+
+logger = logging.getLogger(__name__)
+
+
+# Columns whose type changed after the table was first created: (table, column, new type)
+COLUMN_TYPE_UPGRADES = [
+    ("papers", "authors", "jsonb"),
+    ("papers", "categories", "jsonb"),
+]
+
+
+def initialize_schema(engine: Engine) -> None:
+    """Create missing tables and upgrade existing ones (idempotent)."""
+    existing_tables = set(inspect(engine).get_table_names())
+
+    # Create tables if they don't exist (idempotent operation)
+    Base.metadata.create_all(bind=engine)
+
+    # Add indexes introduced after the tables were first created
+    upgrade_schema(engine)
+
+    tables = inspect(engine).get_table_names()
+    new_tables = set(tables) - existing_tables
+    if new_tables:
+        logger.info(f"Created new tables: {', '.join(sorted(new_tables))}")
+    else:
+        logger.info("All tables already exist - no new tables created")
+    logger.info(f"Total tables: {', '.join(tables) if tables else 'None'}")
+
+
+def upgrade_schema(engine: Engine) -> None:
+    """
+    Bring existing tables up to date with the models (idempotent).
+
+    create_all only creates missing tables, so column type changes and indexes added
+    to a model later are never applied to a database that already has the table.
+    """
+    with engine.begin() as conn:
+        for table, column, new_type in COLUMN_TYPE_UPGRADES:
+            current_type = conn.execute(
+                text("SELECT udt_name FROM information_schema.columns WHERE table_name = :table AND column_name = :column"),
+                {"table": table, "column": column},
+            ).scalar()
+            if current_type is not None and current_type != new_type:
+                logger.info(f"Converting {table}.{column} from {current_type} to {new_type}")
+                conn.execute(text(f'ALTER TABLE {table} ALTER COLUMN "{column}" TYPE {new_type} USING "{column}"::{new_type}'))
+
+        for table in Base.metadata.sorted_tables:
+            _add_missing_columns(conn, table)
+
+        for table in Base.metadata.sorted_tables:
+            existing_indexes = {index["name"] for index in inspect(conn).get_indexes(table.name)}
+            analyze = False
+            for index in table.indexes:
+                if index.name in existing_indexes:
+                    continue
+                logger.info(f"Creating index {index.name}")
+                index.create(bind=conn)
+                # Statistics of an expression index only exist after ANALYZE; until then lookups on it are planned as scans
+                analyze = analyze or any(not isinstance(expression, Column) for expression in index.expressions)
+            if analyze:
+                conn.execute(text(f"ANALYZE {table.name}"))
+
+    _initialize_paper_stats(engine)
+    logger.info("Database schema is up to date")
+
+
+def _add_missing_columns(conn: Connection, table: Table) -> None:
+    """Add model columns that the existing table lacks (e.g. new generated columns)."""
+    existing = {column["name"] for column in inspect(conn).get_columns(table.name)}
+    if not existing:
+        return
+    for column in table.columns:
+        if column.name not in existing:
+            logger.info(f"Adding column {table.name}.{column.name}")
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {CreateColumn(column).compile(dialect=conn.dialect)}"))
+
+
+def _initialize_paper_stats(engine: Engine) -> None:
+    """Build the paper counters once, so incremental updates start from the existing corpus."""
+    from src.repositories.paper_stats import PaperStatsRepository
+
+    with Session(engine) as session:
+        if session.execute(text("SELECT 1 FROM paper_stats LIMIT 1")).first() is not None:
+            return
+        rows = PaperStatsRepository(session).rebuild()
+        session.commit()
+        logger.info(f"Initialized paper_stats with {rows} counter rows")
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    # Register every model table on Base.metadata
+    import src.models  # noqa: F401
+
+    engine = create_engine(get_settings().postgres_database_url)
+    try:
+        initialize_schema(engine)
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Generator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryTimer:
+    """Statement execution time accumulated while a track_queries() block runs."""
+
+    __slots__ = ("seconds", "queries")
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self.queries = 0
+
+
+# Timer of the current request; a mutable object, so copied contexts (threads, greenlets) add to the same one
+_current_timer: ContextVar[Optional[QueryTimer]] = ContextVar("query_timer", default=None)
+
+
+@contextmanager
+def track_queries() -> Generator[QueryTimer, None, None]:
+    """Accumulate the execution time of every statement run by this task (and threads it starts) in the block."""
+    timer = QueryTimer()
+    token = _current_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _current_timer.reset(token)
+
+
+def instrument_query_timing(engine: Engine) -> None:
+    """
+    Add the execution time of each statement on engine to the active track_queries() timer.
+
+    Measures cursor execution only: rows fetched later from a server-side cursor are not included.
+    Pass AsyncEngine.sync_engine for async engines.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        if context is not None and _current_timer.get() is not None:
+            context._query_timing_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        timer = _current_timer.get()
+        start = getattr(context, "_query_timing_start", None)
+        if timer is not None and start is not None:
+            timer.seconds += time.perf_counter() - start
+            timer.queries += 1
@@ -0,0 +1,95 @@
+import json
+import threading
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import JSON, LargeBinary, Text
+from sqlalchemy.types import TypeDecorator
+from src.config import get_settings
+
+COMPRESSION_NONE = "none"
+COMPRESSION_ZSTD = "zstd"
+
+
+_local = threading.local()
+
+
+def _zstd_codec() -> Tuple[Any, Any]:
+    """
+    Get this thread's zstd compressor/decompressor pair.
+
+    zstandard contexts are not thread-safe, so each thread gets its own. zstandard is only
+    imported once compression is actually used.
+    """
+    codec = getattr(_local, "codec", None)
+    if codec is None:
+        import zstandard
+
+        level = get_settings().content_storage.zstd_level
+        codec = _local.codec = (zstandard.ZstdCompressor(level=level), zstandard.ZstdDecompressor())
+    return codec
+
+
+@lru_cache
+def compression_enabled() -> bool:
+    """Whether parsed content is stored compressed (read once per process)."""
+    return get_settings().content_storage.compression == COMPRESSION_ZSTD
+
+
+def compress(data: bytes) -> bytes:
+    compressor, _ = _zstd_codec()
+    return compressor.compress(data)
+
+
+def decompress(data: bytes) -> bytes:
+    _, decompressor = _zstd_codec()
+    return decompressor.decompress(data)
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text column stored as zstd-compressed bytea when content compression is enabled.
+
+    The database type follows settings.content_storage.compression, so switching modes
+    on an existing database requires `python -m src.db.content_storage migrate`.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if compression_enabled():
+            return dialect.type_descriptor(LargeBinary())
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Any:
+        if value is None or not compression_enabled():
+            return value
+        return compress(value.encode("utf-8"))
+
+    def process_result_value(self, value: Any, dialect) -> Optional[str]:
+        if isinstance(value, (bytes, memoryview)):
+            return decompress(bytes(value)).decode("utf-8")
+        return value
+
+
+class CompressedJSON(TypeDecorator):
+    """JSON column stored as zstd-compressed bytea when content compression is enabled."""
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if compression_enabled():
+            return dialect.type_descriptor(LargeBinary())
+        return dialect.type_descriptor(JSON())
+
+    def process_bind_param(self, value: Any, dialect) -> Any:
+        if value is None or not compression_enabled():
+            return value
+        return compress(json.dumps(value).encode("utf-8"))
+
+    def process_result_value(self, value: Any, dialect) -> Any:
+        if isinstance(value, (bytes, memoryview)):
+            return json.loads(decompress(bytes(value)))
+        return value
@@ -1,10 +1,16 @@
 from functools import lru_cache
-from typing import Annotated, Generator
+from typing import Annotated, AsyncGenerator, Generator
 
 from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from src.config import Settings
 from src.db.interfaces.base import BaseDatabase
+from src.services.arxiv.client import ArxivClient
+from src.services.cache.client import PaperResponseCache
+from src.services.health import HealthMonitor
+from src.services.paper_count import PaperCountCache
+from src.services.pdf_parser.parser import PDFParserService
 
 
 @lru_cache
@@ -23,12 +29,49 @@ def get_database(request: Request) -> BaseDatabase:
     return request.app.state.database
 
 
+def get_paper_count(request: Request) -> PaperCountCache:
+    """Get the cached paper count from the request state."""
+    return request.app.state.paper_count
+
+
+def get_paper_cache(request: Request) -> PaperResponseCache:
+    """Get the paper response cache from the request state."""
+    return request.app.state.paper_cache
+
+
+def get_health_monitor(request: Request) -> HealthMonitor:
+    """Get the dependency health monitor from the request state."""
+    return request.app.state.health_monitor
+
+
+def get_arxiv_client(request: Request) -> ArxivClient:
+    """Get the arXiv client, built on first use."""
+    return request.app.state.arxiv_client.get()
+
+
+def get_pdf_parser(request: Request) -> PDFParserService:
+    """Get the PDF parser, built on first use (sync, so the first build runs in the threadpool)."""
+    return request.app.state.pdf_parser.get()
+
+
 def get_db_session(database: Annotated[BaseDatabase, Depends(get_database)]) -> Generator[Session, None, None]:
     """Get database session dependency."""
     with database.get_session() as session:
         yield session
 
 
+async def get_async_db_session(database: Annotated[BaseDatabase, Depends(get_database)]) -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session dependency."""
+    async with database.get_async_session() as session:
+        yield session
+
+
 SettingsDep = Annotated[Settings, Depends(get_settings)]
 DatabaseDep = Annotated[BaseDatabase, Depends(get_database)]
 SessionDep = Annotated[Session, Depends(get_db_session)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db_session)]
+PaperCountDep = Annotated[PaperCountCache, Depends(get_paper_count)]
+PaperCacheDep = Annotated[PaperResponseCache, Depends(get_paper_cache)]
+HealthMonitorDep = Annotated[HealthMonitor, Depends(get_health_monitor)]
+ArxivClientDep = Annotated[ArxivClient, Depends(get_arxiv_client)]
+PDFParserDep = Annotated[PDFParserService, Depends(get_pdf_parser)]
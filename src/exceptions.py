@@ -12,6 +12,10 @@ class PaperNotSaved(RepositoryException):
     """Exception raised when paper data is not saved."""
 
 
+class InvalidCursorError(RepositoryException):
+    """Exception raised when a pagination cursor cannot be decoded."""
+
+
 class ParsingException(Exception):
     """Base exception for parsing-related errors."""
 
@@ -68,6 +72,14 @@ class PipelineException(MetadataFetchingException):
     """Exception raised during pipeline execution."""
 
 
+class PipelineStageError(MetadataFetchingException):
+    """Exception raised when a single paper fails in one pipeline stage."""
+
+    def __init__(self, message: str, stage: str):
+        super().__init__(message)
+        self.stage = stage
+
+
 class LLMException(Exception):
     """Base exception for LLM-related errors."""
 
@@ -4,11 +4,18 @@ from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
+from src.admission import AdmissionControl
 from src.config import get_settings
+from src.content_coding import BROTLI, GZIP, ZSTD, offered_encodings
 from src.db.factory import make_database
-from src.routers import papers, ping
+from src.middlewares import CompressionMiddleware, RequestMetricsMiddleware
+from src.routers import metrics, papers, ping
 from src.services.arxiv.factory import make_arxiv_client
+from src.services.cache.factory import make_paper_cache
+from src.services.health import HealthMonitor
+from src.services.paper_count import PaperCountCache
 from src.services.pdf_parser.factory import make_pdf_parser_service
+from src.services.provider import LazyProvider
 
 # Setup logging
 logging.basicConfig(
@@ -28,19 +35,45 @@ async def lifespan(app: FastAPI):
     settings = get_settings()
     app.state.settings = settings
 
-    database = make_database()
+    database = make_database(enable_async=True)
     app.state.database = database
     logger.info("Database connected")
 
-    # Initialize services (kept for future endpoints and notebook demos)
-    app.state.arxiv_client = make_arxiv_client()
-    app.state.pdf_parser = make_pdf_parser_service()
-    logger.info("Services initialized: arXiv API client, PDF parser")
+    # Total paper count for listings, kept fresh in the background instead of COUNT(*) per request
+    paper_count = PaperCountCache(
+        database,
+        refresh_seconds=settings.paper_count_refresh_seconds,
+        exact_threshold=settings.paper_count_exact_threshold,
+    )
+    paper_count.start()
+    app.state.paper_count = paper_count
+
+    # Serialized paper detail responses, so hot papers are served without a database round trip
+    app.state.paper_cache = make_paper_cache()
+
+    # Dependency health probed in the background; /health serves the last results
+    health_monitor = HealthMonitor(
+        database,
+        settings,
+        interval_seconds=settings.health.interval_seconds,
+        timeout_seconds=settings.health.timeout_seconds,
+    )
+    health_monitor.start()
+    app.state.health_monitor = health_monitor
+
+    # Services built on first use (kept for future endpoints and notebook demos): no route needs them
+    # yet, and building the PDF parser imports docling and PyTorch
+    app.state.arxiv_client = LazyProvider(make_arxiv_client, "arXiv API client")
+    app.state.pdf_parser = LazyProvider(make_pdf_parser_service, "PDF parser")
 
     logger.info("API ready")
     yield
 
     # Cleanup
+    await paper_count.stop()
+    await health_monitor.stop()
+    await app.state.paper_cache.close()
+    await database.teardown_async()
     database.teardown()
     logger.info("API shutdown complete")
 
@@ -52,9 +85,41 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# Include routers
-app.include_router(ping.router, prefix="/api/v1")
-app.include_router(papers.router, prefix="/api/v1")
+# Negotiated response compression (bodies stored precompressed pass through as they are)
+compression = get_settings().compression
+if compression.enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=offered_encodings(compression.encodings),
+        levels={GZIP: compression.gzip_level, BROTLI: compression.brotli_quality, ZSTD: compression.zstd_level},
+        minimum_size=compression.minimum_size,
+    )
+
+# Per-route latency, size and database time; added last so it wraps (and measures) the other middlewares
+metrics_settings = get_settings().metrics
+if metrics_settings.enabled:
+    app.add_middleware(RequestMetricsMiddleware, server_timing=metrics_settings.server_timing)
+
+# Include routers (they carry the /api/v1 prefix themselves, see src.routers)
+app.include_router(ping.router)
+app.include_router(papers.router)
+
+# Prometheus scrape endpoint lives at the root, outside the versioned API
+if get_settings().metrics.enabled:
+    app.include_router(metrics.router)
+
+# Concurrency limits and load shedding, applied by the routes (AdmittedRoute) once a request is routed
+admission = get_settings().admission
+if admission.enabled:
+    app.state.admission = AdmissionControl(
+        max_concurrent=admission.max_concurrent,
+        max_queue=admission.max_queue,
+        queue_timeout_seconds=admission.queue_timeout_seconds,
+        retry_after_seconds=admission.retry_after_seconds,
+        route_limits=admission.route_limits,
+        priority_routes=admission.priority_routes,
+        exempt_routes=admission.exempt_routes,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,247 @@
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Generator, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    push_to_gateway,
+)
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Ingestion pipeline stages (used as the "stage" label on every pipeline metric)
+STAGE_ARXIV_QUERY = "arxiv_query"
+STAGE_DOWNLOAD = "download"
+STAGE_PARSE = "parse"
+STAGE_DB_WRITE = "db_write"
+STAGE_COMPRESS = "compress"  # Precompressing parsed content for the API, before the database write
+
+STAGE_DURATION_SECONDS = Histogram(
+    "ingestion_stage_duration_seconds",
+    "Wall time of a single unit of work in an ingestion stage",
+    ["stage"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+STAGE_ITEMS_TOTAL = Counter(
+    "ingestion_stage_items_total",
+    "Units of work completed by an ingestion stage, by outcome",
+    ["stage", "outcome"],
+)
+STAGE_QUEUE_DEPTH = Gauge(
+    "ingestion_stage_queue_depth",
+    "Units of work waiting to enter an ingestion stage",
+    ["stage"],
+    multiprocess_mode="livesum",
+)
+STAGE_IN_FLIGHT = Gauge(
+    "ingestion_stage_in_flight",
+    "Units of work currently being processed by an ingestion stage",
+    ["stage"],
+    multiprocess_mode="livesum",
+)
+STAGE_WAIT_SECONDS = Histogram(
+    "ingestion_stage_wait_seconds",
+    "Time a unit of work spent queued before an ingestion stage picked it up",
+    ["stage"],
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1800),
+)
+DOWNLOAD_BYTES = Histogram(
+    "ingestion_download_bytes",
+    "Size of downloaded PDFs in bytes",
+    ["stage"],
+    buckets=(64e3, 256e3, 512e3, 1e6, 2e6, 5e6, 10e6, 20e6, 50e6),
+)
+PARSE_SECONDS_PER_PAGE = Histogram(
+    "ingestion_parse_seconds_per_page",
+    "PDF parse time divided by the number of pages",
+    ["stage"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a connection from the SQLAlchemy pool (includes connecting when none is idle)",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "Connections currently checked out of the SQLAlchemy pool",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CAPACITY = Gauge(
+    "db_pool_capacity",
+    "Maximum connections the SQLAlchemy pool may open (pool_size + max_overflow, 0 when unbounded)",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_TIMEOUTS_TOTAL = Counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after pool_timeout because the pool was exhausted",
+    ["engine"],
+)
+DB_POOL_CONNECTIONS_OPENED_TOTAL = Counter(
+    "db_pool_connections_opened_total",
+    "New database connections opened by the SQLAlchemy pool",
+    ["engine"],
+)
+
+PAPER_CACHE_REQUESTS_TOTAL = Counter(
+    "paper_cache_requests_total",
+    "Paper detail cache lookups, by result (local_hit, shared_hit, miss)",
+    ["result"],
+)
+
+# API requests; "route" is the route template (e.g. /api/v1/papers/{arxiv_id}), never the raw path
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving an API request until its response was sent completely",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+HTTP_REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Database statement execution time spent by one API request",
+    ["method", "route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+HTTP_RESPONSE_SIZE_BYTES = Histogram(
+    "http_response_size_bytes",
+    "Size of API response bodies as sent (after compression)",
+    ["method", "route"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "API requests currently being processed",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+# Admission control; "limiter" is the route template of a route with its own limit, or "default"
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "admission_queue_depth",
+    "API requests waiting for a concurrency slot",
+    ["limiter"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_WAIT_SECONDS = Histogram(
+    "admission_wait_seconds",
+    "Time an admitted API request waited for a concurrency slot",
+    ["limiter"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+ADMISSION_REJECTED_TOTAL = Counter(
+    "admission_rejected_total",
+    "API requests rejected with 503 by admission control, by reason (queue_full, timeout, shed)",
+    ["limiter", "reason"],
+)
+
+DEPENDENCY_UP = Gauge(
+    "dependency_up",
+    "Whether the last background health probe of a dependency succeeded (1) or not (0)",
+    ["dependency"],
+    multiprocess_mode="livemin",
+)
+DEPENDENCY_PROBE_SECONDS = Histogram(
+    "dependency_probe_seconds",
+    "Wall time of a dependency health probe (capped by the probe timeout)",
+    ["dependency"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+
+@contextmanager
+def track_stage(stage: str) -> Generator[None, None, None]:
+    """
+    Time one unit of work in an ingestion stage.
+
+    Maintains the in-flight gauge and records duration plus a success/error outcome.
+
+    Args:
+        stage: Stage label (one of the STAGE_* constants)
+    """
+    STAGE_IN_FLIGHT.labels(stage=stage).inc()
+    start = time.perf_counter()
+    outcome = "success"
+    try:
+        yield
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        STAGE_DURATION_SECONDS.labels(stage=stage).observe(time.perf_counter() - start)
+        STAGE_ITEMS_TOTAL.labels(stage=stage, outcome=outcome).inc()
+        STAGE_IN_FLIGHT.labels(stage=stage).dec()
+
+
+@contextmanager
+def track_queued(stage: str) -> Generator[None, None, None]:
+    """Count a unit of work as queued for a stage while the block runs (e.g. waiting on a semaphore)."""
+    STAGE_QUEUE_DEPTH.labels(stage=stage).inc()
+    try:
+        yield
+    finally:
+        STAGE_QUEUE_DEPTH.labels(stage=stage).dec()
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Render all metrics in the Prometheus text format.
+
+    Aggregates across worker processes when PROMETHEUS_MULTIPROC_DIR is set
+    (e.g. uvicorn with several workers).
+
+    Returns:
+        Tuple of (payload, content type)
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def push_metrics(task_name: str, job: Optional[str] = None) -> bool:
+    """
+    Push the current process metrics to a Prometheus Pushgateway.
+
+    Used by short-lived Airflow task processes that cannot be scraped.
+    Failures are logged and never raised so metrics cannot fail a task.
+
+    Args:
+        task_name: Value of the "task" grouping key
+        job: Pushgateway job name (uses settings default if None)
+
+    Returns:
+        True if metrics were pushed, False if disabled or the push failed
+    """
+    settings = get_settings().metrics
+    if not settings.pushgateway_url:
+        logger.debug("Pushgateway not configured, skipping metrics push")
+        return False
+
+    try:
+        push_to_gateway(
+            settings.pushgateway_url,
+            job=job or settings.push_job_name,
+            grouping_key={"task": task_name},
+            registry=REGISTRY,
+            timeout=settings.push_timeout_seconds,
+        )
+        logger.info(f"Pushed metrics to {settings.pushgateway_url} (task={task_name})")
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to push metrics to {settings.pushgateway_url}: {e}")
+        return False
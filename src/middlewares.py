@@ -1,4 +1,17 @@
 import logging
+import time
+from typing import Dict, Optional, Sequence
+
+from src.content_coding import StreamCompressor, compress, negotiate
+from src.db.timing import track_queries
+from src.metrics import (
+    HTTP_REQUEST_DB_SECONDS,
+    HTTP_REQUEST_DURATION_SECONDS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    HTTP_RESPONSE_SIZE_BYTES,
+)
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -14,3 +27,163 @@ def log_request(method: str, path: str) -> None:
 def log_error(error: str, method: str, path: str) -> None:
     """Simple error logging for Week 1."""
     logger.error(f"Error in {method} {path}: {error}")
+
+
+# Media types worth compressing (parameters such as charset are ignored)
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/xml", "application/javascript")
+
+
+class CompressionMiddleware:
+    """
+    Negotiated gzip/br/zstd response compression (pure ASGI, so streamed responses stay streamed).
+
+    Bodies below minimum_size, non-text media types, bodies that already carry a Content-Encoding
+    (e.g. precompressed paper content), 204/304 responses and range responses (206/416 or
+    Content-Range, whose byte offsets refer to the uncompressed body) are passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, encodings: Sequence[str], levels: Dict[str, int], minimum_size: int = 1024):
+        """
+        Args:
+            app: Wrapped ASGI application
+            encodings: Offered codings in server preference order
+            levels: Compression level per coding (fast levels: this runs on every response)
+            minimum_size: Smallest body, in bytes, that is compressed
+        """
+        self.app = app
+        self.encodings = tuple(encodings)
+        self.levels = levels
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        compressor: Optional[StreamCompressor] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                headers = Headers(raw=message["headers"])
+                media_type = headers.get("content-type", "")
+                passthrough = (
+                    message["status"] in (204, 206, 304, 416)
+                    or "content-encoding" in headers
+                    or "content-range" in headers
+                    or not media_type.startswith(COMPRESSIBLE_TYPES)
+                )
+                if passthrough:
+                    await send(message)
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                assert start is not None
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                headers = MutableHeaders(raw=start["headers"])
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    # The encoded body is a different representation of the same resource
+                    headers["ETag"] = f"W/{etag}"
+                if not more_body:
+                    body = compress(body, encoding, self.levels[encoding])
+                    headers["Content-Length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+                # Streamed body: length unknown up front
+                if "content-length" in headers:
+                    del headers["Content-Length"]
+                compressor = StreamCompressor(encoding, self.levels[encoding])
+                await send(start)
+
+            body = compressor.compress(body)
+            if not more_body:
+                body += compressor.finish()
+            if body or not more_body:
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+# Route label of requests that matched no route (raw paths would make the label unbounded)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestMetricsMiddleware:
+    """
+    Per-route request metrics and Server-Timing headers (pure ASGI, so streamed responses stay streamed).
+
+    Records latency, response size and database time of every request by route template, and
+    tells clients where the time went before the first byte: Server-Timing: app;dur=..., db;dur=...
+    Register it last (outermost) so latency and sizes include the other middlewares.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True):
+        """
+        Args:
+            app: Wrapped ASGI application
+            server_timing: Add the Server-Timing header to responses
+        """
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        start = time.perf_counter()
+        status = 500  # Reported when the app fails before starting a response
+        size = 0
+
+        HTTP_REQUESTS_IN_FLIGHT.labels(method=method).inc()
+        with track_queries() as queries:
+
+            async def send_with_metrics(message: Message) -> None:
+                nonlocal status, size
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    if self.server_timing:
+                        app_ms = (time.perf_counter() - start) * 1000
+                        MutableHeaders(raw=message["headers"]).append(
+                            "Server-Timing",
+                            f'app;dur={app_ms:.1f}, db;dur={queries.seconds * 1000:.1f};desc="{queries.queries} queries"',
+                        )
+                elif message["type"] == "http.response.body":
+                    size += len(message.get("body", b""))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_metrics)
+            finally:
+                # The router stores the matched route in the scope; routers are included without a prefix,
+                # so its path is the full template (see src.routers)
+                route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+                HTTP_REQUEST_DURATION_SECONDS.labels(method=method, route=route, status=str(status)).observe(
+                    time.perf_counter() - start
+                )
+                HTTP_REQUEST_DB_SECONDS.labels(method=method, route=route).observe(queries.seconds)
+                HTTP_RESPONSE_SIZE_BYTES.labels(method=method, route=route).observe(size)
+                HTTP_REQUESTS_IN_FLIGHT.labels(method=method).dec()
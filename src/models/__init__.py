@@ -1,5 +1,12 @@
 from .paper import Paper
+from .paper_content import PaperContentBlob
+from .paper_failure import DeadLetterPaper, PaperFailure
+from .paper_stats import PaperStats
 
 __all__ = [
     "Paper",
+    "PaperContentBlob",
+    "PaperFailure",
+    "DeadLetterPaper",
+    "PaperStats",
 ]
@@ -1,9 +1,36 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import JSON, Boolean, Column, Computed, DateTime, Index, String, Text, func, literal_column
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred
 from src.db.interfaces.postgresql import Base
+from src.db.types import CompressedJSON, CompressedText, compression_enabled
+
+# Text search configuration and how much of the body is indexed (tsvector values are limited to 1 MB)
+SEARCH_CONFIG = "english"
+SEARCH_BODY_CHARS = 100_000
+
+
+def _search_vector_expression() -> str:
+    """Weighted tsvector of title (A), abstract (B) and the start of the body (C)."""
+    parts = [
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A')",
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(abstract, '')), 'B')",
+    ]
+    # Compressed raw_text is opaque bytea to Postgres, so only metadata is searchable then
+    if not compression_enabled():
+        parts.append(f"setweight(to_tsvector('{SEARCH_CONFIG}', left(coalesce(raw_text, ''), {SEARCH_BODY_CHARS})), 'C')")
+    return " || ".join(parts)
+
+
+def base_arxiv_id(arxiv_id):
+    """
+    SQL expression of an arXiv ID without its version suffix ("2401.00001v2" -> "2401.00001").
+
+    The pattern is inlined rather than bound, so queries match the ix_papers_base_arxiv_id index expression.
+    """
+    return func.regexp_replace(arxiv_id, literal_column("'v[0-9]+$'"), literal_column("''"))
 
 
 class Paper(Base):
@@ -13,15 +40,15 @@ class Paper(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     arxiv_id = Column(String, unique=True, nullable=False, index=True)
     title = Column(String, nullable=False)
-    authors = Column(JSON, nullable=False)
+    authors = Column(JSONB, nullable=False)
     abstract = Column(Text, nullable=False)
-    categories = Column(JSON, nullable=False)
+    categories = Column(JSONB, nullable=False)
     published_date = Column(DateTime, nullable=False)
     pdf_url = Column(String, nullable=False)
 
     # Parsed PDF content (added for comprehensive storage)
-    raw_text = Column(Text, nullable=True)
-    sections = Column(JSON, nullable=True)
+    raw_text = Column(CompressedText, nullable=True)
+    sections = Column(CompressedJSON, nullable=True)
     references = Column(JSON, nullable=True)
 
     # PDF processing metadata
@@ -30,6 +57,28 @@ class Paper(Base):
     pdf_processed = Column(Boolean, default=False, nullable=False)
     pdf_processing_date = Column(DateTime, nullable=True)
 
+    # Full-text search document, generated by Postgres (never loaded unless asked for)
+    search_vector = deferred(Column(TSVECTOR, Computed(_search_vector_expression(), persisted=True), nullable=True))
+
     # Timestamps
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        # Keyset pagination of the newest-first paper listing
+        Index("ix_papers_published_date_id", published_date.desc(), id.desc()),
+        # Category filter (categories @> '["cs.CL"]')
+        Index("ix_papers_categories", categories, postgresql_using="gin", postgresql_ops={"categories": "jsonb_path_ops"}),
+        # Papers still waiting for PDF processing, newest first
+        Index(
+            "ix_papers_unprocessed_published_date_id",
+            published_date.desc(),
+            id.desc(),
+            postgresql_where=pdf_processed == False,
+        ),
+        Index("ix_papers_search_vector", "search_vector", postgresql_using="gin"),
+        # Incremental exports (updated_at >= since, oldest change first)
+        Index("ix_papers_updated_at_id", updated_at, id),
+        # Version-less ID lookups (batch resolution of "2401.00001" to its latest stored version)
+        Index("ix_papers_base_arxiv_id", base_arxiv_id(arxiv_id)),
+    )
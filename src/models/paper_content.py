@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, LargeBinary, String
+from src.db.interfaces.postgresql import Base
+
+
+class PaperContentBlob(Base):
+    """
+    JSON body of GET /papers/{arxiv_id}/content, compressed once per content coding at ingestion.
+
+    The API sends body as is with the matching Content-Encoding, so the large parsed text is
+    never compressed again per request.
+    """
+
+    __tablename__ = "paper_content_blobs"
+
+    arxiv_id = Column(String, ForeignKey("papers.arxiv_id", ondelete="CASCADE"), primary_key=True)
+    encoding = Column(String, primary_key=True)  # gzip | br | zstd
+
+    digest = Column(String, nullable=False)  # Of the uncompressed body, the same for every coding
+    size = Column(Integer, nullable=False)  # Uncompressed body size in bytes
+    body = Column(LargeBinary, nullable=False)
+
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
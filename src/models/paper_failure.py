@@ -0,0 +1,49 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import JSON, Column, DateTime, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from src.db.interfaces.postgresql import Base
+
+
+class PaperFailure(Base):
+    """A paper whose ingestion failed in one stage and is waiting to be retried."""
+
+    __tablename__ = "paper_failures"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    arxiv_id = Column(String, unique=True, nullable=False, index=True)
+
+    # Failure details
+    stage = Column(String, nullable=False)  # download | parse | store
+    error_class = Column(String, nullable=False)
+    error_message = Column(Text, nullable=True)
+    attempts = Column(Integer, default=1, nullable=False)
+    next_retry_at = Column(DateTime, nullable=False, index=True)
+
+    # Everything needed to re-run the failed stage without repeating earlier ones
+    payload = Column(JSON, nullable=False)
+
+    # Timestamps
+    first_failed_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    last_failed_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+
+class DeadLetterPaper(Base):
+    """A paper that exhausted its retry attempts and needs manual investigation."""
+
+    __tablename__ = "paper_dead_letters"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    arxiv_id = Column(String, unique=True, nullable=False, index=True)
+
+    # Last failure details
+    stage = Column(String, nullable=False)
+    error_class = Column(String, nullable=False)
+    error_message = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False)
+    payload = Column(JSON, nullable=False)
+
+    # Timestamps
+    first_failed_at = Column(DateTime, nullable=True)
+    dead_lettered_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import BigInteger, Column, DateTime, String
+from src.db.interfaces.postgresql import Base
+
+# Aggregation scopes of paper_stats rows
+STATS_SCOPE_ALL = "all"  # Single row with key ""
+STATS_SCOPE_DAY = "day"  # Keyed by publication date (YYYY-MM-DD)
+STATS_SCOPE_CATEGORY = "category"  # Keyed by arXiv category
+
+
+class PaperStats(Base):
+    """Paper counters per scope and key, maintained incrementally by the ingestion store step."""
+
+    __tablename__ = "paper_stats"
+
+    scope = Column(String, primary_key=True)
+    key = Column(String, primary_key=True)
+
+    total_papers = Column(BigInteger, default=0, nullable=False)
+    processed_papers = Column(BigInteger, default=0, nullable=False)
+    papers_with_text = Column(BigInteger, default=0, nullable=False)
+
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
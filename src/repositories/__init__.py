@@ -1,5 +1,11 @@
 from .paper import PaperRepository
+from .paper_content import PaperContentRepository
+from .paper_failure import PaperFailureRepository
+from .paper_stats import PaperStatsRepository
 
 __all__ = [
     "PaperRepository",
+    "PaperContentRepository",
+    "PaperFailureRepository",
+    "PaperStatsRepository",
 ]
@@ -1,11 +1,338 @@
-from datetime import datetime
-from typing import List, Optional
-from uuid import UUID
+import base64
+import binascii
+import json
+import logging
+import re
+import time
+from datetime import datetime, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
-from src.models.paper import Paper
-from src.schemas.arxiv.paper import PaperCreate
+from sqlalchemy import JSON, Integer, String, any_, bindparam, func, literal_column, or_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.orm import Session, defer
+from sqlalchemy.sql import Select
+from src.db.explain import Explain, plan_root
+from src.db.types import compress, compression_enabled
+from src.exceptions import InvalidCursorError
+from src.models.paper import SEARCH_CONFIG, Paper, base_arxiv_id
+from src.repositories.paper_stats import processing_stats
+from src.schemas.arxiv.paper import PaperBase, PaperCreate, PaperFilters
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Parsed PDF content, left unloaded for summary listings
+_CONTENT_COLUMNS = (Paper.raw_text, Paper.sections, Paper.references, Paper.parser_metadata)
+
+# JSON columns of the papers table, serialized with json.dumps for COPY
+_JSON_COLUMNS = {"authors", "categories", "sections", "references", "parser_metadata"}
+
+# Columns stored as zstd-compressed bytea when content compression is enabled
+_COMPRESSED_COLUMNS = {"raw_text", "sections"}
+
+
+def _copy_value(value: Any, is_json: bool, is_compressed: bool) -> str:
+    """Format one value as a COPY CSV field (unquoted empty means NULL)."""
+    if value is None:
+        return ""
+    if is_compressed:
+        data = json.dumps(value) if is_json else value
+        return "\\x" + compress(data.encode("utf-8")).hex()
+    if is_json:
+        value = json.dumps(value)
+    elif isinstance(value, bool):
+        return "t" if value else "f"
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    else:
+        value = str(value)
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _encode_position(values: List[Any]) -> str:
+    payload = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_position(cursor: str) -> List[Any]:
+    payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    values = json.loads(payload)
+    if not isinstance(values, list) or len(values) != 2:
+        raise ValueError("cursor must hold two values")
+    return values
+
+
+def encode_cursor(paper: Paper) -> str:
+    """Encode the keyset position of a paper as an opaque pagination cursor."""
+    return _encode_position([paper.published_date.isoformat(), str(paper.id)])
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a pagination cursor created by encode_cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        published_date, paper_id = _decode_position(cursor)
+        return datetime.fromisoformat(published_date), UUID(paper_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor}") from e
+
+
+def encode_search_cursor(rank: float, paper_id: UUID) -> str:
+    """Encode the position of a search hit (rank, id) as an opaque pagination cursor."""
+    return _encode_position([rank, str(paper_id)])
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, UUID]:
+    """
+    Decode a search pagination cursor created by encode_search_cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        rank, paper_id = _decode_position(cursor)
+        return float(rank), UUID(paper_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor}") from e
+
+
+# Processing counters in one scan: total, processed, with raw text
+_PROCESSING_STATS = select(
+    func.count(Paper.id),
+    func.count(Paper.id).filter(Paper.pdf_processed == True),
+    func.count(Paper.id).filter(Paper.raw_text != None),
+)
+
+# Full-text search (a regconfig literal, so asyncpg never has to encode the parameter type)
+_SEARCH_CONFIG = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
+_ESTIMATED_COUNT = text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'papers'::regclass")
+
+# Parts of the parsed content, extracted by Postgres so the full sections and raw_text never reach Python.
+# sections may hold a JSON null (not an array), hence the json_typeof guards.
+_SECTION_INDEX = text(
+    """
+    SELECT (
+        SELECT json_agg(json_build_object('index', s.position - 1, 'title', s.value->>'title', 'chars', coalesce(length(s.value->>'content'), 0))
+                        ORDER BY s.position)
+        FROM json_array_elements(CASE WHEN json_typeof(papers.sections) = 'array' THEN papers.sections END)
+             WITH ORDINALITY AS s(value, position)
+    ) AS sections
+    FROM papers WHERE papers.arxiv_id = :arxiv_id
+    """
+).columns(sections=JSON)
+_SECTION = text(
+    """
+    SELECT CASE WHEN json_typeof(sections) = 'array' THEN json_array_length(sections) ELSE 0 END AS total,
+           CASE WHEN json_typeof(sections) = 'array' THEN sections -> CAST(:index AS integer) END AS section
+    FROM papers WHERE arxiv_id = :arxiv_id
+    """
+).columns(total=Integer, section=JSON)
+_TEXT_CHARS = text(
+    """
+    SELECT length(raw_text) AS total, substr(raw_text, :offset + 1, coalesce(CAST(:length AS integer), length(raw_text))) AS slice
+    FROM papers WHERE arxiv_id = :arxiv_id
+    """
+)
+_TEXT_BYTES = text(
+    """
+    SELECT octet_length(raw_text) AS total,
+           substring(convert_to(raw_text, 'UTF8') FROM :offset + 1 FOR coalesce(CAST(:length AS integer), octet_length(raw_text))) AS slice
+    FROM papers WHERE arxiv_id = :arxiv_id
+    """
+)
+
+
+def _section_summaries(sections: Any) -> List[Dict[str, Any]]:
+    """Index, title and content length of each section (Python counterpart of _SECTION_INDEX)."""
+    if not isinstance(sections, list):
+        return []
+    return [
+        {"index": index, "title": section.get("title"), "chars": len(section.get("content") or "")}
+        for index, section in enumerate(sections)
+    ]
+
+
+def _filter_conditions(filters: Optional[PaperFilters]) -> List[Any]:
+    """WHERE conditions of listing filters, each served by an index on papers."""
+    if filters is None:
+        return []
+    conditions = []
+    if filters.category is not None:
+        conditions.append(Paper.categories.contains([filters.category]))
+    if filters.published_from is not None:
+        conditions.append(Paper.published_date >= filters.published_from)
+    if filters.published_to is not None:
+        conditions.append(Paper.published_date < filters.published_to)
+    if filters.processed is not None:
+        conditions.append(Paper.pdf_processed == filters.processed)
+    return conditions
+
+
+def _all_statement(limit: int, offset: int, summary: bool, filters: Optional[PaperFilters] = None) -> Select:
+    stmt = select(Paper).where(*_filter_conditions(filters)).order_by(Paper.published_date.desc()).limit(limit).offset(offset)
+    if summary:
+        stmt = stmt.options(*[defer(column) for column in _CONTENT_COLUMNS])
+    return stmt
+
+
+def _page_statement(
+    limit: int, after: Optional[Tuple[datetime, UUID]], summary: bool, filters: Optional[PaperFilters] = None
+) -> Select:
+    stmt = select(Paper).where(*_filter_conditions(filters)).order_by(Paper.published_date.desc(), Paper.id.desc()).limit(limit)
+    if after is not None:
+        stmt = stmt.where(tuple_(Paper.published_date, Paper.id) < tuple_(*after))
+    if summary:
+        stmt = stmt.options(*[defer(column) for column in _CONTENT_COLUMNS])
+    return stmt
+
+
+def _count_statement(filters: Optional[PaperFilters] = None) -> Select:
+    return select(func.count(Paper.id)).where(*_filter_conditions(filters))
+
+
+def _bounded_count_statement(filters: Optional[PaperFilters], limit: int) -> Select:
+    """COUNT(*) that stops after limit matching rows."""
+    matches = select(Paper.id).where(*_filter_conditions(filters)).limit(limit).subquery()
+    return select(func.count()).select_from(matches)
+
+
+def _export_statement(fields: Sequence[str], updated_since: Optional[datetime] = None) -> Select:
+    """Projection of the given fields, oldest change first, so an export can resume from its last updated_at."""
+    stmt = select(*[getattr(Paper, field) for field in fields]).order_by(Paper.updated_at, Paper.id)
+    if updated_since is not None:
+        stmt = stmt.where(Paper.updated_at >= updated_since)
+    return stmt
+
+
+# Version suffix of an arXiv ID ("v2" in "2401.00001v2")
+_VERSION_SUFFIX = re.compile(r"v(\d+)$")
+
+
+def split_arxiv_id(arxiv_id: str) -> Tuple[str, Optional[int]]:
+    """Split an arXiv ID into its base ID and version ("2401.00001v2" -> ("2401.00001", 2), no version -> None)."""
+    match = _VERSION_SUFFIX.search(arxiv_id)
+    if match is None:
+        return arxiv_id, None
+    return arxiv_id[: match.start()], int(match.group(1))
+
+
+def _batch_statement(arxiv_ids: Sequence[str], fields: Sequence[str]) -> Select:
+    """
+    Projection of the papers matching any of the IDs, in one query.
+
+    Versioned IDs match exactly (arxiv_id = ANY(:arxiv_ids)); version-less IDs match every stored
+    version through the base ID expression index. Array parameters keep the statement text the same
+    for any number of IDs.
+    """
+    exact = [arxiv_id for arxiv_id in arxiv_ids if split_arxiv_id(arxiv_id)[1] is not None]
+    base = [arxiv_id for arxiv_id in arxiv_ids if split_arxiv_id(arxiv_id)[1] is None]
+
+    conditions = []
+    if exact:
+        conditions.append(Paper.arxiv_id == any_(bindparam("arxiv_ids", exact, type_=ARRAY(String))))
+    if base:
+        conditions.append(base_arxiv_id(Paper.arxiv_id) == any_(bindparam("base_arxiv_ids", base, type_=ARRAY(String))))
+    return select(*[getattr(Paper, field) for field in fields]).where(or_(*conditions))
+
+
+def _search_statement(query: str, limit: int, after: Optional[Tuple[float, UUID]]) -> Select:
+    """
+    Rank papers matching a web-style search query, best first, with keyset paging on (rank, id).
+
+    Rows are (Paper, rank, headline). Matching uses the GIN index on search_vector; headlines
+    are only computed for the returned page.
+    """
+    tsquery = func.websearch_to_tsquery(_SEARCH_CONFIG, query)
+    rank = func.ts_rank(Paper.search_vector, tsquery)
+
+    ranked = select(Paper.id, rank.label("rank")).where(Paper.search_vector.op("@@")(tsquery))
+    if after is not None:
+        ranked = ranked.where(tuple_(rank, Paper.id) < tuple_(*after))
+    ranked = ranked.order_by(rank.desc(), Paper.id.desc()).limit(limit).subquery()
+
+    headline = func.ts_headline(_SEARCH_CONFIG, Paper.abstract, tsquery, _HEADLINE_OPTIONS)
+    return (
+        select(Paper, ranked.c.rank, headline.label("headline"))
+        .join(ranked, Paper.id == ranked.c.id)
+        .options(*[defer(column) for column in _CONTENT_COLUMNS])
+        .order_by(ranked.c.rank.desc(), Paper.id.desc())
+    )
+
+
+class _CopyStream:
+    """
+    Lazy file-like object feeding COPY FROM STDIN.
+
+    Rows are formatted on demand as psycopg2 reads, so memory stays constant however many rows are loaded.
+    """
+
+    def __init__(
+        self,
+        papers: Iterable[PaperCreate],
+        columns: Sequence[str],
+        progress_callback: Optional[Callable[[int], None]] = None,
+        progress_interval: int = 10000,
+    ):
+        self._papers = iter(papers)
+        compressed = _COMPRESSED_COLUMNS if compression_enabled() else set()
+        self._columns = [(column, column in _JSON_COLUMNS, column in compressed) for column in columns]
+        self._progress_callback = progress_callback
+        self._progress_interval = progress_interval
+        self._buffer = ""
+        self.rows = 0
+
+    def _next_line(self) -> Optional[str]:
+        paper = next(self._papers, None)
+        if paper is None:
+            return None
+
+        self.rows += 1
+        if self._progress_callback and self.rows % self._progress_interval == 0:
+            self._progress_callback(self.rows)
+
+        fields = [_copy_value(getattr(paper, column), *flags) for column, *flags in self._columns]
+        # Trailing sequence number lets the merge keep the last row of a duplicated arxiv_id
+        fields.append(str(self.rows))
+        return ",".join(fields) + "\n"
+
+    def read(self, size: int = -1) -> str:
+        lines = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            line = self._next_line()
+            if line is None:
+                break
+            lines.append(line)
+            length += len(line)
+
+        data = "".join(lines)
+        if size < 0:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
 
 
 class PaperRepository:
@@ -27,13 +354,57 @@ class PaperRepository:
         stmt = select(Paper).where(Paper.id == paper_id)
         return self.session.scalar(stmt)
 
-    def get_all(self, limit: int = 100, offset: int = 0) -> List[Paper]:
-        stmt = select(Paper).order_by(Paper.published_date.desc()).limit(limit).offset(offset)
-        return list(self.session.scalars(stmt))
+    def get_all(
+        self, limit: int = 100, offset: int = 0, summary: bool = False, filters: Optional[PaperFilters] = None
+    ) -> List[Paper]:
+        return list(self.session.scalars(_all_statement(limit, offset, summary, filters)))
 
-    def get_count(self) -> int:
-        stmt = select(func.count(Paper.id))
-        return self.session.scalar(stmt) or 0
+    def get_page(
+        self,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        summary: bool = False,
+        filters: Optional[PaperFilters] = None,
+    ) -> List[Paper]:
+        """
+        Get papers newest first using keyset pagination on (published_date, id).
+
+        Args:
+            limit: Maximum number of papers
+            after: (published_date, id) of the last paper of the previous page
+            summary: Skip loading the parsed PDF content (raw_text, sections, references, parser_metadata)
+            filters: Optional category, publication date and processing filters
+
+        Returns:
+            Papers following the given position
+        """
+        return list(self.session.scalars(_page_statement(limit, after, summary, filters)))
+
+    def get_count(self, filters: Optional[PaperFilters] = None) -> int:
+        return self.session.scalar(_count_statement(filters)) or 0
+
+    def search(self, query: str, limit: int = 10, after: Optional[Tuple[float, UUID]] = None) -> List[Tuple[Paper, float, str]]:
+        """
+        Full-text search over title, abstract and body.
+
+        Args:
+            query: Web-style search query (quoted phrases, OR, -exclusions)
+            limit: Maximum number of hits
+            after: (rank, id) of the last hit of the previous page
+
+        Returns:
+            List of (paper, rank, highlighted abstract), best match first
+        """
+        return [tuple(row) for row in self.session.execute(_search_statement(query, limit, after))]
+
+    def get_estimated_count(self) -> int:
+        """
+        Get the planner's row estimate for the papers table (pg_class.reltuples).
+
+        Constant time, but only as fresh as the last VACUUM/ANALYZE. Returns -1 if the table was never analyzed.
+        """
+        estimate = self.session.scalar(_ESTIMATED_COUNT)
+        return -1 if estimate is None else int(estimate)
 
     def get_processed_papers(self, limit: int = 100, offset: int = 0) -> List[Paper]:
         """Get papers that have been successfully processed with PDF content."""
@@ -57,24 +428,12 @@ class PaperRepository:
         return list(self.session.scalars(stmt))
 
     def get_processing_stats(self) -> dict:
-        """Get statistics about PDF processing status."""
-        total_papers = self.get_count()
-
-        # Count processed papers
-        processed_stmt = select(func.count(Paper.id)).where(Paper.pdf_processed == True)
-        processed_papers = self.session.scalar(processed_stmt) or 0
+        """
+        Get statistics about PDF processing status in a single pass over papers.
 
-        # Count papers with text
-        text_stmt = select(func.count(Paper.id)).where(Paper.raw_text != None)
-        papers_with_text = self.session.scalar(text_stmt) or 0
-
-        return {
-            "total_papers": total_papers,
-            "processed_papers": processed_papers,
-            "papers_with_text": papers_with_text,
-            "processing_rate": (processed_papers / total_papers * 100) if total_papers > 0 else 0,
-            "text_extraction_rate": (papers_with_text / processed_papers * 100) if processed_papers > 0 else 0,
-        }
+        For O(1) reporting use PaperStatsRepository.get_totals, which reads the maintained counters.
+        """
+        return processing_stats(*self.session.execute(_PROCESSING_STATS).one())
 
     def update(self, paper: Paper) -> Paper:
         self.session.add(paper)
@@ -93,3 +452,319 @@ class PaperRepository:
         else:
             # Create new paper
             return self.create(paper_create)
+
+    def bulk_upsert(self, papers: List[PaperCreate], batch_size: int = 500) -> Dict[str, int]:
+        """
+        Insert or update many papers with multi-row INSERT ... ON CONFLICT (arxiv_id) DO UPDATE.
+
+        Only flushes statements; the caller commits once for the whole set.
+        As with upsert(), fields not explicitly set on a PaperCreate are left untouched on existing rows.
+
+        Args:
+            papers: Papers to write (the last entry wins if an arxiv_id appears twice)
+            batch_size: Maximum rows per INSERT statement
+
+        Returns:
+            Dictionary with "inserted" and "updated" counts
+        """
+        counts = {"inserted": 0, "updated": 0}
+
+        # ON CONFLICT cannot touch the same row twice in one statement
+        unique_papers = {paper.arxiv_id: paper for paper in papers}
+
+        # Rows of one statement share the same set of updated columns
+        groups: Dict[FrozenSet[str], List[PaperCreate]] = {}
+        for paper in unique_papers.values():
+            groups.setdefault(frozenset(paper.model_dump(exclude_unset=True)), []).append(paper)
+
+        for update_fields, group in groups.items():
+            for start in range(0, len(group), batch_size):
+                now = datetime.now(timezone.utc)
+                rows = [
+                    {**paper.model_dump(), "id": uuid4(), "created_at": now, "updated_at": now}
+                    for paper in group[start : start + batch_size]
+                ]
+
+                stmt = insert(Paper).values(rows)
+                update_columns = {field: stmt.excluded[field] for field in update_fields if field != "arxiv_id"}
+                update_columns["updated_at"] = stmt.excluded.updated_at
+                stmt = stmt.on_conflict_do_update(index_elements=[Paper.arxiv_id], set_=update_columns).returning(
+                    # xmax is 0 only for rows created by this statement
+                    literal_column("(xmax = 0)").label("inserted")
+                )
+
+                for inserted in self.session.scalars(stmt):
+                    counts["inserted" if inserted else "updated"] += 1
+
+        return counts
+
+    def copy_upsert(
+        self,
+        papers: Iterable[PaperCreate],
+        columns: Optional[Sequence[str]] = None,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        progress_interval: int = 10000,
+    ) -> Dict[str, int]:
+        """
+        Bulk load papers through COPY FROM STDIN into a staging table, then merge with one set-based upsert.
+
+        Meant for large metadata loads (historical backfills) where even batched INSERTs are too slow.
+        Rows are streamed, so papers can be a generator of any length. The caller commits.
+
+        Args:
+            papers: Papers to load (the last row wins if an arxiv_id appears twice)
+            columns: Columns to load and update on conflict (defaults to the core arXiv metadata)
+            progress_callback: Called with the number of rows streamed so far
+            progress_interval: Rows between progress callbacks
+
+        Returns:
+            Dictionary with "copied", "inserted" and "updated" counts
+        """
+        columns = list(columns or PaperBase.model_fields)
+        if "arxiv_id" not in columns:
+            raise ValueError("copy_upsert columns must include arxiv_id")
+        unknown = set(columns) - set(PaperCreate.model_fields)
+        if unknown:
+            raise ValueError(f"Unknown paper columns: {', '.join(sorted(unknown))}")
+
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        start = time.perf_counter()
+
+        # Staging table without the constraints of papers; dropped with the transaction at the latest.
+        # Drops name pg_temp: before the temp table exists, a bare name would resolve to a permanent table
+        self.session.execute(text("DROP TABLE IF EXISTS pg_temp.paper_staging"))
+        self.session.execute(
+            text(
+                f"CREATE TEMP TABLE paper_staging ON COMMIT DROP AS "
+                f"SELECT {column_list}, 0::bigint AS load_seq FROM papers WITH NO DATA"
+            )
+        )
+
+        stream = _CopyStream(papers, columns, progress_callback, progress_interval)
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY paper_staging ({column_list}, load_seq) FROM STDIN WITH (FORMAT csv)", stream)
+        finally:
+            cursor.close()
+        copy_seconds = time.perf_counter() - start
+
+        # NOT NULL columns without a database default are filled when absent from the load
+        defaults = {"pdf_processed": "false"}
+        insert_columns = columns + [column for column in defaults if column not in columns]
+        select_columns = [f'"{column}"' if column in columns else defaults[column] for column in insert_columns]
+        update_columns = [f'"{column}" = EXCLUDED."{column}"' for column in columns if column != "arxiv_id"]
+        update_columns.append("updated_at = EXCLUDED.updated_at")
+
+        result = self.session.execute(
+            text(
+                f"""
+                WITH merged AS (
+                    INSERT INTO papers (id, {", ".join(f'"{column}"' for column in insert_columns)}, created_at, updated_at)
+                    SELECT gen_random_uuid(), {", ".join(select_columns)},
+                           now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc'
+                    FROM (
+                        SELECT DISTINCT ON (arxiv_id) * FROM paper_staging ORDER BY arxiv_id, load_seq DESC
+                    ) AS staged
+                    ON CONFLICT (arxiv_id) DO UPDATE SET {", ".join(update_columns)}
+                    RETURNING (xmax = 0) AS inserted
+                )
+                SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM merged
+                """
+            )
+        ).one()
+        self.session.execute(text("DROP TABLE pg_temp.paper_staging"))
+
+        counts = {"copied": stream.rows, "inserted": result[0], "updated": result[1]}
+        if progress_callback:
+            progress_callback(stream.rows)
+
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"COPY loaded {stream.rows} rows in {copy_seconds:.2f}s and merged in {elapsed - copy_seconds:.2f}s "
+            f"({stream.rows / elapsed if elapsed > 0 else 0:.0f} rows/s): "
+            f"{counts['inserted']} inserted, {counts['updated']} updated"
+        )
+        return counts
+
+
+class AsyncPaperRepository:
+    """Read-only paper queries on an AsyncSession, for async API endpoints."""
+
+    def __init__(self, session: "AsyncSession"):
+        self.session = session
+
+    async def get_by_arxiv_id(self, arxiv_id: str) -> Optional[Paper]:
+        stmt = select(Paper).where(Paper.arxiv_id == arxiv_id)
+        return await self.session.scalar(stmt)
+
+    async def get_by_id(self, paper_id: UUID) -> Optional[Paper]:
+        stmt = select(Paper).where(Paper.id == paper_id)
+        return await self.session.scalar(stmt)
+
+    async def get_all(
+        self, limit: int = 100, offset: int = 0, summary: bool = False, filters: Optional[PaperFilters] = None
+    ) -> List[Paper]:
+        return list(await self.session.scalars(_all_statement(limit, offset, summary, filters)))
+
+    async def get_page(
+        self,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        summary: bool = False,
+        filters: Optional[PaperFilters] = None,
+    ) -> List[Paper]:
+        """Async version of PaperRepository.get_page."""
+        return list(await self.session.scalars(_page_statement(limit, after, summary, filters)))
+
+    async def get_count(self, filters: Optional[PaperFilters] = None) -> int:
+        return await self.session.scalar(_count_statement(filters)) or 0
+
+    async def get_filtered_count(self, filters: PaperFilters, exact_threshold: int) -> Tuple[int, bool]:
+        """
+        Number of papers matching filters, exact up to exact_threshold and estimated beyond.
+
+        The exact count stops after exact_threshold + 1 rows, so it costs the same however many papers
+        match; larger counts come from the planner's row estimate for the filtered query.
+
+        Returns:
+            (count, whether it is an estimate)
+        """
+        counted = await self.session.scalar(_bounded_count_statement(filters, exact_threshold + 1)) or 0
+        if counted <= exact_threshold:
+            return counted, False
+        plan = await self.session.scalar(Explain(select(Paper.id).where(*_filter_conditions(filters))))
+        return max(int(plan_root(plan)["Plan Rows"]), counted), True
+
+    async def search(
+        self, query: str, limit: int = 10, after: Optional[Tuple[float, UUID]] = None
+    ) -> List[Tuple[Paper, float, str]]:
+        """Async version of PaperRepository.search."""
+        return [tuple(row) for row in await self.session.execute(_search_statement(query, limit, after))]
+
+    async def get_many(self, arxiv_ids: Sequence[str], fields: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve arXiv IDs to the given fields of their papers with a single query.
+
+        A version-less ID resolves to the latest stored version of the paper.
+
+        Returns:
+            Projected rows by requested ID; IDs without a paper are left out
+        """
+        if not arxiv_ids:
+            return {}
+        columns = list(dict.fromkeys(["arxiv_id", *fields]))
+        rows = (await self.session.execute(_batch_statement(arxiv_ids, columns))).mappings().all()
+
+        resolved: Dict[str, Dict[str, Any]] = {}
+        latest: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        for row in rows:
+            resolved[row["arxiv_id"]] = dict(row)
+            base, version = split_arxiv_id(row["arxiv_id"])
+            if base not in latest or (version or 0) > latest[base][0]:
+                latest[base] = (version or 0, resolved[row["arxiv_id"]])
+
+        found: Dict[str, Dict[str, Any]] = {}
+        for arxiv_id in arxiv_ids:
+            row = resolved.get(arxiv_id) if split_arxiv_id(arxiv_id)[1] is not None else latest.get(arxiv_id, (0, None))[1]
+            if row is not None:
+                found[arxiv_id] = {field: row[field] for field in fields}
+        return found
+
+    async def stream_export(
+        self, fields: Sequence[str], updated_since: Optional[datetime] = None, batch_size: int = 1000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream the given fields of every paper (changed since updated_since) in batches.
+
+        Rows come from a server-side cursor, so memory stays bounded by batch_size at any table size.
+        """
+        stmt = _export_statement(fields, updated_since).execution_options(yield_per=batch_size)
+        result = await self.session.stream(stmt)
+        async for rows in result.mappings().partitions(batch_size):
+            yield [dict(row) for row in rows]
+
+    async def get_section_index(self, arxiv_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Index, title and content length ("chars") of each section of a paper.
+
+        Returns:
+            Section summaries (empty without sections), or None if there is no such paper
+        """
+        if compression_enabled():
+            # Compressed columns are opaque to Postgres: load and decompress them here
+            row = (await self.session.execute(select(Paper.sections).where(Paper.arxiv_id == arxiv_id))).first()
+            return None if row is None else _section_summaries(row.sections)
+
+        row = (await self.session.execute(_SECTION_INDEX, {"arxiv_id": arxiv_id})).first()
+        return None if row is None else row.sections or []
+
+    async def get_section(self, arxiv_id: str, index: int) -> Optional[Tuple[int, Optional[Dict[str, Any]]]]:
+        """
+        One section of a paper, by position.
+
+        Returns:
+            (number of sections, the section or None if index is out of range), or None if there is no such paper
+        """
+        if compression_enabled():
+            row = (await self.session.execute(select(Paper.sections).where(Paper.arxiv_id == arxiv_id))).first()
+            if row is None:
+                return None
+            sections = row.sections if isinstance(row.sections, list) else []
+            return len(sections), sections[index] if index < len(sections) else None
+
+        row = (await self.session.execute(_SECTION, {"arxiv_id": arxiv_id, "index": index})).first()
+        return None if row is None else (row.total, row.section)
+
+    async def get_raw_text_range(
+        self, arxiv_id: str, offset: int, length: Optional[int], unit: Literal["chars", "bytes"] = "chars"
+    ) -> Optional[Tuple[Optional[int], Any]]:
+        """
+        A slice of a paper's raw text, in characters (str) or UTF-8 bytes (bytes); length None reads to the end.
+
+        Returns:
+            (total length of the raw text in the unit, the slice), both None without raw text;
+            or None if there is no such paper
+        """
+        if compression_enabled():
+            row = (await self.session.execute(select(Paper.raw_text).where(Paper.arxiv_id == arxiv_id))).first()
+            if row is None:
+                return None
+            if row.raw_text is None:
+                return None, None
+            raw_text = row.raw_text.encode("utf-8") if unit == "bytes" else row.raw_text
+            return len(raw_text), raw_text[offset : offset + length if length is not None else None]
+
+        statement = _TEXT_BYTES if unit == "bytes" else _TEXT_CHARS
+        row = (await self.session.execute(statement, {"arxiv_id": arxiv_id, "offset": offset, "length": length})).first()
+        if row is None:
+            return None
+        return row.total, bytes(row.slice) if isinstance(row.slice, memoryview) else row.slice
+
+    async def get_estimated_count(self) -> int:
+        estimate = await self.session.scalar(_ESTIMATED_COUNT)
+        return -1 if estimate is None else int(estimate)
+
+    async def get_processed_papers(self, limit: int = 100, offset: int = 0) -> List[Paper]:
+        """Get papers that have been successfully processed with PDF content."""
+        stmt = (
+            select(Paper)
+            .where(Paper.pdf_processed == True)
+            .order_by(Paper.pdf_processing_date.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return list(await self.session.scalars(stmt))
+
+    async def get_unprocessed_papers(self, limit: int = 100, offset: int = 0) -> List[Paper]:
+        """Get papers that haven't been processed for PDF content yet."""
+        stmt = select(Paper).where(Paper.pdf_processed == False).order_by(Paper.published_date.desc()).limit(limit).offset(offset)
+        return list(await self.session.scalars(stmt))
+
+    async def get_papers_with_raw_text(self, limit: int = 100, offset: int = 0) -> List[Paper]:
+        """Get papers that have raw text content stored."""
+        stmt = select(Paper).where(Paper.raw_text != None).order_by(Paper.pdf_processing_date.desc()).limit(limit).offset(offset)
+        return list(await self.session.scalars(stmt))
+
+    async def get_processing_stats(self) -> dict:
+        """Get statistics about PDF processing status in a single pass over papers."""
+        return processing_stats(*(await self.session.execute(_PROCESSING_STATS)).one())
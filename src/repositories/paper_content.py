@@ -0,0 +1,114 @@
+import hashlib
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from pydantic_core import to_json
+from sqlalchemy import case, delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from src.content_coding import compress
+from src.models.paper_content import PaperContentBlob
+from src.schemas.arxiv.paper import PaperContent
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# Paper fields content bodies are built from: a write that sets any of them outdates the stored bodies
+CONTENT_FIELDS = frozenset(PaperContent.model_fields) - {"arxiv_id"}
+
+
+def content_digest(body: bytes) -> str:
+    """Digest identifying one version of a content body (used for ETags)."""
+    return hashlib.sha256(body).hexdigest()[:32]
+
+
+def build_content_blobs(content: PaperContent, encodings: Sequence[str], levels: Dict[str, int]) -> List[Dict[str, Any]]:
+    """
+    Serialize paper content once and compress it for each content coding, at the coding's level in levels.
+
+    Returns:
+        paper_content_blobs rows, one per coding
+    """
+    body = to_json(content)
+    digest = content_digest(body)
+    return [
+        {
+            "arxiv_id": content.arxiv_id,
+            "encoding": encoding,
+            "digest": digest,
+            "size": len(body),
+            "body": compress(body, encoding, levels[encoding]),
+        }
+        for encoding in encodings
+    ]
+
+
+def _best_blob_statement(arxiv_id: str, encodings: Sequence[str]):
+    """The stored blob in the first of encodings that exists (body included)."""
+    preference = case({encoding: index for index, encoding in enumerate(encodings)}, value=PaperContentBlob.encoding)
+    return (
+        select(PaperContentBlob)
+        .where(PaperContentBlob.arxiv_id == arxiv_id, PaperContentBlob.encoding.in_(encodings))
+        .order_by(preference)
+        .limit(1)
+    )
+
+
+class PaperContentRepository:
+    """Precompressed paper content bodies, written by ingestion. Methods only flush; the caller commits."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def upsert(self, blobs: List[Dict[str, Any]]) -> int:
+        """
+        Insert or replace blobs (rows from build_content_blobs).
+
+        Returns:
+            Number of blobs written
+        """
+        if not blobs:
+            return 0
+        now = datetime.now(timezone.utc)
+        stmt = insert(PaperContentBlob).values([{**blob, "updated_at": now} for blob in blobs])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PaperContentBlob.arxiv_id, PaperContentBlob.encoding],
+            set_={
+                "digest": stmt.excluded.digest,
+                "size": stmt.excluded.size,
+                "body": stmt.excluded.body,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        self.session.execute(stmt)
+        self.session.flush()
+        return len(blobs)
+
+    def replace(self, blobs_by_paper: Dict[str, List[Dict[str, Any]]]) -> int:
+        """
+        Make the given blobs (rows from build_content_blobs) the only stored bodies of their papers.
+
+        A paper mapped to no blobs loses its stored bodies, as do codings no longer precomputed,
+        so the API never prefers an outdated body to the papers table.
+
+        Returns:
+            Number of blobs written
+        """
+        if not blobs_by_paper:
+            return 0
+        self.session.execute(delete(PaperContentBlob).where(PaperContentBlob.arxiv_id.in_(list(blobs_by_paper))))
+        return self.upsert([blob for blobs in blobs_by_paper.values() for blob in blobs])
+
+
+class AsyncPaperContentRepository:
+    """Read-only access to precompressed paper content, for async API endpoints."""
+
+    def __init__(self, session: "AsyncSession"):
+        self.session = session
+
+    async def get_best(self, arxiv_id: str, encodings: Sequence[str]) -> Optional[PaperContentBlob]:
+        """Get the blob of a paper in the first of encodings (best first) that was precomputed, if any."""
+        if not encodings:
+            return None
+        return await self.session.scalar(_best_blob_statement(arxiv_id, encodings))
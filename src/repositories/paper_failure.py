@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from src.models.paper_failure import DeadLetterPaper, PaperFailure
+
+
+class PaperFailureRepository:
+    """
+    Persistence for per-paper ingestion failures and the dead-letter table.
+
+    Methods only flush; the caller owns the transaction and commits.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_by_arxiv_id(self, arxiv_id: str) -> Optional[PaperFailure]:
+        stmt = select(PaperFailure).where(PaperFailure.arxiv_id == arxiv_id)
+        return self.session.scalar(stmt)
+
+    def get_due(self, now: Optional[datetime] = None, limit: int = 50) -> List[PaperFailure]:
+        """Get failures whose next retry time has passed, oldest first."""
+        now = now or datetime.now(timezone.utc)
+        stmt = (
+            select(PaperFailure)
+            .where(PaperFailure.next_retry_at <= now)
+            .order_by(PaperFailure.next_retry_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(self.session.scalars(stmt))
+
+    def get_dead_letters(self, limit: int = 100, offset: int = 0) -> List[DeadLetterPaper]:
+        stmt = select(DeadLetterPaper).order_by(DeadLetterPaper.dead_lettered_at.desc()).limit(limit).offset(offset)
+        return list(self.session.scalars(stmt))
+
+    def record_failure(
+        self,
+        arxiv_id: str,
+        stage: str,
+        error_class: str,
+        error_message: str,
+        payload: Dict[str, Any],
+        retry_delay: Callable[[int], timedelta],
+    ) -> PaperFailure:
+        """
+        Create or update the failure record of a paper, incrementing its attempt count.
+
+        Args:
+            arxiv_id: arXiv ID of the failed paper
+            stage: Pipeline stage that failed (download, parse or store)
+            error_class: Exception class name
+            error_message: Exception message
+            payload: Data needed to re-run the failed stage
+            retry_delay: Maps the new attempt count to the delay before the next retry
+
+        Returns:
+            The updated failure record
+        """
+        now = datetime.now(timezone.utc)
+        failure = self.get_by_arxiv_id(arxiv_id)
+        if failure is None:
+            failure = PaperFailure(arxiv_id=arxiv_id, attempts=0, first_failed_at=now)
+            self.session.add(failure)
+
+        failure.stage = stage
+        failure.error_class = error_class
+        failure.error_message = error_message
+        failure.payload = payload
+        failure.attempts = (failure.attempts or 0) + 1
+        failure.next_retry_at = now + retry_delay(failure.attempts)
+        failure.last_failed_at = now
+        self.session.flush()
+        return failure
+
+    def move_to_dead_letter(self, failure: PaperFailure) -> DeadLetterPaper:
+        """Move an exhausted failure to the dead-letter table."""
+        self.session.execute(delete(DeadLetterPaper).where(DeadLetterPaper.arxiv_id == failure.arxiv_id))
+        dead_letter = DeadLetterPaper(
+            arxiv_id=failure.arxiv_id,
+            stage=failure.stage,
+            error_class=failure.error_class,
+            error_message=failure.error_message,
+            attempts=failure.attempts,
+            payload=failure.payload,
+            first_failed_at=failure.first_failed_at,
+        )
+        self.session.add(dead_letter)
+        self.session.delete(failure)
+        self.session.flush()
+        return dead_letter
+
+    def resolve(self, arxiv_ids: Iterable[str]) -> int:
+        """
+        Clear failure and dead-letter records of papers that have now been ingested.
+
+        Returns:
+            Number of failure records removed
+        """
+        arxiv_ids = list(arxiv_ids)
+        if not arxiv_ids:
+            return 0
+        result = self.session.execute(delete(PaperFailure).where(PaperFailure.arxiv_id.in_(arxiv_ids)))
+        self.session.execute(delete(DeadLetterPaper).where(DeadLetterPaper.arxiv_id.in_(arxiv_ids)))
+        return result.rowcount or 0
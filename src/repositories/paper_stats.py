@@ -0,0 +1,167 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from src.models.paper import Paper
+from src.models.paper_stats import STATS_SCOPE_ALL, STATS_SCOPE_CATEGORY, STATS_SCOPE_DAY, PaperStats
+
+# State of one paper as far as the counters are concerned: (publication day, categories, processed, has text)
+PaperState = Tuple[str, Tuple[str, ...], bool, bool]
+
+_SNAPSHOT_BATCH_SIZE = 1000
+
+_REBUILD_SQL = text(
+    """
+    INSERT INTO paper_stats (scope, key, total_papers, processed_papers, papers_with_text, updated_at)
+    SELECT :all_scope, '', count(*), count(*) FILTER (WHERE pdf_processed), count(*) FILTER (WHERE raw_text IS NOT NULL), :now
+    FROM papers
+    UNION ALL
+    SELECT :day_scope, to_char(published_date, 'YYYY-MM-DD'), count(*), count(*) FILTER (WHERE pdf_processed),
+           count(*) FILTER (WHERE raw_text IS NOT NULL), :now
+    FROM papers GROUP BY 2
+    UNION ALL
+    SELECT :category_scope, category, count(*), count(*) FILTER (WHERE pdf_processed),
+           count(*) FILTER (WHERE raw_text IS NOT NULL), :now
+    FROM papers CROSS JOIN LATERAL jsonb_array_elements_text(categories) AS c(category) GROUP BY 2
+    """
+)
+
+
+def processing_stats(total_papers: int, processed_papers: int, papers_with_text: int) -> Dict[str, Any]:
+    """Build the processing statistics dictionary reported by the repositories."""
+    return {
+        "total_papers": total_papers,
+        "processed_papers": processed_papers,
+        "papers_with_text": papers_with_text,
+        "processing_rate": (processed_papers / total_papers * 100) if total_papers > 0 else 0,
+        "text_extraction_rate": (papers_with_text / processed_papers * 100) if processed_papers > 0 else 0,
+    }
+
+
+class PaperStatsRepository:
+    """
+    Incrementally maintained paper counters (overall, per publication day and per category).
+
+    Writers snapshot the affected papers before and after changing them and apply the difference,
+    so reads never scan the papers table. Methods only flush; the caller commits.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def snapshot(self, arxiv_ids: Iterable[str]) -> Dict[str, PaperState]:
+        """Get the counter-relevant state of the given papers (papers not in the database are omitted)."""
+        arxiv_ids = list(arxiv_ids)
+        states: Dict[str, PaperState] = {}
+        for start in range(0, len(arxiv_ids), _SNAPSHOT_BATCH_SIZE):
+            stmt = select(
+                Paper.arxiv_id,
+                Paper.published_date,
+                Paper.categories,
+                Paper.pdf_processed,
+                Paper.raw_text.isnot(None),
+            ).where(Paper.arxiv_id.in_(arxiv_ids[start : start + _SNAPSHOT_BATCH_SIZE]))
+            for arxiv_id, published_date, categories, processed, has_text in self.session.execute(stmt):
+                states[arxiv_id] = (published_date.strftime("%Y-%m-%d"), tuple(categories or ()), bool(processed), bool(has_text))
+        return states
+
+    def apply_changes(self, before: Dict[str, PaperState], after: Dict[str, PaperState]) -> int:
+        """
+        Update the counters by the difference between two snapshots of the same papers.
+
+        Returns:
+            Number of counter rows changed
+        """
+        deltas: Dict[Tuple[str, str], List[int]] = {}
+
+        def add(state: Optional[PaperState], sign: int) -> None:
+            if state is None:
+                return
+            day, categories, processed, has_text = state
+            keys = [(STATS_SCOPE_ALL, ""), (STATS_SCOPE_DAY, day)] + [(STATS_SCOPE_CATEGORY, c) for c in set(categories)]
+            for key in keys:
+                delta = deltas.setdefault(key, [0, 0, 0])
+                delta[0] += sign
+                delta[1] += sign * processed
+                delta[2] += sign * has_text
+
+        for arxiv_id in set(before) | set(after):
+            if before.get(arxiv_id) != after.get(arxiv_id):
+                add(before.get(arxiv_id), -1)
+                add(after.get(arxiv_id), 1)
+
+        # Sorted keys keep concurrent writers locking counter rows in the same order
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "scope": scope,
+                "key": key,
+                "total_papers": total,
+                "processed_papers": processed,
+                "papers_with_text": with_text,
+                "updated_at": now,
+            }
+            for (scope, key), (total, processed, with_text) in sorted(deltas.items())
+            if total or processed or with_text
+        ]
+        if not rows:
+            return 0
+
+        stmt = insert(PaperStats).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PaperStats.scope, PaperStats.key],
+            set_={
+                "total_papers": PaperStats.total_papers + stmt.excluded.total_papers,
+                "processed_papers": PaperStats.processed_papers + stmt.excluded.processed_papers,
+                "papers_with_text": PaperStats.papers_with_text + stmt.excluded.papers_with_text,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        self.session.execute(stmt)
+        self.session.flush()
+        return len(rows)
+
+    def get_totals(self) -> Optional[Dict[str, Any]]:
+        """Get the overall processing statistics, or None if the counters were never built."""
+        stats = self.session.get(PaperStats, (STATS_SCOPE_ALL, ""))
+        if stats is None:
+            return None
+        return processing_stats(stats.total_papers, stats.processed_papers, stats.papers_with_text)
+
+    def get_breakdown(self, scope: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get processing statistics per key of a scope (day or category).
+
+        Days are returned newest first, categories largest first.
+        """
+        order = PaperStats.key.desc() if scope == STATS_SCOPE_DAY else PaperStats.total_papers.desc()
+        stmt = select(PaperStats).where(PaperStats.scope == scope, PaperStats.total_papers > 0).order_by(order).limit(limit)
+        return [
+            {"key": stats.key, **processing_stats(stats.total_papers, stats.processed_papers, stats.papers_with_text)}
+            for stats in self.session.scalars(stmt)
+        ]
+
+    def rebuild(self) -> int:
+        """
+        Recompute all counters from the papers table in one pass per scope.
+
+        Used to initialize the table on an existing corpus or to correct drift.
+
+        Returns:
+            Number of counter rows written
+        """
+        self.session.execute(text("LOCK TABLE paper_stats IN EXCLUSIVE MODE"))
+        self.session.execute(text("DELETE FROM paper_stats"))
+        result = self.session.execute(
+            _REBUILD_SQL,
+            {
+                "all_scope": STATS_SCOPE_ALL,
+                "day_scope": STATS_SCOPE_DAY,
+                "category_scope": STATS_SCOPE_CATEGORY,
+                "now": datetime.now(timezone.utc),
+            },
+        )
+        self.session.flush()
+        return result.rowcount or 0
@@ -0,0 +1,37 @@
+from typing import Any, Dict, Iterable
+
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+def model_to_json(model: BaseModel) -> bytes:
+    """Serialize a model to JSON bytes directly, without an intermediate str (pages can be many MB)."""
+    return to_json(model)
+
+
+class ModelResponse(JSONResponse):
+    """
+    JSON response serialized straight from a pydantic model by pydantic-core.
+
+    Returning a model from an endpoint makes FastAPI dump it to a dict, validate that against
+    response_model again and run it through jsonable_encoder before encoding. Endpoints that
+    already built their response model return ModelResponse(model) to skip all of that;
+    keep response_model on the route for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return model_to_json(content)
+        return super().render(content)
+
+
+class NDJSONResponse(StreamingResponse):
+    """Streamed newline-delimited JSON, one object per line."""
+
+    media_type = "application/x-ndjson"
+
+
+def ndjson_lines(rows: Iterable[Dict[str, Any]]) -> bytes:
+    """Serialize rows to NDJSON (datetimes and UUIDs as strings, like the JSON responses)."""
+    return b"".join(to_json(row) + b"\n" for row in rows)
@@ -0,0 +1,4 @@
+# Prefix of the versioned API. Routers carry it themselves (instead of getting it from include_router),
+# so every route's path is its full template whatever FastAPI version is installed: metrics and
+# admission control (src.admission.AdmittedRoute) key routes by it.
+API_PREFIX = "/api/v1"
@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Response
+from src.admission import AdmittedRoute
+from src.metrics import render_metrics
+
+router = APIRouter(route_class=AdmittedRoute)
+
+
+@router.get("/metrics", tags=["Monitoring"], include_in_schema=False)
+def metrics() -> Response:
+    """Expose Prometheus metrics for scraping."""
+    payload, content_type = render_metrics()
+    return Response(content=payload, media_type=content_type)
@@ -1,40 +1,400 @@
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+import asyncio
+import json
+import re
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, AsyncIterator, List, Literal, Optional, Tuple
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Response
 from sqlalchemy.orm import Session
-from src.dependencies import SessionDep
-from src.repositories.paper import PaperRepository
-from src.schemas.arxiv.paper import PaperResponse, PaperSearchResponse
+from src.admission import AdmittedRoute
+from src.content_coding import acceptable, offered_encodings
+from src.db.interfaces.base import BaseDatabase
+from src.dependencies import AsyncSessionDep, DatabaseDep, PaperCacheDep, PaperCountDep, SettingsDep
+from src.exceptions import InvalidCursorError
+from src.repositories.paper import (
+    AsyncPaperRepository,
+    decode_cursor,
+    decode_search_cursor,
+    encode_cursor,
+    encode_search_cursor,
+    split_arxiv_id,
+)
+from src.repositories.paper_content import AsyncPaperContentRepository, content_digest
+from src.responses import ModelResponse, NDJSONResponse, model_to_json, ndjson_lines
+from src.routers import API_PREFIX
+from src.schemas.arxiv.paper import (
+    PaperBatchRequest,
+    PaperBatchResponse,
+    PaperContent,
+    PaperFilters,
+    PaperListResponse,
+    PaperResponse,
+    PaperSearchHit,
+    PaperSearchResponse,
+    PaperSearchResults,
+    PaperSectionIndex,
+    PaperSectionResponse,
+    PaperSummary,
+    PaperSummaryListResponse,
+    PaperTextRange,
+)
+from src.services.cache.client import CachedResponse, etag_matches, make_etag
 
-router = APIRouter(prefix="/papers", tags=["papers"])
+router = APIRouter(prefix=f"{API_PREFIX}/papers", tags=["papers"], route_class=AdmittedRoute)
 
 
-@router.get("/", response_model=PaperSearchResponse)
-def list_papers(
-    db: SessionDep,
+@router.get("/", response_model=PaperListResponse)
+async def list_papers(
+    db: AsyncSessionDep,
+    paper_count: PaperCountDep,
     limit: int = Query(default=10, ge=1, le=100, description="Number of papers to return (1-100)"),
-    offset: int = Query(default=0, ge=0, description="Number of papers to skip"),
-) -> PaperSearchResponse:
-    """Get a list of papers with pagination."""
-    paper_repo = PaperRepository(db)
-    papers = paper_repo.get_all(limit=limit, offset=offset)
+    cursor: Optional[str] = Query(default=None, description="next_cursor of the previous page"),
+    offset: int = Query(default=0, ge=0, deprecated=True, description="Number of papers to skip (use cursor instead)"),
+    view: Literal["summary", "full"] = Query(
+        default="summary", description="summary omits the parsed PDF content, full includes raw text and sections"
+    ),
+    category: Optional[str] = Query(default=None, description="Only papers in this arXiv category (e.g. cs.CL)"),
+    published_from: Optional[date] = Query(default=None, alias="from", description="Published on or after this date"),
+    published_to: Optional[date] = Query(default=None, alias="to", description="Published on or before this date"),
+    processed: Optional[bool] = Query(default=None, description="Only papers whose PDF was (or was not) processed"),
+) -> ModelResponse:
+    """Get a list of papers, newest first, with cursor pagination and optional filters."""
+    summary = view == "summary"
+    if cursor and offset:
+        raise HTTPException(status_code=400, detail="Use either cursor or offset, not both")
+    if published_from and published_to and published_from > published_to:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+
+    filters = PaperFilters(
+        category=category,
+        published_from=datetime.combine(published_from, time.min) if published_from else None,
+        published_to=datetime.combine(published_to + timedelta(days=1), time.min) if published_to else None,
+        processed=processed,
+    )
+
+    paper_repo = AsyncPaperRepository(db)
+    if offset:
+        papers = await paper_repo.get_all(limit=limit, offset=offset, summary=summary, filters=filters)
+        next_cursor = None
+    else:
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # Fetch one extra row to know whether another page follows
+        papers = await paper_repo.get_page(limit=limit + 1, after=after, summary=summary, filters=filters)
+        next_cursor = encode_cursor(papers[limit - 1]) if len(papers) > limit else None
+        papers = papers[:limit]
+
+    if filters.is_empty:
+        # Unfiltered total comes from the background-refreshed count, not a COUNT(*) per request
+        total = paper_count.total
+        if total is None:
+            total = await asyncio.to_thread(paper_count.refresh)
+        total_is_estimate = paper_count.is_estimate
+    else:
+        # Cached per filter combination, and estimated when too many papers match to count them cheaply
+        total, total_is_estimate = await paper_count.count_filtered(paper_repo, filters)
+
+    # One validation pass over the ORM rows, then serialized by pydantic-core without FastAPI re-encoding it
+    response_model = PaperSummaryListResponse if summary else PaperSearchResponse
+    page = {"papers": papers, "total": total, "total_is_estimate": total_is_estimate, "next_cursor": next_cursor}
+    return ModelResponse(response_model.model_validate(page, from_attributes=True))
+
+
+# Registered before /{arxiv_id} so "search" is never taken for a paper ID
+@router.get("/search", response_model=PaperSearchResults)
+async def search_papers(
+    db: AsyncSessionDep,
+    q: str = Query(..., min_length=1, max_length=500, description='Search query, e.g. transformer "machine translation" -vision'),
+    limit: int = Query(default=10, ge=1, le=100, description="Number of hits to return (1-100)"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor of the previous page"),
+) -> ModelResponse:
+    """Full-text search over paper titles, abstracts and content, best match first."""
+    try:
+        after = decode_search_cursor(cursor) if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    paper_repo = AsyncPaperRepository(db)
+    rows = await paper_repo.search(q, limit=limit + 1, after=after)
+    next_cursor = encode_search_cursor(rows[limit - 1][1], rows[limit - 1][0].id) if len(rows) > limit else None
+
+    hits = [
+        PaperSearchHit(**PaperSummary.model_validate(paper).model_dump(), rank=rank, headline=headline)
+        for paper, rank, headline in rows[:limit]
+    ]
+    return ModelResponse(PaperSearchResults(query=q, hits=hits, next_cursor=next_cursor))
+
+
+# Fields an export or batch lookup can project, and the default export projection (listing fields plus the resume position)
+EXPORT_FIELDS = tuple(PaperResponse.model_fields)
+DEFAULT_EXPORT_FIELDS = (*PaperSummary.model_fields, "updated_at")
+EXPORT_BATCH_SIZE = 1000
+
 
-    # Get total count for pagination info
-    total = paper_repo.get_count()
+async def _export_chunks(database: BaseDatabase, fields: List[str], updated_since: Optional[datetime]) -> AsyncIterator[bytes]:
+    # The session lives inside the generator: it has to stay open until the last row is sent
+    async with database.get_async_session() as session:
+        async for rows in AsyncPaperRepository(session).stream_export(fields, updated_since, batch_size=EXPORT_BATCH_SIZE):
+            yield ndjson_lines(rows)
 
-    return PaperSearchResponse(papers=[PaperResponse.model_validate(paper) for paper in papers], total=total)
 
+@router.get(
+    "/export",
+    response_class=NDJSONResponse,
+    responses={200: {"description": "One JSON object per line", "content": {"application/x-ndjson": {}}}},
+)
+async def export_papers(
+    database: DatabaseDep,
+    fields: Optional[str] = Query(
+        default=None,
+        description=f"Comma-separated fields to export (default: {','.join(DEFAULT_EXPORT_FIELDS)}). "
+        f"Available: {','.join(EXPORT_FIELDS)}",
+    ),
+    updated_since: Optional[datetime] = Query(
+        default=None, description="Only papers created or changed at or after this time (inclusive), for incremental exports"
+    ),
+) -> NDJSONResponse:
+    """
+    Stream the whole corpus (or the papers changed since updated_since) as NDJSON in one request.
+
+    Papers are ordered by (updated_at, id), oldest change first: pass the last exported updated_at
+    as updated_since to continue an interrupted or incremental export. Rows at exactly that time
+    are exported again, so consumers should upsert by arxiv_id. The stream is compressed as
+    negotiated with Accept-Encoding, like every other response.
+    """
+    selected = [field.strip() for field in fields.split(",") if field.strip()] if fields else list(DEFAULT_EXPORT_FIELDS)
+    unknown = sorted(set(selected) - set(EXPORT_FIELDS))
+    if unknown or not selected:
+        raise HTTPException(status_code=400, detail=f"Unknown export fields: {', '.join(unknown) or '(none given)'}")
+    if updated_since is not None and updated_since.tzinfo is not None:
+        # Timestamps are stored as naive UTC
+        updated_since = updated_since.astimezone(timezone.utc).replace(tzinfo=None)
+
+    chunks = _export_chunks(database, list(dict.fromkeys(selected)), updated_since)
+    return NDJSONResponse(chunks, headers={"Content-Disposition": 'attachment; filename="papers.ndjson"'})
+
+
+@router.post("/batch", response_model=PaperBatchResponse)
+async def get_papers_batch(request: PaperBatchRequest, database: DatabaseDep, cache: PaperCacheDep) -> ModelResponse:
+    """
+    Resolve many arXiv IDs (e.g. a reading list) in one request instead of one GET per paper.
+
+    Versioned IDs are answered from the paper response cache where possible; all other IDs are
+    resolved with a single query. IDs without a stored paper are listed in missing.
+    """
+    fields = list(dict.fromkeys(request.fields)) if request.fields else list(EXPORT_FIELDS)
+    unknown = sorted(set(fields) - set(EXPORT_FIELDS))
+    if unknown or not fields:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown) or '(none given)'}")
+    arxiv_ids = list(dict.fromkeys(request.ids))
 
-@router.get("/{arxiv_id}", response_model=PaperResponse)
-def get_paper_details(
-    db: SessionDep,
+    # Cache entries are keyed by stored (versioned) ID; a version-less ID needs the database to find the latest version
+    cached = await cache.get_many([arxiv_id for arxiv_id in arxiv_ids if split_arxiv_id(arxiv_id)[1] is not None])
+    found = {}
+    for arxiv_id, response in cached.items():
+        paper = json.loads(response.body)
+        found[arxiv_id] = {field: paper[field] for field in fields}
+
+    remaining = [arxiv_id for arxiv_id in arxiv_ids if arxiv_id not in found]
+    if remaining:
+        async with database.get_async_session() as session:
+            found.update(await AsyncPaperRepository(session).get_many(remaining, fields))
+
+    papers = {arxiv_id: found[arxiv_id] for arxiv_id in arxiv_ids if arxiv_id in found}
+    missing = [arxiv_id for arxiv_id in arxiv_ids if arxiv_id not in found]
+    return ModelResponse(PaperBatchResponse(papers=papers, missing=missing))
+
+
+@router.get(
+    "/{arxiv_id}",
+    response_model=PaperResponse,
+    responses={304: {"description": "Not modified: the If-None-Match header matches the current ETag"}},
+)
+async def get_paper_details(
+    database: DatabaseDep,
+    cache: PaperCacheDep,
     arxiv_id: str = Path(
         ..., description="arXiv paper ID (e.g., '2401.00001' or '2401.00001v1')", regex=r"^\d{4}\.\d{4,5}(v\d+)?$"
     ),
-) -> PaperResponse:
-    """Get details of a specific paper by arXiv ID."""
-    paper_repo = PaperRepository(db)
-    paper = paper_repo.get_by_arxiv_id(arxiv_id)
+    if_none_match: Optional[str] = Header(default=None),
+) -> Response:
+    """
+    Get details of a specific paper by arXiv ID.
+
+    Responses are cached pre-serialized and carry a strong ETag; a matching If-None-Match gets 304.
+    """
+    cached = await cache.get(arxiv_id)
+    if cached is None:
+        async with database.get_async_session() as session:
+            paper = await AsyncPaperRepository(session).get_by_arxiv_id(arxiv_id)
+            if not paper:
+                raise HTTPException(status_code=404, detail="Paper not found")
+            cached = CachedResponse(
+                etag=make_etag(paper.arxiv_id, paper.updated_at),
+                body=model_to_json(PaperResponse.model_validate(paper)),
+            )
+        await cache.set(arxiv_id, cached)
+
+    # no-cache: clients may store the response but must revalidate it with If-None-Match
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
 
+@router.get(
+    "/{arxiv_id}/content",
+    response_model=PaperContent,
+    responses={304: {"description": "Not modified: the If-None-Match header matches the current ETag"}},
+)
+async def get_paper_content(
+    db: AsyncSessionDep,
+    settings: SettingsDep,
+    arxiv_id: str = Path(
+        ..., description="arXiv paper ID (e.g., '2401.00001' or '2401.00001v1')", regex=r"^\d{4}\.\d{4,5}(v\d+)?$"
+    ),
+    accept_encoding: Optional[str] = Header(default=None),
+    if_none_match: Optional[str] = Header(default=None),
+) -> Response:
+    """
+    Get the parsed PDF content of a paper (raw text, sections and references).
+
+    Bodies compressed at ingestion are sent as stored in the best coding the client accepts,
+    without compressing anything per request.
+    """
+    # no-cache: clients may store the response but must revalidate it with If-None-Match
+    headers = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+    encodings = acceptable(accept_encoding, offered_encodings(settings.compression.precompute_encodings))
+    blob = await AsyncPaperContentRepository(db).get_best(arxiv_id, encodings)
+    if blob is not None:
+        headers["ETag"] = f'"{blob.digest}.{blob.encoding}"'
+        if etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        headers["Content-Encoding"] = blob.encoding
+        return Response(content=blob.body, media_type="application/json", headers=headers)
+
+    # Not precomputed (or the client accepts none of the stored codings): serialize from the paper
+    paper = await AsyncPaperRepository(db).get_by_arxiv_id(arxiv_id)
     if not paper:
         raise HTTPException(status_code=404, detail="Paper not found")
+    body = model_to_json(PaperContent.model_validate(paper))
+    headers["ETag"] = f'"{content_digest(body)}"'
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+ARXIV_ID_PATTERN = r"^\d{4}\.\d{4,5}(v\d+)?$"
+# Characters returned per raw text range when no length is given, and the most one request may ask for
+TEXT_RANGE_DEFAULT_CHARS = 20_000
+TEXT_RANGE_MAX_CHARS = 1_000_000
+
+_BYTE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+@router.get("/{arxiv_id}/sections", response_model=PaperSectionIndex)
+async def get_paper_sections(
+    db: AsyncSessionDep,
+    arxiv_id: str = Path(..., description="arXiv paper ID (e.g., '2401.00001' or '2401.00001v1')", regex=ARXIV_ID_PATTERN),
+) -> ModelResponse:
+    """List the sections of a paper (titles and sizes only) to fetch them one by one from /sections/{index}."""
+    sections = await AsyncPaperRepository(db).get_section_index(arxiv_id)
+    if sections is None:
+        raise HTTPException(status_code=404, detail="Paper not found")
+    return ModelResponse(PaperSectionIndex(arxiv_id=arxiv_id, sections=sections))
+
+
+@router.get("/{arxiv_id}/sections/{index}", response_model=PaperSectionResponse)
+async def get_paper_section(
+    db: AsyncSessionDep,
+    arxiv_id: str = Path(..., description="arXiv paper ID (e.g., '2401.00001' or '2401.00001v1')", regex=ARXIV_ID_PATTERN),
+    index: int = Path(..., ge=0, description="Section index from /sections"),
+) -> ModelResponse:
+    """Get one section of a paper."""
+    found = await AsyncPaperRepository(db).get_section(arxiv_id, index)
+    if found is None:
+        raise HTTPException(status_code=404, detail="Paper not found")
+    total, section = found
+    if section is None:
+        raise HTTPException(status_code=404, detail=f"Section not found (the paper has {total} sections)")
+    return ModelResponse(PaperSectionResponse(arxiv_id=arxiv_id, index=index, total=total, section=section))
+
+
+def _parse_byte_range(range_header: Optional[str]) -> Optional[Tuple[Optional[int], Optional[int]]]:
+    """
+    (first, last) byte of a single-part Range header; first is None for a suffix range (last = byte count).
+
+    Returns None without a Range header or for forms that are not supported (multi-part, other units),
+    in which case the whole representation is sent, as RFC 9110 allows.
+    """
+    match = _BYTE_RANGE.match(range_header.strip()) if range_header else None
+    if match is None or not any(match.groups()):
+        return None
+    first = int(match.group(1)) if match.group(1) else None
+    last = int(match.group(2)) if match.group(2) else None
+    if first is not None and last is not None and last < first:
+        return None
+    return first, last
+
+
+def _raw_text_or_404(found: Optional[Tuple[Optional[int], Any]]) -> Tuple[int, Any]:
+    if found is None:
+        raise HTTPException(status_code=404, detail="Paper not found")
+    if found[0] is None:
+        raise HTTPException(status_code=404, detail="Paper has no raw text")
+    return found
+
+
+@router.get("/{arxiv_id}/raw_text", response_model=PaperTextRange)
+async def get_paper_text(
+    db: AsyncSessionDep,
+    arxiv_id: str = Path(..., description="arXiv paper ID (e.g., '2401.00001' or '2401.00001v1')", regex=ARXIV_ID_PATTERN),
+    offset: int = Query(default=0, ge=0, description="First character to return"),
+    length: int = Query(default=TEXT_RANGE_DEFAULT_CHARS, ge=1, le=TEXT_RANGE_MAX_CHARS, description="Characters to return"),
+) -> ModelResponse:
+    """Get a character range of a paper's raw text; page through it with offset += len(text) until total_chars."""
+    total, text = _raw_text_or_404(await AsyncPaperRepository(db).get_raw_text_range(arxiv_id, offset, length, unit="chars"))
+    return ModelResponse(PaperTextRange(arxiv_id=arxiv_id, offset=offset, total_chars=total, text=text))
+
+
+@router.get(
+    "/{arxiv_id}/raw_text.txt",
+    response_class=Response,
+    responses={
+        200: {"description": "The whole raw text", "content": {"text/plain": {}}},
+        206: {"description": "The requested byte range", "content": {"text/plain": {}}},
+        416: {"description": "The byte range starts beyond the end of the text"},
+    },
+)
+async def get_paper_text_bytes(
+    db: AsyncSessionDep,
+    arxiv_id: str = Path(..., description="arXiv paper ID (e.g., '2401.00001' or '2401.00001v1')", regex=ARXIV_ID_PATTERN),
+    range_header: Optional[str] = Header(default=None, alias="Range", description="bytes=first-last, bytes=first- or bytes=-count"),
+) -> Response:
+    """
+    Get a paper's raw text as UTF-8 plain text, honouring HTTP byte ranges.
+
+    A range may start or end inside a multi-byte character: join the ranges before decoding.
+    """
+    paper_repo = AsyncPaperRepository(db)
+    requested = _parse_byte_range(range_header)
+    if requested is not None and requested[0] is None:
+        # The last N bytes: the start depends on the total length
+        total, _ = _raw_text_or_404(await paper_repo.get_raw_text_range(arxiv_id, 0, 0, unit="bytes"))
+        requested = (max(total - requested[1], 0), None)
+
+    first, last = requested or (0, None)
+    length = last - first + 1 if last is not None else None
+    total, data = _raw_text_or_404(await paper_repo.get_raw_text_range(arxiv_id, first, length, unit="bytes"))
 
-    return PaperResponse.model_validate(paper)
+    headers = {"Accept-Ranges": "bytes"}
+    if requested is None:
+        return Response(content=data, media_type="text/plain; charset=utf-8", headers=headers)
+    if first >= total:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{total}"})
+    headers["Content-Range"] = f"bytes {first}-{first + len(data) - 1}/{total}"
+    return Response(content=data, status_code=206, media_type="text/plain; charset=utf-8", headers=headers)
@@ -1,12 +1,11 @@
-from fastapi import APIRouter
-from sqlalchemy import text
+from fastapi import APIRouter, Response
 
-from ..dependencies import DatabaseDep, SettingsDep
-from ..exceptions import OllamaConnectionError, OllamaException, OllamaTimeoutError
-from ..schemas.api.health import HealthResponse, ServiceStatus
-from ..services.ollama import OllamaClient
+from ..admission import AdmittedRoute
+from ..dependencies import HealthMonitorDep
+from ..schemas.api.health import HealthResponse
+from . import API_PREFIX
 
-router = APIRouter()
+router = APIRouter(prefix=API_PREFIX, route_class=AdmittedRoute)
 
 
 @router.get("/ping", tags=["Health"])
@@ -19,16 +18,17 @@ async def ping():
     "/health",
     response_model=HealthResponse,
     summary="Health check",
-    description="Check the health and status of the API service including database connectivity.",
+    description="Service health with the dependency statuses from the last background probe round.",
     response_description="Service health information",
     tags=["Health"],
 )
-async def health_check(settings: SettingsDep, database: DatabaseDep) -> HealthResponse:
+async def health_check(health_monitor: HealthMonitorDep) -> Response:
     """
-    Comprehensive health check endpoint for monitoring and load balancer probes.
+    Health check endpoint for monitoring and load balancer probes.
 
-    This endpoint provides information about the service health, version,
-    environment, and checks connectivity to dependent services like database.
+    Served from memory: dependencies (database, Ollama, OpenSearch) are probed in the
+    background every health.interval_seconds, so probes never add load on them and the
+    latency does not depend on theirs. checked_at tells when the services were probed.
 
     Returns:
         HealthResponse: Contains service status, version, environment, and service checks
@@ -42,48 +42,27 @@ async def health_check(settings: SettingsDep, database: DatabaseDep) -> HealthRe
             "environment": "development",
             "service_name": "rag-api",
             "services": {
-                "database": {"status": "healthy", "message": "Connected successfully"}
-            }
+                "database": {"status": "healthy", "message": "Connected successfully", "latency_ms": 1.8}
+            },
+            "checked_at": "2024-01-01T12:00:00Z"
         }
         ```
     """
-    services = {}
-    overall_status = "ok"
+    return Response(content=health_monitor.snapshot_json, media_type="application/json")
 
-    # Test database connectivity
-    try:
-        with database.get_session() as session:
-            # Simple query to test connection
-            session.execute(text("SELECT 1"))
-            services["database"] = ServiceStatus(status="healthy", message="Connected successfully")
-    except Exception as e:
-        services["database"] = ServiceStatus(status="unhealthy", message=f"Connection failed: {str(e)}")
-        overall_status = "degraded"
 
-    # Test Ollama service connectivity (Week 1 notebook requirement)
-    try:
-        ollama_client = OllamaClient(settings)
-        ollama_health = await ollama_client.health_check()
-        services["ollama"] = ServiceStatus(status=ollama_health["status"], message=ollama_health["message"])
-        if ollama_health["status"] != "healthy":
-            overall_status = "degraded"
-    except OllamaConnectionError as e:
-        services["ollama"] = ServiceStatus(status="unhealthy", message=f"Cannot connect to Ollama: {str(e)}")
-        overall_status = "degraded"
-    except OllamaTimeoutError as e:
-        services["ollama"] = ServiceStatus(status="unhealthy", message=f"Ollama timeout: {str(e)}")
-        overall_status = "degraded"
-    except OllamaException as e:
-        services["ollama"] = ServiceStatus(status="unhealthy", message=f"Ollama error: {str(e)}")
-        overall_status = "degraded"
-    except Exception as e:
-        services["ollama"] = ServiceStatus(status="unhealthy", message=f"Unexpected Ollama error: {str(e)}")
-        overall_status = "degraded"
+@router.get(
+    "/health/deep",
+    response_model=HealthResponse,
+    summary="Deep health check",
+    description="Probe all dependencies now instead of returning the last background results.",
+    response_description="Service health information",
+    tags=["Health"],
+)
+async def deep_health_check(health_monitor: HealthMonitorDep) -> HealthResponse:
+    """
+    On-demand health check for debugging and deployment verification.
 
-    return HealthResponse(
-        status=overall_status,
-        version=settings.app_version,
-        environment=settings.environment,
-        service_name=settings.service_name,
-        services=services,
-    )
+    Each probe is bounded by health.timeout_seconds; the result also refreshes what /health serves.
+    """
+    return await health_monitor.check()
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Dict, Optional
 
 from pydantic import BaseModel, Field
@@ -8,6 +9,7 @@ class ServiceStatus(BaseModel):
 
     status: str = Field(..., description="Service status", example="healthy")
     message: Optional[str] = Field(None, description="Status message", example="Connected successfully")
+    latency_ms: Optional[float] = Field(None, description="Duration of the last probe in milliseconds", example=1.8)
 
 
 class HealthResponse(BaseModel):
@@ -18,6 +20,7 @@ class HealthResponse(BaseModel):
     environment: str = Field(..., description="Deployment environment", example="development")
     service_name: str = Field(..., description="Service identifier", example="rag-api")
     services: Optional[Dict[str, ServiceStatus]] = Field(None, description="Individual service statuses")
+    checked_at: Optional[datetime] = Field(None, description="When the services were last probed (UTC)")
 
     class Config:
         """Pydantic configuration."""
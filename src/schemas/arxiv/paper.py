@@ -1,7 +1,7 @@
 #
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -69,6 +69,120 @@ class PaperResponse(PaperBase):
         from_attributes = True
 
 
+class PaperContent(BaseModel):
+    """Parsed PDF content of a paper."""
+
+    arxiv_id: str = Field(..., description="arXiv paper ID")
+    raw_text: Optional[str] = Field(None, description="Full raw text extracted from PDF")
+    sections: Optional[List[Dict[str, Any]]] = Field(None, description="List of sections with titles and content")
+    references: Optional[List[Dict[str, Any]]] = Field(None, description="List of references if extracted")
+
+    class Config:
+        from_attributes = True
+
+
+class PaperFilters(BaseModel):
+    """Filters for paper listings (all optional, combined with AND)."""
+
+    category: Optional[str] = Field(None, description="arXiv category the paper must have (e.g. cs.CL)")
+    published_from: Optional[datetime] = Field(None, description="Earliest publication time (inclusive)")
+    published_to: Optional[datetime] = Field(None, description="Latest publication time (exclusive)")
+    processed: Optional[bool] = Field(None, description="Whether the PDF has been processed")
+
+    @property
+    def is_empty(self) -> bool:
+        return all(value is None for value in self.model_dump().values())
+
+
+class PaperSummary(PaperBase):
+    """Compact schema for paper listings, without the parsed PDF content."""
+
+    id: UUID
+    parser_used: Optional[str] = Field(None, description="Which parser was used")
+    pdf_processed: bool = Field(False, description="Whether PDF was successfully processed")
+    pdf_processing_date: Optional[datetime] = Field(None, description="When PDF was processed")
+
+    class Config:
+        from_attributes = True
+
+
+class PaperSearchHit(PaperSummary):
+    """A full-text search match."""
+
+    rank: float = Field(..., description="Relevance (ts_rank), higher is better")
+    headline: Optional[str] = Field(None, description="Abstract excerpt with matches wrapped in <mark> tags")
+
+
+class PaperSearchResults(BaseModel):
+    query: str
+    hits: List[PaperSearchHit]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, None on the last page")
+
+
 class PaperSearchResponse(BaseModel):
+    view: Literal["full"] = "full"
     papers: List[PaperResponse]
     total: int
+    total_is_estimate: bool = Field(False, description="Whether total is an estimate rather than an exact count")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, None on the last page")
+
+
+class PaperSummaryListResponse(BaseModel):
+    view: Literal["summary"] = "summary"
+    papers: List[PaperSummary]
+    total: int
+    total_is_estimate: bool = Field(False, description="Whether total is an estimate rather than an exact count")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, None on the last page")
+
+
+PaperListResponse = Annotated[Union[PaperSummaryListResponse, PaperSearchResponse], Field(discriminator="view")]
+
+
+# Most IDs a batch lookup resolves in one request
+BATCH_MAX_IDS = 500
+
+
+class PaperBatchRequest(BaseModel):
+    """Papers to resolve in one request."""
+
+    ids: List[Annotated[str, Field(pattern=r"^\d{4}\.\d{4,5}(v\d+)?$")]] = Field(
+        ...,
+        min_length=1,
+        max_length=BATCH_MAX_IDS,
+        description="arXiv IDs; a version-less ID (e.g. '2401.00001') resolves to the latest stored version",
+    )
+    fields: Optional[List[str]] = Field(None, description="Fields to return per paper (default: all detail fields)")
+
+
+class PaperBatchResponse(BaseModel):
+    papers: Dict[str, Dict[str, Any]] = Field(..., description="Requested fields of each found paper, by requested ID")
+    missing: List[str] = Field(default_factory=list, description="Requested IDs without a stored paper")
+
+
+class PaperSectionSummary(BaseModel):
+    index: int = Field(..., description="Position of the section, for /sections/{index}")
+    title: Optional[str] = Field(None, description="Section title")
+    chars: int = Field(..., description="Length of the section content in characters")
+
+
+class PaperSectionIndex(BaseModel):
+    """Table of contents of a paper, without the section contents."""
+
+    arxiv_id: str
+    sections: List[PaperSectionSummary]
+
+
+class PaperSectionResponse(BaseModel):
+    arxiv_id: str
+    index: int
+    total: int = Field(..., description="Number of sections of the paper")
+    section: Dict[str, Any] = Field(..., description="The section as stored (title and content)")
+
+
+class PaperTextRange(BaseModel):
+    """A character range of a paper's raw text."""
+
+    arxiv_id: str
+    offset: int = Field(..., description="Position of the first returned character")
+    total_chars: int = Field(..., description="Length of the whole raw text in characters")
+    text: str
@@ -47,6 +47,14 @@ class PdfContent(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Parser metadata")
 
 
+class ParseCostEstimate(BaseModel):
+    """Relative parse cost of a PDF, used to schedule cheap documents first."""
+
+    pages: int = Field(default=0, description="Page count (0 if the PDF could not be opened)")
+    size_bytes: int = Field(default=0, description="File size in bytes")
+    cost: float = Field(default=0.0, description="Estimated cost in page-equivalents")
+
+
 class ArxivMetadata(BaseModel):
     """Paper metadata from arXiv API."""
 
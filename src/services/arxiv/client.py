@@ -1,5 +1,4 @@
 #by taha
-import time
 import asyncio
 import httpx
 import logging
@@ -13,6 +12,8 @@ from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional
 from src.config import ArxivSettings
+from src.services.arxiv.rate_limiter import RateLimiter
+from src.metrics import DOWNLOAD_BYTES, STAGE_ARXIV_QUERY, STAGE_DOWNLOAD, STAGE_ITEMS_TOTAL, track_stage
 from src.schemas.arxiv.paper import ArxivPaper
 from src.exceptions import ArxivAPIException, ArxivAPITimeoutError, ArxivParseError, PDFDownloadException, PDFDownloadTimeoutError
 
@@ -22,10 +23,10 @@ logger = logging.getLogger(__name__)
 
 class ArxivClient:
     """Client for fetching papers from arXiv API"""
-    def __init__(self,settings:ArxivSettings):
+    def __init__(self,settings:ArxivSettings,rate_limiter:Optional[RateLimiter]=None):
         self._settings=settings
-        #To track the time when client made last request for Rate limitting
-        self._last_request_time:Optional[float]=None
+        #Spaces out API requests; pass a SharedRateLimiter to share the limit across processes
+        self._rate_limiter=rate_limiter or RateLimiter(settings.rate_limit_delay)
 
     @cached_property
     def pdf_cache_dir(self)->Path:
@@ -95,18 +96,13 @@ class ArxivClient:
             logger.info(f"Fetching {max_results} {self.search_category} papers from arXiv")
 
             # Add rate limiting delay between all requests (arXiv recommends 3 seconds)
-            if self._last_request_time is not None:
-                time_since_last = time.time() - self._last_request_time
-                if time_since_last < self.rate_limit_delay:
-                    sleep_time = self.rate_limit_delay - time_since_last
-                    await asyncio.sleep(sleep_time)
+            await self._rate_limiter.wait()
 
-            self._last_request_time = time.time()
-
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                xml_data = response.text
+            with track_stage(STAGE_ARXIV_QUERY):
+                async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    xml_data = response.text
 
             papers = self._parse_response(xml_data)
             logger.info(f"Fetched {len(papers)} papers")
@@ -149,18 +145,13 @@ class ArxivClient:
 
         try:
             # Add rate limiting delay between all requests (arXiv recommends 3 seconds)
-            if self._last_request_time is not None:
-                time_since_last = time.time() - self._last_request_time
-                if time_since_last < self.rate_limit_delay:
-                    sleep_time = self.rate_limit_delay - time_since_last
-                    await asyncio.sleep(sleep_time)
+            await self._rate_limiter.wait()
 
-            self._last_request_time = time.time()
-
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                xml_data = response.text
+            with track_stage(STAGE_ARXIV_QUERY):
+                async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    xml_data = response.text
 
             papers = self._parse_response(xml_data)
             logger.info(f"Query returned {len(papers)} papers")
@@ -332,6 +323,7 @@ class ArxivClient:
         # Return cached PDF if exists
         if pdf_path.exists() and not force_download:
             logger.info(f"Using cached PDF: {pdf_path.name}")
+            STAGE_ITEMS_TOTAL.labels(stage=STAGE_DOWNLOAD, outcome="cached").inc()
             return pdf_path
 
         # Download with retry
@@ -356,12 +348,16 @@ class ArxivClient:
 
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    async with client.stream("GET", url) as response:
-                        response.raise_for_status()
-                        with open(path, "wb") as f:
-                            async for chunk in response.aiter_bytes():
-                                f.write(chunk)
+                downloaded_bytes = 0
+                with track_stage(STAGE_DOWNLOAD):
+                    async with httpx.AsyncClient(timeout=30.0) as client:
+                        async with client.stream("GET", url) as response:
+                            response.raise_for_status()
+                            with open(path, "wb") as f:
+                                async for chunk in response.aiter_bytes():
+                                    f.write(chunk)
+                                    downloaded_bytes += len(chunk)
+                DOWNLOAD_BYTES.labels(stage=STAGE_DOWNLOAD).observe(downloaded_bytes)
                 logger.info(f"Successfully downloaded to {path.name}")
                 return True
 
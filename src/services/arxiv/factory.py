@@ -1,12 +1,18 @@
+from typing import Optional
+
 from src.config import get_settings
 
 from .client import ArxivClient
+from .rate_limiter import RateLimiter
 
 
-def make_arxiv_client() -> ArxivClient:
+def make_arxiv_client(rate_limiter: Optional[RateLimiter] = None) -> ArxivClient:
     """
     Factory function to create an arXiv client instance.
 
+    Args:
+        rate_limiter: Optional shared rate limiter (defaults to a per-client limiter)
+
     Returns:
         ArxivClient: An instance of the arXiv client.
     """
@@ -14,6 +20,6 @@ def make_arxiv_client() -> ArxivClient:
     settings = get_settings()
 
     # Create arXiv client with explicit settings
-    client = ArxivClient(settings=settings.arxiv)
+    client = ArxivClient(settings=settings.arxiv, rate_limiter=rate_limiter)
 
     return client
@@ -0,0 +1,57 @@
+import asyncio
+import multiprocessing
+import time
+from typing import Any, Optional
+
+
+class RateLimiter:
+    """Enforces a minimum delay between arXiv API requests within one process."""
+
+    def __init__(self, delay: float):
+        """
+        Args:
+            delay: Minimum seconds between consecutive requests
+        """
+        self.delay = delay
+        self._next_slot = 0.0
+
+    def _reserve_slot(self) -> float:
+        """Reserve the next request slot and return how long to sleep until it."""
+        now = time.time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.delay
+        return slot - now
+
+    async def wait(self) -> None:
+        """Sleep until this caller may issue its request."""
+        sleep_time = self._reserve_slot()
+        if sleep_time > 0:
+            await asyncio.sleep(sleep_time)
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    Rate limiter shared by several processes (e.g. backfill workers).
+
+    The next free slot lives in shared memory and is reserved under a process lock,
+    so the delay holds for the whole process tree rather than per client.
+    The lock is only held while reserving, never while sleeping.
+    """
+
+    def __init__(self, delay: float, lock: Optional[Any] = None, next_slot: Optional[Any] = None):
+        """
+        Args:
+            delay: Minimum seconds between consecutive requests across all processes
+            lock: multiprocessing lock shared with the other processes
+            next_slot: multiprocessing.Value("d") holding the next free slot (epoch seconds)
+        """
+        super().__init__(delay)
+        self._lock = lock if lock is not None else multiprocessing.Lock()
+        self._shared_next_slot = next_slot if next_slot is not None else multiprocessing.Value("d", 0.0, lock=False)
+
+    def _reserve_slot(self) -> float:
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._shared_next_slot.value)
+            self._shared_next_slot.value = slot + self.delay
+        return slot - now
@@ -0,0 +1,248 @@
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.metrics import PAPER_CACHE_REQUESTS_TOTAL
+
+logger = logging.getLogger(__name__)
+
+_INVALIDATE_BATCH_SIZE = 500
+
+# Shared tier value of an invalidated entry (serialized responses start with the quoted ETag)
+TOMBSTONE = b"-"
+
+
+class CachedResponse(NamedTuple):
+    """Serialized response body with its ETag."""
+
+    etag: str
+    body: bytes
+
+    def encode(self) -> bytes:
+        return self.etag.encode("ascii") + b"\n" + self.body
+
+    @classmethod
+    def decode(cls, data: bytes) -> "CachedResponse":
+        etag, _, body = data.partition(b"\n")
+        return cls(etag.decode("ascii"), body)
+
+
+def make_etag(arxiv_id: str, updated_at: Optional[datetime]) -> str:
+    """
+    Strong ETag of one stored version of a paper.
+
+    Every write bumps updated_at, so the serialized body changes only when the ETag does.
+    """
+    version = updated_at.strftime("%Y%m%dT%H%M%S.%f") if updated_at else "0"
+    return f'"{arxiv_id}@{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches the ETag (weak comparison, as RFC 9110 requires for it)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+class LRUCache:
+    """
+    In-process LRU cache with a fixed lifetime per entry.
+
+    Not thread-safe: used from the event loop only. max_entries=0 disables it.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, CachedResponse]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: CachedResponse) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PaperResponseCache:
+    """
+    Two-tier cache of serialized paper detail responses.
+
+    Lookups try the in-process LRU first, then the optional shared tier (any client with the
+    redis.asyncio get/mget/set interface). Shared tier errors are logged and treated as misses,
+    so the cache can never fail a request.
+
+    Invalidation leaves a tombstone in the shared tier for tombstone_ttl_seconds, and responses
+    are only added where there is no entry (SET NX). A request that read a paper just before an
+    ingestion commit therefore cannot put the old version back after the invalidation.
+    """
+
+    def __init__(
+        self,
+        local: LRUCache,
+        shared: Optional[Any] = None,
+        key_prefix: str = "paper:v1:",
+        shared_ttl_seconds: int = 3600,
+        tombstone_ttl_seconds: int = 60,
+    ):
+        """
+        Args:
+            local: In-process tier
+            shared: Optional redis.asyncio-compatible client shared by all workers
+            key_prefix: Prefix of every cache key
+            shared_ttl_seconds: Lifetime of shared tier entries
+            tombstone_ttl_seconds: Time an invalidated paper is not cached again in the shared tier
+        """
+        self.local = local
+        self.shared = shared
+        self.key_prefix = key_prefix
+        self.shared_ttl_seconds = shared_ttl_seconds
+        self.tombstone_ttl_seconds = tombstone_ttl_seconds
+
+    def _key(self, arxiv_id: str) -> str:
+        return f"{self.key_prefix}{arxiv_id}"
+
+    async def get(self, arxiv_id: str) -> Optional[CachedResponse]:
+        key = self._key(arxiv_id)
+        cached = self.local.get(key)
+        if cached is not None:
+            PAPER_CACHE_REQUESTS_TOTAL.labels(result="local_hit").inc()
+            return cached
+
+        if self.shared is not None:
+            try:
+                data = await self.shared.get(key)
+            except Exception as e:
+                logger.warning(f"Shared paper cache lookup failed: {e}")
+                data = None
+            if data is not None and data != TOMBSTONE:
+                cached = CachedResponse.decode(data)
+                self.local.set(key, cached)
+                PAPER_CACHE_REQUESTS_TOTAL.labels(result="shared_hit").inc()
+                return cached
+
+        PAPER_CACHE_REQUESTS_TOTAL.labels(result="miss").inc()
+        return None
+
+    async def get_many(self, arxiv_ids: Sequence[str]) -> Dict[str, CachedResponse]:
+        """Look up several papers at once, with a single MGET for those missing from the local tier."""
+        found: Dict[str, CachedResponse] = {}
+        remaining: List[str] = []
+        for arxiv_id in arxiv_ids:
+            cached = self.local.get(self._key(arxiv_id))
+            if cached is not None:
+                found[arxiv_id] = cached
+            else:
+                remaining.append(arxiv_id)
+        PAPER_CACHE_REQUESTS_TOTAL.labels(result="local_hit").inc(len(found))
+
+        if self.shared is not None and remaining:
+            try:
+                values = await self.shared.mget([self._key(arxiv_id) for arxiv_id in remaining])
+            except Exception as e:
+                logger.warning(f"Shared paper cache lookup failed: {e}")
+                values = [None] * len(remaining)
+            for arxiv_id, data in zip(remaining, values):
+                if data is not None and data != TOMBSTONE:
+                    found[arxiv_id] = CachedResponse.decode(data)
+                    self.local.set(self._key(arxiv_id), found[arxiv_id])
+                    PAPER_CACHE_REQUESTS_TOTAL.labels(result="shared_hit").inc()
+
+        PAPER_CACHE_REQUESTS_TOTAL.labels(result="miss").inc(len(arxiv_ids) - len(found))
+        return found
+
+    async def set(self, arxiv_id: str, value: CachedResponse) -> None:
+        key = self._key(arxiv_id)
+        self.local.set(key, value)
+        if self.shared is not None:
+            try:
+                # Never replaces a tombstone, which may be newer than what this response was built from
+                await self.shared.set(key, value.encode(), ex=self.shared_ttl_seconds, nx=True)
+            except Exception as e:
+                logger.warning(f"Shared paper cache write failed: {e}")
+
+    async def invalidate(self, arxiv_ids: Iterable[str]) -> None:
+        keys = [self._key(arxiv_id) for arxiv_id in arxiv_ids]
+        for key in keys:
+            self.local.delete(key)
+        if self.shared is not None and keys:
+            try:
+                async with self.shared.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.set(key, TOMBSTONE, ex=self.tombstone_ttl_seconds)
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Shared paper cache invalidation failed: {e}")
+
+    async def close(self) -> None:
+        if self.shared is not None:
+            await self.shared.aclose()
+
+
+class PaperCacheInvalidator:
+    """
+    Replaces written papers in the shared cache tier with tombstones (blocking).
+
+    Used by ingestion processes after they commit, which cannot reach the API workers' in-process
+    tier; those entries expire after paper_cache.ttl_seconds.
+    """
+
+    def __init__(self, shared: Any, key_prefix: str = "paper:v1:", tombstone_ttl_seconds: int = 60):
+        """
+        Args:
+            shared: redis.Redis-compatible (sync) client
+            key_prefix: Prefix of every cache key (must match the API's)
+            tombstone_ttl_seconds: Time the papers are not cached again (must outlast an API request)
+        """
+        self.shared = shared
+        self.key_prefix = key_prefix
+        self.tombstone_ttl_seconds = tombstone_ttl_seconds
+
+    def invalidate(self, arxiv_ids: Iterable[str]) -> int:
+        """
+        Invalidate the cache entries of the given papers. Failures are logged, never raised.
+
+        Returns:
+            Number of papers invalidated
+        """
+        keys: List[str] = [f"{self.key_prefix}{arxiv_id}" for arxiv_id in arxiv_ids]
+        invalidated = 0
+        try:
+            for start in range(0, len(keys), _INVALIDATE_BATCH_SIZE):
+                batch = keys[start : start + _INVALIDATE_BATCH_SIZE]
+                pipe = self.shared.pipeline(transaction=False)
+                for key in batch:
+                    pipe.set(key, TOMBSTONE, ex=self.tombstone_ttl_seconds)
+                pipe.execute()
+                invalidated += len(batch)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate cached papers: {e}")
+        return invalidated
+
+    def close(self) -> None:
+        self.shared.close()
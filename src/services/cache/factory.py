@@ -0,0 +1,59 @@
+from typing import Optional
+
+from src.config import get_settings
+
+from .client import LRUCache, PaperCacheInvalidator, PaperResponseCache
+
+
+def make_paper_cache() -> PaperResponseCache:
+    """
+    Factory function to create the paper response cache of an API worker.
+
+    The shared tier is only created when paper_cache.redis_url is set; redis is imported lazily
+    so deployments without it do not need the package.
+
+    Returns:
+        PaperResponseCache: Cache with an in-process tier (disabled if paper_cache.enabled is false)
+    """
+    settings = get_settings().paper_cache
+
+    local = LRUCache(max_entries=settings.max_entries if settings.enabled else 0, ttl_seconds=settings.ttl_seconds)
+
+    shared = None
+    if settings.enabled and settings.redis_url:
+        import redis.asyncio
+
+        shared = redis.asyncio.Redis.from_url(
+            settings.redis_url,
+            socket_timeout=settings.redis_timeout_seconds,
+            socket_connect_timeout=settings.redis_timeout_seconds,
+        )
+
+    return PaperResponseCache(
+        local=local,
+        shared=shared,
+        key_prefix=settings.key_prefix,
+        shared_ttl_seconds=settings.redis_ttl_seconds,
+        tombstone_ttl_seconds=settings.tombstone_ttl_seconds,
+    )
+
+
+def make_paper_cache_invalidator() -> Optional[PaperCacheInvalidator]:
+    """
+    Factory function to create the invalidator used by ingestion writes.
+
+    Returns:
+        PaperCacheInvalidator, or None when there is no shared tier to invalidate
+    """
+    settings = get_settings().paper_cache
+    if not (settings.enabled and settings.redis_url):
+        return None
+
+    import redis
+
+    shared = redis.Redis.from_url(
+        settings.redis_url,
+        socket_timeout=settings.redis_timeout_seconds,
+        socket_connect_timeout=settings.redis_timeout_seconds,
+    )
+    return PaperCacheInvalidator(shared=shared, key_prefix=settings.key_prefix, tombstone_ttl_seconds=settings.tombstone_ttl_seconds)
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional
+
+import httpx
+from sqlalchemy import text
+from src.config import Settings
+from src.db.interfaces.base import BaseDatabase
+from src.metrics import DEPENDENCY_PROBE_SECONDS, DEPENDENCY_UP
+from src.responses import model_to_json
+from src.schemas.api.health import HealthResponse, ServiceStatus
+
+logger = logging.getLogger(__name__)
+
+
+class HealthMonitor:
+    """
+    Dependency health, probed in the background.
+
+    Probes the database, Ollama and OpenSearch every interval_seconds (concurrently, each bounded
+    by timeout_seconds) and keeps the last results, so /health answers load balancer probes from
+    memory without touching any dependency. check() probes on demand for /health/deep.
+    """
+
+    def __init__(self, database: BaseDatabase, settings: Settings, interval_seconds: float = 15.0, timeout_seconds: float = 2.0):
+        """
+        Args:
+            database: Database to probe with SELECT 1
+            settings: Application settings (service identity, Ollama and OpenSearch hosts)
+            interval_seconds: Seconds between background probe rounds
+            timeout_seconds: Seconds after which a probe counts as failed
+        """
+        self.database = database
+        self.settings = settings
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.probes: Dict[str, Callable[[], Awaitable[str]]] = {
+            "database": self._probe_database,
+            "ollama": self._probe_ollama,
+            "opensearch": self._probe_opensearch,
+        }
+        # One connection pool for all HTTP probes instead of a new client per probe
+        self._http = httpx.AsyncClient(timeout=timeout_seconds)
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.snapshot = HealthResponse(
+            status="starting",
+            version=settings.app_version,
+            environment=settings.environment,
+            service_name=settings.service_name,
+            services={},
+        )
+        self.snapshot_json = model_to_json(self.snapshot)
+
+    async def _probe_database(self) -> str:
+        async with self.database.get_async_session() as session:
+            await session.execute(text("SELECT 1"))
+        return "Connected successfully"
+
+    async def _probe_ollama(self) -> str:
+        response = await self._http.get(f"{self.settings.ollama_host}/api/version")
+        response.raise_for_status()
+        return f"Ollama service is running (version {response.json().get('version', 'unknown')})"
+
+    async def _probe_opensearch(self) -> str:
+        response = await self._http.get(f"{self.settings.opensearch_host}/_cluster/health")
+        response.raise_for_status()
+        cluster_status = response.json().get("status", "unknown")
+        if cluster_status == "red":
+            raise RuntimeError("Cluster status is red")
+        return f"Cluster status is {cluster_status}"
+
+    async def _probe(self, name: str) -> ServiceStatus:
+        start = time.perf_counter()
+        try:
+            message = await asyncio.wait_for(self.probes[name](), timeout=self.timeout_seconds)
+            status = ServiceStatus(status="healthy", message=message)
+        except asyncio.TimeoutError:
+            status = ServiceStatus(status="unhealthy", message=f"Timed out after {self.timeout_seconds}s")
+        except Exception as e:
+            status = ServiceStatus(status="unhealthy", message=f"{type(e).__name__}: {e}")
+
+        elapsed = time.perf_counter() - start
+        status.latency_ms = round(elapsed * 1000, 1)
+        DEPENDENCY_PROBE_SECONDS.labels(dependency=name).observe(elapsed)
+        DEPENDENCY_UP.labels(dependency=name).set(1 if status.status == "healthy" else 0)
+        return status
+
+    async def check(self) -> HealthResponse:
+        """Probe all dependencies now and update the snapshot."""
+        # Concurrent callers (deep checks, the background loop) share one probe round at a time
+        async with self._lock:
+            checked_at = datetime.now(timezone.utc)
+            statuses = await asyncio.gather(*(self._probe(name) for name in self.probes))
+            services = dict(zip(self.probes, statuses))
+            self.snapshot = HealthResponse(
+                status="ok" if all(status.status == "healthy" for status in statuses) else "degraded",
+                version=self.settings.app_version,
+                environment=self.settings.environment,
+                service_name=self.settings.service_name,
+                services=services,
+                checked_at=checked_at,
+            )
+            self.snapshot_json = model_to_json(self.snapshot)
+        return self.snapshot
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                health = await self.check()
+                if health.status != "ok":
+                    unhealthy = [name for name, status in health.services.items() if status.status != "healthy"]
+                    logger.warning(f"Unhealthy dependencies: {', '.join(unhealthy)}")
+            except Exception as e:
+                logger.warning(f"Failed to run health checks: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start probing in the background of the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._http.aclose()
@@ -1,20 +1,57 @@
 import asyncio
 import logging
-from datetime import datetime
+import math
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from dateutil import parser as date_parser
 from sqlalchemy.orm import Session
-from src.exceptions import MetadataFetchingException, PipelineException
+from src.config import get_settings
+from src.content_coding import BROTLI, GZIP, ZSTD, offered_encodings
+from src.exceptions import PipelineException, PipelineStageError
+from src.metrics import (
+    PARSE_SECONDS_PER_PAGE,
+    STAGE_COMPRESS,
+    STAGE_DB_WRITE,
+    STAGE_DOWNLOAD,
+    STAGE_PARSE,
+    STAGE_QUEUE_DEPTH,
+    STAGE_WAIT_SECONDS,
+    track_queued,
+    track_stage,
+)
 from src.repositories.paper import PaperRepository
-from src.schemas.arxiv.paper import ArxivPaper, PaperCreate
+from src.repositories.paper_content import CONTENT_FIELDS, PaperContentRepository, build_content_blobs
+from src.repositories.paper_failure import PaperFailureRepository
+from src.repositories.paper_stats import PaperStatsRepository
+from src.schemas.arxiv.paper import ArxivPaper, PaperContent, PaperCreate
 from src.schemas.pdf_parser.models import ArxivMetadata, ParsedPaper, PdfContent
 from src.services.arxiv.client import ArxivClient
+from src.services.cache.client import PaperCacheInvalidator
+from src.services.cache.factory import make_paper_cache_invalidator
 from src.services.pdf_parser.parser import PDFParserService
 
 logger = logging.getLogger(__name__)
 
+# Pipeline stages a paper can fail in (and be retried from)
+STAGE_FAILED_DOWNLOAD = "download"
+STAGE_FAILED_PARSE = "parse"
+STAGE_FAILED_STORE = "store"
+
+
+@asynccontextmanager
+async def _acquire_stage_slot(stage: str, semaphore: Any) -> AsyncGenerator[None, None]:
+    """Acquire a stage semaphore, reporting the wait in the stage queue-depth gauge."""
+    with track_queued(stage):
+        await semaphore.acquire()
+    try:
+        yield
+    finally:
+        semaphore.release()
+
 
 class MetadataFetcher:
     """
@@ -34,6 +71,16 @@ class MetadataFetcher:
         pdf_cache_dir: Optional[Path] = None,
         max_concurrent_downloads: int = 5,
         max_concurrent_parsing: int = 3,
+        parse_semaphore: Optional[Any] = None,
+        max_retry_attempts: int = 5,
+        retry_backoff_base_seconds: int = 600,
+        retry_backoff_max_seconds: int = 86400,
+        retry_batch_size: int = 50,
+        store_batch_size: int = 500,
+        copy_threshold: int = 1000,
+        cache_invalidator: Optional[PaperCacheInvalidator] = None,
+        content_encodings: Sequence[str] = (),
+        content_levels: Optional[Dict[str, int]] = None,
     ):
         """
         Initialize metadata fetcher.
@@ -44,12 +91,34 @@ class MetadataFetcher:
             pdf_cache_dir: Directory for PDF caching (uses client default if None)
             max_concurrent_downloads: Maximum concurrent PDF downloads
             max_concurrent_parsing: Maximum concurrent PDF parsing operations
+            parse_semaphore: Semaphore shared beyond one batch (e.g. across backfill processes);
+                overrides max_concurrent_parsing when given
+            max_retry_attempts: Failures after which a paper moves to the dead-letter table
+            retry_backoff_base_seconds: Delay before the first retry, doubled per attempt
+            retry_backoff_max_seconds: Upper bound for the retry delay
+            retry_batch_size: Maximum failures retried per retry run
+            store_batch_size: Papers per multi-row upsert statement
+            copy_threshold: Minimum papers in one store step before loading through COPY
+            cache_invalidator: Removes stored papers from the shared API response cache
+            content_encodings: Content codings the parsed content is precompressed in for the API
+            content_levels: Compression level per content coding (required for content_encodings)
         """
         self.arxiv_client = arxiv_client
         self.pdf_parser = pdf_parser
         self.pdf_cache_dir = pdf_cache_dir or self.arxiv_client.pdf_cache_dir
         self.max_concurrent_downloads = max_concurrent_downloads
         self.max_concurrent_parsing = max_concurrent_parsing
+        self.parse_semaphore = parse_semaphore
+        self.max_retry_attempts = max_retry_attempts
+        self.retry_backoff_base_seconds = retry_backoff_base_seconds
+        self.retry_backoff_max_seconds = retry_backoff_max_seconds
+        self.retry_batch_size = retry_batch_size
+        self.store_batch_size = store_batch_size
+        self.copy_threshold = copy_threshold
+        self.cache_invalidator = cache_invalidator
+        self.content_encodings = tuple(content_encodings)
+        self.content_levels = content_levels or {}
+        self._parse_sequence = 0  # Tie-breaker keeping FIFO order between equal parse costs
 
     async def fetch_and_process_papers(
         self,
@@ -80,6 +149,7 @@ class MetadataFetcher:
             "pdfs_downloaded": 0,
             "pdfs_parsed": 0,
             "papers_stored": 0,
+            "failures_recorded": 0,
             "errors": [],
             "processing_time": 0,
         }
@@ -104,13 +174,23 @@ class MetadataFetcher:
                 pdf_results = await self._process_pdfs_batch(papers)
                 results["pdfs_downloaded"] = pdf_results["downloaded"]
                 results["pdfs_parsed"] = pdf_results["parsed"]
+                results["mean_time_to_parsed"] = pdf_results["mean_time_to_parsed"]
+                results["parse_stragglers"] = pdf_results["stragglers"]
                 results["errors"].extend(pdf_results["errors"])
 
             # Step 3: Store to database if requested
             if store_to_db and db_session:
                 logger.info("Step 3: Storing papers to database...")
-                stored_count = self._store_papers_to_db(papers, pdf_results.get("parsed_papers", {}), db_session)
+                failures = list(pdf_results.get("failures", []))
+                stored_count = self._store_papers_to_db(papers, pdf_results.get("parsed_papers", {}), db_session, failures)
                 results["papers_stored"] = stored_count
+
+                # Persist per-paper failures so the retry task can pick them up
+                failed_ids = {failure["arxiv_id"] for failure in failures}
+                failure_counts = self._record_failures(
+                    failures, [paper.arxiv_id for paper in papers if paper.arxiv_id not in failed_ids], db_session
+                )
+                results["failures_recorded"] = failure_counts["recorded"]
             elif store_to_db:
                 logger.warning("Database storage requested but no session provided")
                 results["errors"].append("Database session not provided for storage")
@@ -144,8 +224,10 @@ class MetadataFetcher:
 
         Uses overlapping download+parse pipeline:
         - Downloads happen concurrently (up to max_concurrent_downloads)
-        - As each download completes, parsing starts immediately
-        - Multiple PDFs can be parsing while others are still downloading
+        - Each downloaded PDF enters a parse priority queue keyed by its estimated cost
+          (pages and bytes), so short documents are parsed first and one huge paper
+          does not hold up many small ones
+        - Parse workers (up to max_concurrent_parsing) drain the queue while other downloads continue
 
         This is optimal for production workloads like 100 papers/day.
 
@@ -162,6 +244,9 @@ class MetadataFetcher:
             "errors": [],
             "download_failures": [],
             "parse_failures": [],
+            "failures": [],
+            "mean_time_to_parsed": 0.0,
+            "stragglers": [],
         }
 
         logger.info(f"Starting async pipeline for {len(papers)} PDFs...")
@@ -170,20 +255,36 @@ class MetadataFetcher:
 
         # Create semaphores for controlled concurrency
         download_semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
-        parse_semaphore = asyncio.Semaphore(self.max_concurrent_parsing)
-
-        # Start all download+parse pipelines concurrently
-        pipeline_tasks = [self._download_and_parse_pipeline(paper, download_semaphore, parse_semaphore) for paper in papers]
-
-        # Wait for all pipelines to complete
-        pipeline_results = await asyncio.gather(*pipeline_tasks, return_exceptions=True)
+        parse_semaphore = self.parse_semaphore or asyncio.Semaphore(self.max_concurrent_parsing)
+        parse_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+
+        # Per-paper outcome: (download_success, parsed_paper) or the exception that stopped it
+        outcomes: Dict[str, Any] = {}
+        timings: List[Dict[str, Any]] = []
+        batch_start = time.perf_counter()
+
+        # Start all downloads and the parse workers concurrently
+        parse_workers = [
+            asyncio.create_task(self._parse_worker(parse_queue, parse_semaphore, outcomes, timings, batch_start))
+            for _ in range(max(self.max_concurrent_parsing, 1))
+        ]
+        await asyncio.gather(*[self._download_stage(paper, download_semaphore, parse_queue, outcomes) for paper in papers])
+
+        # All downloads are queued; one sentinel per worker (sorted after every real item) stops them
+        for _ in parse_workers:
+            await parse_queue.put((math.inf, 0, None))
+        await asyncio.gather(*parse_workers)
 
         # Process results with detailed error tracking
-        for paper, result in zip(papers, pipeline_results):
+        for paper in papers:
+            result = outcomes.get(paper.arxiv_id)
             if isinstance(result, Exception):
                 error_msg = f"Pipeline error for {paper.arxiv_id}: {str(result)}"
                 logger.error(error_msg)
                 results["errors"].append(error_msg)
+                cause = result.__cause__ or result
+                stage = result.stage if isinstance(result, PipelineStageError) else STAGE_FAILED_DOWNLOAD
+                results["failures"].append(self._build_failure(paper, stage, type(cause).__name__, str(cause)))
             elif result:
                 # Result is tuple: (download_success, parsed_paper)
                 download_success, parsed_paper = result
@@ -197,12 +298,21 @@ class MetadataFetcher:
                     else:
                         # Download succeeded but parsing failed
                         results["parse_failures"].append(paper.arxiv_id)
+                        results["failures"].append(
+                            self._build_failure(paper, STAGE_FAILED_PARSE, "EmptyParseResult", "Parser returned no content")
+                        )
                 else:
                     # Download failed
                     results["download_failures"].append(paper.arxiv_id)
+                    results["failures"].append(
+                        self._build_failure(paper, STAGE_FAILED_DOWNLOAD, "PDFDownloadException", "Download returned no file")
+                    )
             else:
                 # No result returned (shouldn't happen but handle gracefully)
                 results["download_failures"].append(paper.arxiv_id)
+                results["failures"].append(
+                    self._build_failure(paper, STAGE_FAILED_DOWNLOAD, "PDFDownloadException", "Pipeline returned no result")
+                )
 
         # Simple processing summary
         logger.info(f"PDF processing: {results['downloaded']}/{len(papers)} downloaded, {results['parsed']} parsed")
@@ -219,64 +329,138 @@ class MetadataFetcher:
         if results["parse_failures"]:
             results["errors"].extend([f"PDF parse failed: {arxiv_id}" for arxiv_id in results["parse_failures"]])
 
+        self._report_parse_timings(timings, results)
+
         return results
 
-    async def _download_and_parse_pipeline(
-        self, paper: ArxivPaper, download_semaphore: asyncio.Semaphore, parse_semaphore: asyncio.Semaphore
-    ) -> tuple:
+    async def _download_stage(
+        self,
+        paper: ArxivPaper,
+        download_semaphore: asyncio.Semaphore,
+        parse_queue: asyncio.PriorityQueue,
+        outcomes: Dict[str, Any],
+    ) -> None:
         """
-        Complete download+parse pipeline for a single paper with true parallelism.
-        Downloads PDF, then immediately starts parsing while other downloads continue.
+        Download the PDF of one paper and queue it for parsing by estimated cost.
 
-        Returns:
-            Tuple of (download_success: bool, parsed_paper: Optional[ParsedPaper])
+        Failures are stored in outcomes instead of raised so the batch keeps going.
         """
-        download_success = False
-        parsed_paper = None
-
         try:
-            # Step 1: Download PDF with download concurrency control
-            async with download_semaphore:
+            async with _acquire_stage_slot(STAGE_DOWNLOAD, download_semaphore):
                 logger.debug(f"Starting download: {paper.arxiv_id}")
                 pdf_path = await self.arxiv_client.download_pdf(paper, False)
 
-                if pdf_path:
-                    download_success = True
-                    logger.debug(f"Download complete: {paper.arxiv_id}")
-                else:
-                    logger.error(f"Download failed: {paper.arxiv_id}")
-                    return (False, None)
+            if not pdf_path:
+                logger.error(f"Download failed: {paper.arxiv_id}")
+                outcomes[paper.arxiv_id] = (False, None)
+                return
 
-            # Step 2: Parse PDF with parse concurrency control (happens AFTER download completes)
-            # This allows other downloads to continue while this PDF is being parsed
-            async with parse_semaphore:
-                logger.debug(f"Starting parse: {paper.arxiv_id}")
-                pdf_content = await self.pdf_parser.parse_pdf(pdf_path)
+            logger.debug(f"Download complete: {paper.arxiv_id}")
+            estimate = self.pdf_parser.estimate_parse_cost(pdf_path)
+            self._parse_sequence += 1
+            STAGE_QUEUE_DEPTH.labels(stage=STAGE_PARSE).inc()
+            await parse_queue.put((estimate.cost, self._parse_sequence, (paper, pdf_path, estimate, time.perf_counter())))
 
-                if pdf_content:
-                    # Create ArxivMetadata from the paper
-                    arxiv_metadata = ArxivMetadata(
-                        title=paper.title,
-                        authors=paper.authors,
-                        abstract=paper.abstract,
-                        arxiv_id=paper.arxiv_id,
-                        categories=paper.categories,
-                        published_date=paper.published_date,
-                        pdf_url=paper.pdf_url,
-                    )
+        except Exception as e:
+            outcomes[paper.arxiv_id] = self._stage_error(paper, STAGE_FAILED_DOWNLOAD, e)
 
-                    # Combine into ParsedPaper
-                    parsed_paper = ParsedPaper(arxiv_metadata=arxiv_metadata, pdf_content=pdf_content)
-                    logger.debug(f"Parse complete: {paper.arxiv_id} - {len(pdf_content.raw_text)} chars extracted")
-                else:
-                    # PDF parsing failed, but this is not critical - we can continue with metadata only
-                    logger.warning(f"PDF parsing failed for {paper.arxiv_id}, continuing with metadata only")
+    async def _parse_worker(
+        self,
+        parse_queue: asyncio.PriorityQueue,
+        parse_semaphore: Any,
+        outcomes: Dict[str, Any],
+        timings: List[Dict[str, Any]],
+        batch_start: float,
+    ) -> None:
+        """Parse queued PDFs cheapest-first until a sentinel is received."""
+        while True:
+            _cost, _sequence, item = await parse_queue.get()
+            if item is None:
+                return
+
+            STAGE_QUEUE_DEPTH.labels(stage=STAGE_PARSE).dec()
+            paper, pdf_path, estimate, queued_at = item
+            async with _acquire_stage_slot(STAGE_PARSE, parse_semaphore):
+                parse_start = time.perf_counter()
+                STAGE_WAIT_SECONDS.labels(stage=STAGE_PARSE).observe(parse_start - queued_at)
+                outcomes[paper.arxiv_id] = await self._parse_stage(paper, pdf_path)
+                parse_end = time.perf_counter()
+
+            timings.append(
+                {
+                    "arxiv_id": paper.arxiv_id,
+                    "pages": estimate.pages,
+                    "size_bytes": estimate.size_bytes,
+                    "wait_seconds": round(parse_start - queued_at, 2),
+                    "parse_seconds": round(parse_end - parse_start, 2),
+                    "time_to_parsed": round(parse_end - batch_start, 2),
+                }
+            )
+
+    async def _parse_stage(self, paper: ArxivPaper, pdf_path: Path) -> Any:
+        """
+        Parse one downloaded PDF.
+
+        Returns:
+            Tuple of (download_success: bool, parsed_paper: Optional[ParsedPaper]),
+            or a PipelineStageError if parsing raised
+        """
+        try:
+            logger.debug(f"Starting parse: {paper.arxiv_id}")
+            parse_start = time.perf_counter()
+            with track_stage(STAGE_PARSE):
+                pdf_content = await self.pdf_parser.parse_pdf(pdf_path)
+            parse_seconds = time.perf_counter() - parse_start
+
+            if not pdf_content:
+                # PDF parsing failed, but this is not critical - we can continue with metadata only
+                logger.warning(f"PDF parsing failed for {paper.arxiv_id}, continuing with metadata only")
+                return (True, None)
+
+            pages = pdf_content.metadata.get("pages")
+            if pages:
+                PARSE_SECONDS_PER_PAGE.labels(stage=STAGE_PARSE).observe(parse_seconds / pages)
+
+            # Create ArxivMetadata from the paper
+            arxiv_metadata = ArxivMetadata(
+                title=paper.title,
+                authors=paper.authors,
+                abstract=paper.abstract,
+                arxiv_id=paper.arxiv_id,
+                categories=paper.categories,
+                published_date=paper.published_date,
+                pdf_url=paper.pdf_url,
+            )
+
+            # Combine into ParsedPaper
+            logger.debug(f"Parse complete: {paper.arxiv_id} - {len(pdf_content.raw_text)} chars extracted")
+            return (True, ParsedPaper(arxiv_metadata=arxiv_metadata, pdf_content=pdf_content))
 
         except Exception as e:
-            logger.error(f"Pipeline error for {paper.arxiv_id}: {e}")
-            raise MetadataFetchingException(f"Pipeline error for {paper.arxiv_id}: {e}") from e
+            return self._stage_error(paper, STAGE_FAILED_PARSE, e)
+
+    def _stage_error(self, paper: ArxivPaper, stage: str, error: Exception) -> PipelineStageError:
+        """Wrap a per-paper exception with the stage it happened in (the original is kept as __cause__)."""
+        logger.error(f"Pipeline error for {paper.arxiv_id} during {stage}: {error}")
+        stage_error = PipelineStageError(f"Pipeline error for {paper.arxiv_id} during {stage}: {error}", stage=stage)
+        stage_error.__cause__ = error
+        return stage_error
+
+    def _report_parse_timings(self, timings: List[Dict[str, Any]], results: Dict[str, Any]) -> None:
+        """Add mean time-to-parsed and the slowest papers (stragglers) to the batch results."""
+        if not timings:
+            return
 
-        return (download_success, parsed_paper)
+        results["mean_time_to_parsed"] = round(sum(t["time_to_parsed"] for t in timings) / len(timings), 2)
+        results["stragglers"] = sorted(timings, key=lambda t: t["wait_seconds"] + t["parse_seconds"], reverse=True)[:3]
+
+        logger.info(f"Parse scheduling: mean time-to-parsed {results['mean_time_to_parsed']:.1f}s over {len(timings)} PDFs")
+        for straggler in results["stragglers"]:
+            logger.info(
+                f"  Straggler {straggler['arxiv_id']}: {straggler['pages']} pages, "
+                f"{straggler['size_bytes'] / 1024 / 1024:.1f}MB, waited {straggler['wait_seconds']:.1f}s, "
+                f"parsed in {straggler['parse_seconds']:.1f}s"
+            )
 
     def _serialize_parsed_content(self, parsed_paper: ParsedPaper) -> Dict[str, Any]:
         """
@@ -315,6 +499,8 @@ class MetadataFetcher:
         papers: List[ArxivPaper],
         parsed_papers: Dict[str, ParsedPaper],
         db_session: Session,
+        failures: Optional[List[Dict[str, Any]]] = None,
+        prepared_records: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> int:
         """
         Store papers and parsed content to database with comprehensive content storage.
@@ -323,15 +509,27 @@ class MetadataFetcher:
             papers: List of ArxivPaper metadata
             parsed_papers: Dictionary of parsed PDF content by arxiv_id
             db_session: Database session
+            failures: If given, store failures are appended to it
+            prepared_records: Ready-made PaperCreate data by arxiv_id (from earlier store failures),
+                used instead of rebuilding the record from metadata and parsed content
 
         Returns:
             Number of papers stored successfully
         """
         paper_repo = PaperRepository(db_session)
-        stored_count = 0
+        stats_repo = PaperStatsRepository(db_session)
+        content_repo = PaperContentRepository(db_session)
+        store_failures: List[Dict[str, Any]] = []
+        prepared_records = prepared_records or {}
+        records: List[Tuple[ArxivPaper, PaperCreate]] = []
 
         for paper in papers:
             try:
+                # Re-use the record of a previous store failure instead of re-parsing
+                if prepared_records.get(paper.arxiv_id):
+                    records.append((paper, PaperCreate(**prepared_records[paper.arxiv_id])))
+                    continue
+
                 # Get parsed content if available
                 parsed_paper = parsed_papers.get(paper.arxiv_id)
 
@@ -363,33 +561,266 @@ class MetadataFetcher:
                     )
                     logger.debug(f"Storing paper {paper.arxiv_id} with metadata only")
 
-                paper_create = PaperCreate(**paper_data)
-                stored_paper = paper_repo.upsert(paper_create)
+                records.append((paper, PaperCreate(**paper_data)))
+
+            except Exception as e:
+                logger.error(f"Failed to prepare paper {paper.arxiv_id} for storage: {e}")
+                store_failures.append(self._build_failure(paper, STAGE_FAILED_STORE, type(e).__name__, str(e)))
 
-                if stored_paper:
-                    stored_count += 1
-                    content_info = "with parsed content" if parsed_paper else "metadata only"
-                    logger.debug(f"Stored paper {paper.arxiv_id} to database ({content_info})")
+        # Compress parsed content outside the transaction, so no locks are held meanwhile. Records that
+        # leave the content untouched (metadata-only updates) keep their stored bodies.
+        blobs = {
+            record.arxiv_id: self._content_blobs(record) for _, record in records if CONTENT_FIELDS & record.model_fields_set
+        }
 
+        # Write all papers with batched upserts in a single transaction
+        stored_count = 0
+        if records:
+            try:
+                with track_stage(STAGE_DB_WRITE):
+                    # Counters change in the same transaction as the papers
+                    arxiv_ids = [record.arxiv_id for _, record in records]
+                    before = stats_repo.snapshot(arxiv_ids)
+                    counts = self._bulk_write([record for _, record in records], paper_repo)
+                    stats_repo.apply_changes(before, stats_repo.snapshot(arxiv_ids))
+                    content_repo.replace(blobs)
+                    db_session.commit()
+                self._invalidate_cached(arxiv_ids)
+                stored_count = counts["inserted"] + counts["updated"]
+                logger.info(
+                    f"Committed {stored_count} papers to database with full content storage "
+                    f"({counts['inserted']} new, {counts['updated']} updated)"
+                )
+            except Exception as e:
+                # One bad row fails the whole batch; fall back to per-paper writes to isolate it
+                logger.error(f"Batched store failed, falling back to per-paper upserts: {e}")
+                db_session.rollback()
+                stored_count = self._store_records_individually(
+                    records, paper_repo, stats_repo, content_repo, blobs, db_session, store_failures
+                )
+
+        if failures is not None:
+            failures.extend(store_failures)
+
+        return stored_count
+
+    def _bulk_write(self, records: List[PaperCreate], paper_repo: PaperRepository) -> Dict[str, int]:
+        """
+        Write records with COPY for large uniform batches (e.g. metadata-only backfills), batched upserts otherwise.
+
+        COPY updates the same columns for every row, so it is only used when all records set the same fields.
+        """
+        field_sets = {frozenset(record.model_dump(exclude_unset=True)) for record in records}
+        if len(records) >= self.copy_threshold and len(field_sets) == 1:
+            return paper_repo.copy_upsert(records, columns=sorted(field_sets.pop()))
+        return paper_repo.bulk_upsert(records, batch_size=self.store_batch_size)
+
+    def _store_records_individually(
+        self,
+        records: List[Tuple[ArxivPaper, PaperCreate]],
+        paper_repo: PaperRepository,
+        stats_repo: PaperStatsRepository,
+        content_repo: PaperContentRepository,
+        blobs: Dict[str, List[Dict[str, Any]]],
+        db_session: Session,
+        store_failures: List[Dict[str, Any]],
+    ) -> int:
+        """
+        Upsert papers one by one (one transaction each) after a batched write failed.
+
+        Returns:
+            Number of papers stored successfully
+        """
+        stored_ids: List[str] = []
+        for paper, paper_create in records:
+            try:
+                with track_stage(STAGE_DB_WRITE):
+                    before = stats_repo.snapshot([paper_create.arxiv_id])
+                    # Flush-only write, so the paper, its counters and its content commit together
+                    paper_repo.bulk_upsert([paper_create])
+                    stats_repo.apply_changes(before, stats_repo.snapshot([paper_create.arxiv_id]))
+                    arxiv_id = paper_create.arxiv_id
+                    content_repo.replace({arxiv_id: blobs[arxiv_id]} if arxiv_id in blobs else {})
+                    db_session.commit()
+                stored_ids.append(paper_create.arxiv_id)
             except Exception as e:
                 logger.error(f"Failed to store paper {paper.arxiv_id}: {e}")
+                db_session.rollback()
+                record = paper_create.model_dump(mode="json")
+                store_failures.append(self._build_failure(paper, STAGE_FAILED_STORE, type(e).__name__, str(e), record))
+
+        self._invalidate_cached(stored_ids)
+        logger.info(f"Stored {len(stored_ids)}/{len(records)} papers with per-paper upserts")
+        return len(stored_ids)
+
+    def _content_blobs(self, record: PaperCreate) -> List[Dict[str, Any]]:
+        """Precompressed content bodies of a record; none for metadata-only records or when disabled."""
+        if not self.content_encodings or not (record.raw_text or record.sections):
+            return []
+        try:
+            with track_stage(STAGE_COMPRESS):
+                content = PaperContent.model_validate(record, from_attributes=True)
+                return build_content_blobs(content, self.content_encodings, self.content_levels)
+        except Exception as e:
+            # The API compresses on the fly without a blob, so this never fails the paper
+            logger.warning(f"Failed to precompress content of {record.arxiv_id}: {e}")
+            return []
+
+    def _invalidate_cached(self, arxiv_ids: List[str]) -> None:
+        """Drop committed papers from the shared response cache so the API serves the new version."""
+        if self.cache_invalidator is not None and arxiv_ids:
+            deleted = self.cache_invalidator.invalidate(arxiv_ids)
+            logger.debug(f"Invalidated {deleted} cached paper responses")
+
+    def _build_failure(
+        self,
+        paper: ArxivPaper,
+        stage: str,
+        error_class: str,
+        error_message: str,
+        record: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Describe a per-paper stage failure for persistence.
+
+        The payload keeps the arXiv metadata (so the retry never has to query arXiv again)
+        and, for store failures, the fully built record (so the PDF is not parsed again).
+        """
+        return {
+            "arxiv_id": paper.arxiv_id,
+            "stage": stage,
+            "error_class": error_class,
+            "error_message": error_message,
+            "payload": {"paper": paper.model_dump(mode="json"), "record": record},
+        }
+
+    def _retry_delay(self, attempts: int) -> timedelta:
+        """Exponential backoff: base * 2^(attempts - 1), capped at the configured maximum."""
+        delay = self.retry_backoff_base_seconds * 2 ** max(attempts - 1, 0)
+        return timedelta(seconds=min(delay, self.retry_backoff_max_seconds))
+
+    def _record_failures(
+        self,
+        failures: List[Dict[str, Any]],
+        succeeded_ids: Iterable[str],
+        db_session: Session,
+    ) -> Dict[str, int]:
+        """
+        Persist stage failures with backoff and clear records of papers that succeeded.
+
+        Papers that reach max_retry_attempts are moved to the dead-letter table.
+        Bookkeeping errors are logged but never fail the pipeline.
+
+        Returns:
+            Counts of recorded, dead-lettered and resolved papers
+        """
+        counts = {"recorded": 0, "dead_lettered": 0, "resolved": 0}
+        failure_repo = PaperFailureRepository(db_session)
 
-        # Commit all changes
         try:
+            counts["resolved"] = failure_repo.resolve(succeeded_ids)
+
+            for failure in failures:
+                record = failure_repo.record_failure(
+                    arxiv_id=failure["arxiv_id"],
+                    stage=failure["stage"],
+                    error_class=failure["error_class"],
+                    error_message=failure["error_message"],
+                    payload=failure["payload"],
+                    retry_delay=self._retry_delay,
+                )
+                if record.attempts >= self.max_retry_attempts:
+                    failure_repo.move_to_dead_letter(record)
+                    counts["dead_lettered"] += 1
+                    logger.warning(
+                        f"Paper {failure['arxiv_id']} moved to dead-letter table after {record.attempts} attempts "
+                        f"({failure['stage']}: {failure['error_class']})"
+                    )
+                else:
+                    counts["recorded"] += 1
+
             db_session.commit()
-            logger.info(f"Committed {stored_count} papers to database with full content storage")
         except Exception as e:
-            logger.error(f"Failed to commit papers to database: {e}")
+            logger.error(f"Failed to record paper failures: {e}")
             db_session.rollback()
-            stored_count = 0
 
-        return stored_count
+        if failures or counts["resolved"]:
+            logger.info(
+                f"Failure tracking: {counts['recorded']} scheduled for retry, "
+                f"{counts['dead_lettered']} dead-lettered, {counts['resolved']} resolved"
+            )
+        return counts
+
+    async def retry_failed_papers(self, db_session: Session, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Retry papers whose failure record is due, re-running only the failed stage.
+
+        - download failures: download (cache-aware), parse and store
+        - parse failures: parse the cached PDF and store, no re-download
+        - store failures: write the saved record, no download or parse
+
+        Args:
+            db_session: Database session
+            limit: Maximum failures to retry (uses retry_batch_size if None)
+
+        Returns:
+            Dictionary with retry statistics
+        """
+        failure_repo = PaperFailureRepository(db_session)
+        due = failure_repo.get_due(datetime.now(timezone.utc), limit=limit or self.retry_batch_size)
+
+        results = {"due": len(due), "recovered": 0, "rescheduled": 0, "dead_lettered": 0, "by_stage": {}}
+        if not due:
+            logger.info("No failed papers due for retry")
+            return results
+
+        pdf_papers: List[ArxivPaper] = []
+        store_papers: List[ArxivPaper] = []
+        prepared_records: Dict[str, Dict[str, Any]] = {}
+        for failure in due:
+            results["by_stage"][failure.stage] = results["by_stage"].get(failure.stage, 0) + 1
+            paper = ArxivPaper(**failure.payload["paper"])
+            if failure.stage == STAGE_FAILED_STORE:
+                store_papers.append(paper)
+                if failure.payload.get("record"):
+                    prepared_records[paper.arxiv_id] = failure.payload["record"]
+            else:
+                pdf_papers.append(paper)
+
+        logger.info(f"Retrying {len(due)} failed papers: {results['by_stage']}")
+
+        failures: List[Dict[str, Any]] = []
+        parsed_papers: Dict[str, ParsedPaper] = {}
+        if pdf_papers:
+            pdf_results = await self._process_pdfs_batch(pdf_papers)
+            failures.extend(pdf_results["failures"])
+            parsed_papers = pdf_results["parsed_papers"]
+
+        # Only papers that made it through download and parse are written again
+        failed_ids = {failure["arxiv_id"] for failure in failures}
+        to_store = [paper for paper in pdf_papers if paper.arxiv_id not in failed_ids] + store_papers
+        if to_store:
+            self._store_papers_to_db(to_store, parsed_papers, db_session, failures, prepared_records)
+
+        failed_ids = {failure["arxiv_id"] for failure in failures}
+        recovered_ids = [paper.arxiv_id for paper in pdf_papers + store_papers if paper.arxiv_id not in failed_ids]
+        counts = self._record_failures(failures, recovered_ids, db_session)
+
+        results["recovered"] = len(recovered_ids)
+        results["rescheduled"] = counts["recorded"]
+        results["dead_lettered"] = counts["dead_lettered"]
+        logger.info(
+            f"Retry completed: {results['recovered']} recovered, {results['rescheduled']} rescheduled, "
+            f"{results['dead_lettered']} dead-lettered"
+        )
+        return results
 
 
 def make_metadata_fetcher(
     arxiv_client: ArxivClient,
     pdf_parser: PDFParserService,
     pdf_cache_dir: Optional[Path] = None,
+    parse_semaphore: Optional[Any] = None,
 ) -> MetadataFetcher:
     """
     Factory function to create MetadataFetcher instance optimized for production.
@@ -403,14 +834,30 @@ def make_metadata_fetcher(
         arxiv_client: Configured ArxivClient
         pdf_parser: Configured PDFParserService (singleton with model caching)
         pdf_cache_dir: Optional PDF cache directory
+        parse_semaphore: Optional parse semaphore shared across processes (used by the backfill)
 
     Returns:
         MetadataFetcher instance optimized for production
     """
+    settings = get_settings()
+    retry_settings = settings.ingestion_retry
+
     return MetadataFetcher(
         arxiv_client=arxiv_client,
         pdf_parser=pdf_parser,
         pdf_cache_dir=pdf_cache_dir,
         max_concurrent_downloads=5,
         max_concurrent_parsing=1,
+        parse_semaphore=parse_semaphore,
+        max_retry_attempts=retry_settings.max_attempts,
+        retry_backoff_base_seconds=retry_settings.backoff_base_seconds,
+        retry_backoff_max_seconds=retry_settings.backoff_max_seconds,
+        retry_batch_size=retry_settings.batch_size,
+        cache_invalidator=make_paper_cache_invalidator(),
+        content_encodings=offered_encodings(settings.compression.precompute_encodings),
+        content_levels={
+            GZIP: settings.compression.precompute_gzip_level,
+            BROTLI: settings.compression.precompute_brotli_quality,
+            ZSTD: settings.compression.precompute_zstd_level,
+        },
     )
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.db.interfaces.base import BaseDatabase
+from src.repositories.paper import AsyncPaperRepository, PaperRepository
+from src.schemas.arxiv.paper import PaperFilters
+
+logger = logging.getLogger(__name__)
+
+# Distinct filter combinations whose counts are kept
+FILTERED_COUNT_ENTRIES = 1024
+
+
+class PaperCountCache:
+    """
+    Cached total number of papers, refreshed in the background.
+
+    Listing requests read the cached value instead of running COUNT(*) over papers.
+    Small tables are counted exactly; above exact_threshold the planner estimate
+    from pg_class.reltuples is used, which costs the same at any table size.
+    Counts of filtered listings are cached per filter combination for refresh_seconds.
+    """
+
+    def __init__(self, database: BaseDatabase, refresh_seconds: float = 60.0, exact_threshold: int = 100_000):
+        """
+        Args:
+            database: Database to count papers in
+            refresh_seconds: Seconds between background refreshes
+            exact_threshold: Estimated row count up to which an exact COUNT(*) is still run
+        """
+        self.database = database
+        self.refresh_seconds = refresh_seconds
+        self.exact_threshold = exact_threshold
+        self.total: Optional[int] = None
+        self.is_estimate = False
+        self.refreshed_at: Optional[float] = None
+        self._filtered: "OrderedDict[str, Tuple[int, bool, float]]" = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+
+    def refresh(self) -> int:
+        """Recompute the total (blocking)."""
+        with self.database.get_session() as session:
+            paper_repo = PaperRepository(session)
+            estimate = paper_repo.get_estimated_count()
+
+            # Never analyzed (-1) or small enough to count exactly
+            if estimate < self.exact_threshold:
+                self.total = paper_repo.get_count()
+                self.is_estimate = False
+            else:
+                self.total = estimate
+                self.is_estimate = True
+
+        self.refreshed_at = time.monotonic()
+        return self.total
+
+    async def count_filtered(self, paper_repo: AsyncPaperRepository, filters: PaperFilters) -> Tuple[int, bool]:
+        """
+        Number of papers matching filters, and whether it is an estimate.
+
+        Clients polling the same filtered listing share one count per refresh_seconds instead of
+        counting on every request.
+        """
+        key = filters.model_dump_json()
+        cached = self._filtered.get(key)
+        if cached is not None and time.monotonic() - cached[2] < self.refresh_seconds:
+            self._filtered.move_to_end(key)
+            return cached[0], cached[1]
+
+        total, is_estimate = await paper_repo.get_filtered_count(filters, self.exact_threshold)
+        self._filtered[key] = (total, is_estimate, time.monotonic())
+        self._filtered.move_to_end(key)
+        while len(self._filtered) > FILTERED_COUNT_ENTRIES:
+            self._filtered.popitem(last=False)
+        return total, is_estimate
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.refresh)
+            except Exception as e:
+                logger.warning(f"Failed to refresh paper count: {e}")
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self) -> None:
+        """Start refreshing in the background of the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
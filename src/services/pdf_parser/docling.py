@@ -1,20 +1,26 @@
 #by taha
 
+import asyncio
 import logging
-import pypdfium2 as pdfium
 
 
 from pathlib import Path
 from typing import Optional
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import PdfPipelineOptions
-from docling.document_converter import DocumentConverter, PdfFormatOption
 from src.exceptions import PDFParsingException, PDFValidationError
-from src.schemas.pdf_parser.models import PaperFigure, PaperSection, PaperTable, ParserType, PdfContent
+from src.schemas.pdf_parser.models import PaperFigure, PaperSection, PaperTable, ParseCostEstimate, ParserType, PdfContent
 
 
 logger = logging.getLogger(__name__)
 
+# Bytes that weigh as much as one page in the parse cost estimate (figures and scans make files heavy)
+BYTES_PER_PAGE_EQUIVALENT = 256 * 1024
+
+
+def _open_pdf(pdf_path: Path):
+    import pypdfium2 as pdfium
+
+    return pdfium.PdfDocument(str(pdf_path))
+
 
 #Docling PDF parser for fallback when GROBID fails
 class DoclingParser:
@@ -30,6 +36,11 @@ class DoclingParser:
             do_ocr: Enable OCR for scanned PDFs (default: False, very slow)
             do_table_structure: Extract table structures (default: True)
         """
+        # docling pulls in PyTorch and its models (seconds, hundreds of MB), so it is only imported when a parser is built
+        from docling.datamodel.base_models import InputFormat
+        from docling.datamodel.pipeline_options import PdfPipelineOptions
+        from docling.document_converter import DocumentConverter, PdfFormatOption
+
         # Configure pipeline options
         pipeline_options = PdfPipelineOptions(
             do_table_structure=do_table_structure,
@@ -48,8 +59,23 @@ class DoclingParser:
             # This happens only once per DoclingParser instance
             self._warmed_up = True
     
+    #Estimate relative parse cost from page count and file size without parsing
+    #Unreadable files get zero cost so they fail fast instead of waiting in the queue
+    def estimate_cost(self, pdf_path: Path) -> ParseCostEstimate:
+        try:
+            size_bytes = pdf_path.stat().st_size
+            pdf_doc = _open_pdf(pdf_path)
+            pages = len(pdf_doc)
+            pdf_doc.close()
+        except Exception as e:
+            logger.debug(f"Could not estimate parse cost of {pdf_path}: {e}")
+            return ParseCostEstimate()
+
+        return ParseCostEstimate(pages=pages, size_bytes=size_bytes, cost=pages + size_bytes / BYTES_PER_PAGE_EQUIVALENT)
+
     #Comprehensive PDF validation including size and page limits
-    def _validate_pdf(self, pdf_path: Path) -> bool:
+    #Returns the page count so callers don't have to reopen the document
+    def _validate_pdf(self, pdf_path: Path) -> int:
         try:
             # Check file exists and is not empty
             if pdf_path.stat().st_size == 0:
@@ -74,7 +100,7 @@ class DoclingParser:
                     raise PDFValidationError(f"File does not have PDF header: {pdf_path}")
 
             # Check page count limit
-            pdf_doc = pdfium.PdfDocument(str(pdf_path))
+            pdf_doc = _open_pdf(pdf_path)
             actual_pages = len(pdf_doc)
             pdf_doc.close()
 
@@ -84,7 +110,7 @@ class DoclingParser:
                 )
                 raise PDFValidationError(f"PDF has too many pages: {actual_pages} > {self.max_pages}")
 
-            return True
+            return actual_pages
 
         except PDFValidationError:
             raise
@@ -98,14 +124,17 @@ class DoclingParser:
         
         try:
             # Validate PDF first (includes size and page limits)
-            self._validate_pdf(pdf_path)
+            num_pages = self._validate_pdf(pdf_path)
 
             # Warm up models on first use
             self._warm_up_models()
 
             # Convert PDF using the modern API
             # Limit processing to avoid memory issues with large papers
-            result = self._converter.convert(str(pdf_path), max_num_pages=self.max_pages, max_file_size=self.max_file_size_bytes)
+            # Runs in a worker thread so downloads keep progressing while the CPU-bound conversion runs
+            result = await asyncio.to_thread(
+                self._converter.convert, str(pdf_path), max_num_pages=self.max_pages, max_file_size=self.max_file_size_bytes
+            )
 
             # Extract structured content
             doc = result.document
@@ -138,7 +167,11 @@ class DoclingParser:
                 raw_text=doc.export_to_text(),
                 references=[],
                 parser_used=ParserType.DOCLING,
-                metadata={"source": "docling", "note": "Content extracted from PDF, metadata comes from arXiv API"},
+                metadata={
+                    "source": "docling",
+                    "note": "Content extracted from PDF, metadata comes from arXiv API",
+                    "pages": num_pages,
+                },
             )
 
         except PDFValidationError as e:
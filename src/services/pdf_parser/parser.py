@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Optional
 
 from src.exceptions import PDFParsingException, PDFValidationError
-from src.schemas.pdf_parser.models import PdfContent
+from src.schemas.pdf_parser.models import ParseCostEstimate, PdfContent
 
 from .docling import DoclingParser
 
@@ -27,6 +27,18 @@ class PDFParserService:
             max_pages=max_pages, max_file_size_mb=max_file_size_mb, do_ocr=do_ocr, do_table_structure=do_table_structure
         )
 
+    def estimate_parse_cost(self, pdf_path: Path) -> ParseCostEstimate:
+        """
+        Estimate how expensive a PDF is to parse, from its page count and size.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            ParseCostEstimate (zero cost if the file cannot be opened)
+        """
+        return self.docling_parser.estimate_cost(pdf_path)
+
     async def parse_pdf(self, pdf_path: Path) -> Optional[PdfContent]:
         """
         Parse PDF using Docling parser only.
@@ -0,0 +1,49 @@
+import logging
+import threading
+import time
+from typing import Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LazyProvider(Generic[T]):
+    """
+    A service built on first use instead of at startup.
+
+    API workers hold providers for services that only some requests need (the PDF parser loads
+    docling and PyTorch), so starting a worker costs nothing for them. get() blocks while the
+    service is built: call it from sync dependencies, which FastAPI runs in its threadpool.
+    """
+
+    def __init__(self, factory: Callable[[], T], name: str):
+        """
+        Args:
+            factory: Builds the service (called at most once until reset())
+            name: Service name for logs
+        """
+        self.factory = factory
+        self.name = name
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+    def get(self) -> T:
+        """Get the service, building it on the first call."""
+        if self._instance is None:
+            with self._lock:
+                # Concurrent first requests build it once
+                if self._instance is None:
+                    start = time.perf_counter()
+                    self._instance = self.factory()
+                    logger.info(f"Initialized {self.name} on first use in {time.perf_counter() - start:.2f}s")
+        return self._instance
+
+    def reset(self) -> None:
+        """Drop the instance, so the next get() builds a new one."""
+        with self._lock:
+            self._instance = None
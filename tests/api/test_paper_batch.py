@@ -0,0 +1,88 @@
+import pytest
+from sqlalchemy import update
+from src.models.paper import Paper
+from src.repositories.paper import split_arxiv_id
+
+from tests.conftest import seed_paper
+
+FIELDS = ["arxiv_id", "title"]
+
+
+def _versioned(index: int, version: str):
+    paper = seed_paper(index, ["test.COMMON"])
+    arxiv_id = f"{paper.arxiv_id}{version}"
+    return paper.model_copy(update={"arxiv_id": arxiv_id, "title": f"Title of {arxiv_id}"})
+
+
+@pytest.fixture
+def seeded(seed_papers):
+    seed_papers(
+        [
+            # 9999.00001: three versions, v10 is the latest (compared as numbers, not strings)
+            _versioned(1, "v1"),
+            _versioned(1, "v2"),
+            _versioned(1, "v10"),
+            # 9999.00002: stored without a version suffix
+            _versioned(2, ""),
+            # 9999.00003: stored with and without a suffix, the suffixed one counts as newer
+            _versioned(3, ""),
+            _versioned(3, "v1"),
+        ]
+    )
+
+
+async def _batch(client, ids):
+    response = await client.post("/api/v1/papers/batch", json={"ids": ids, "fields": FIELDS})
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.parametrize(
+    "arxiv_id, expected",
+    [("2401.00001v2", ("2401.00001", 2)), ("2401.00001v10", ("2401.00001", 10)), ("2401.00001", ("2401.00001", None))],
+)
+def test_split_arxiv_id(arxiv_id, expected):
+    assert split_arxiv_id(arxiv_id) == expected
+
+
+async def test_versioned_ids_match_exactly(client, seeded):
+    data = await _batch(client, ["9999.00001v1", "9999.00001v2"])
+    assert data["papers"] == {
+        "9999.00001v1": {"arxiv_id": "9999.00001v1", "title": "Title of 9999.00001v1"},
+        "9999.00001v2": {"arxiv_id": "9999.00001v2", "title": "Title of 9999.00001v2"},
+    }
+    assert data["missing"] == []
+
+
+async def test_version_less_id_resolves_to_latest_version(client, seeded):
+    data = await _batch(client, ["9999.00001", "9999.00003"])
+    assert data["papers"]["9999.00001"]["arxiv_id"] == "9999.00001v10"
+    assert data["papers"]["9999.00003"]["arxiv_id"] == "9999.00003v1"
+
+
+async def test_version_less_id_stored_without_suffix(client, seeded):
+    data = await _batch(client, ["9999.00002", "9999.00002v1"])
+    assert data["papers"] == {"9999.00002": {"arxiv_id": "9999.00002", "title": "Title of 9999.00002"}}
+    # A versioned ID never matches a paper stored without that version
+    assert data["missing"] == ["9999.00002v1"]
+
+
+async def test_missing_ids_keep_request_order(client, seeded):
+    data = await _batch(client, ["9999.09998", "9999.00001v2", "9999.09999v3"])
+    assert list(data["papers"]) == ["9999.00001v2"]
+    assert data["missing"] == ["9999.09998", "9999.09999v3"]
+
+
+async def test_versioned_ids_are_served_from_cache(client, seeded, database):
+    # Caches the detail response of v1
+    assert (await client.get("/api/v1/papers/9999.00001v1")).status_code == 200
+    with database.get_session() as session:
+        session.execute(update(Paper).where(Paper.arxiv_id.startswith("9999.00001")).values(title="Changed"))
+        session.commit()
+
+    data = await _batch(client, ["9999.00001v1", "9999.00001v2", "9999.00001"])
+    # Cache hit: the response cached before the change
+    assert data["papers"]["9999.00001v1"]["title"] == "Title of 9999.00001v1"
+    # Not cached, and version-less IDs always go to the database
+    assert data["papers"]["9999.00001v2"]["title"] == "Changed"
+    assert data["papers"]["9999.00001"]["title"] == "Changed"
@@ -0,0 +1,24 @@
+from sqlalchemy import delete, text
+from src.models.paper import Paper
+from src.repositories.paper import PaperRepository
+
+from tests.conftest import SEED_PREFIX, seed_paper
+
+
+def test_copy_upsert_leaves_permanent_staging_table_alone(database):
+    with database.get_session() as session:
+        session.execute(text("CREATE TABLE public.paper_staging (id int)"))
+        session.commit()
+    try:
+        with database.get_session() as session:
+            counts = PaperRepository(session).copy_upsert([seed_paper(index, ["test.COMMON"]) for index in range(3)])
+            session.commit()
+        assert counts["copied"] == 3
+
+        with database.get_session() as session:
+            assert session.scalar(text("SELECT to_regclass('public.paper_staging') IS NOT NULL"))
+    finally:
+        with database.get_session() as session:
+            session.execute(text("DROP TABLE IF EXISTS public.paper_staging"))
+            session.execute(delete(Paper).where(Paper.arxiv_id.startswith(SEED_PREFIX)))
+            session.commit()
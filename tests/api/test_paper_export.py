@@ -0,0 +1,32 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tests.conftest import SEED_PREFIX, seed_paper
+
+
+@pytest.fixture
+def since(seed_papers):
+    """updated_since selecting the seeded papers (and whatever else changed meanwhile)."""
+    since = datetime.now(timezone.utc) - timedelta(seconds=1)
+    seed_papers([seed_paper(index, ["test.COMMON"]) for index in range(20)])
+    return since.isoformat()
+
+
+def _seeded_ids(body: str):
+    return {row["arxiv_id"] for row in map(json.loads, body.splitlines()) if row["arxiv_id"].startswith(SEED_PREFIX)}
+
+
+async def test_export_is_compressed_as_negotiated(client, since):
+    response = await client.get("/api/v1/papers/export", params={"updated_since": since}, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(_seeded_ids(response.text)) == 20
+
+
+async def test_export_without_accept_encoding_is_plain(client, since):
+    response = await client.get("/api/v1/papers/export", params={"updated_since": since}, headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert len(_seeded_ids(response.text)) == 20
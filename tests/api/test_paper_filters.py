@@ -0,0 +1,113 @@
+from typing import Set
+
+import pytest
+from sqlalchemy import text
+from src.db.explain import Explain, plan_nodes, plan_root
+from src.main import app
+from src.repositories.paper import _count_statement, _page_statement
+from src.schemas.arxiv.paper import PaperFilters
+
+from tests.conftest import SEED_START, seed_paper
+
+# Seeded papers: 2000 days from SEED_START, every 100th in test.RARE, every 40th unprocessed
+SEED_COUNT = 2000
+
+
+@pytest.fixture
+def seeded(database, seed_papers):
+    seed_papers(
+        [
+            seed_paper(
+                index,
+                ["test.COMMON", "test.RARE"] if index % 100 == 0 else ["test.COMMON"],
+                processed=index % 40 != 0,
+            )
+            for index in range(SEED_COUNT)
+        ]
+    )
+    with database.get_session() as session:
+        session.execute(text("ANALYZE papers"))
+        session.commit()
+
+
+def _plan_indexes(database, statement) -> Set[str]:
+    """Indexes in the plan of statement when the planner may not fall back to a sequential scan."""
+    with database.get_session() as session:
+        # Small test tables are cheaper to scan: check the index applies, not the table size
+        session.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = plan_root(session.scalar(Explain(statement)))
+    return {node["Index Name"] for node in plan_nodes(plan) if "Index Name" in node}
+
+
+def test_category_filter_uses_gin_index(database, seeded):
+    filters = PaperFilters(category="test.RARE")
+    assert "ix_papers_categories" in _plan_indexes(database, _count_statement(filters))
+
+
+def test_date_range_filter_uses_published_date_index(database, seeded):
+    filters = PaperFilters(published_from=SEED_START, published_to=SEED_START.replace(year=1991))
+    assert _plan_indexes(database, _page_statement(10, None, True, filters)) == {"ix_papers_published_date_id"}
+
+
+def test_unprocessed_filter_uses_partial_index(database, seeded):
+    filters = PaperFilters(processed=False)
+    assert _plan_indexes(database, _page_statement(10, None, True, filters)) == {"ix_papers_unprocessed_published_date_id"}
+
+
+async def test_list_papers_by_category(client, seeded):
+    response = await client.get("/api/v1/papers/", params={"category": "test.RARE", "limit": 100})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == SEED_COUNT // 100
+    assert data["total_is_estimate"] is False
+    assert all("test.RARE" in paper["categories"] for paper in data["papers"])
+
+
+async def test_list_papers_by_date_range_is_inclusive(client, seeded):
+    # Days 10 to 19 after SEED_START
+    params = {"from": "1990-01-11", "to": "1990-01-20", "category": "test.COMMON", "limit": 100}
+    response = await client.get("/api/v1/papers/", params=params)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 10
+    assert [paper["published_date"][:10] for paper in data["papers"]][0] == "1990-01-20"
+    assert [paper["published_date"][:10] for paper in data["papers"]][-1] == "1990-01-11"
+
+
+async def test_list_papers_by_processed(client, seeded):
+    response = await client.get("/api/v1/papers/", params={"category": "test.COMMON", "processed": "false", "limit": 100})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == SEED_COUNT // 40
+    assert all(paper["pdf_processed"] is False for paper in data["papers"])
+
+
+async def test_list_papers_estimates_large_filtered_counts(client, seeded):
+    app.state.paper_count.exact_threshold = 100
+    data = (await client.get("/api/v1/papers/", params={"category": "test.COMMON"})).json()
+    assert data["total_is_estimate"] is True
+    assert data["total"] > 100
+
+
+async def test_list_papers_caches_filtered_counts(client, seeded, seed_papers):
+    params = {"category": "test.RARE", "limit": 100}
+    first = (await client.get("/api/v1/papers/", params=params)).json()
+    seed_papers([seed_paper(SEED_COUNT + 1, ["test.RARE"])])
+    second = (await client.get("/api/v1/papers/", params=params)).json()
+    # The page is read again, the count comes from the cache until it expires
+    assert len(second["papers"]) == len(first["papers"]) + 1
+    assert second["total"] == first["total"]
+
+
+async def test_list_papers_filtered_pages_follow_cursor(client, seeded):
+    params = {"category": "test.RARE", "limit": 15}
+    first = (await client.get("/api/v1/papers/", params=params)).json()
+    second = (await client.get("/api/v1/papers/", params={**params, "cursor": first["next_cursor"]})).json()
+    ids = [paper["arxiv_id"] for paper in first["papers"] + second["papers"]]
+    assert len(ids) == len(set(ids)) == SEED_COUNT // 100
+    assert second["next_cursor"] is None
+
+
+async def test_list_papers_rejects_inverted_date_range(client):
+    response = await client.get("/api/v1/papers/", params={"from": "2024-02-01", "to": "2024-01-01"})
+    assert response.status_code == 400
@@ -0,0 +1,30 @@
+import pytest
+
+from tests.conftest import seed_paper
+
+SECTIONS = [
+    {"title": "Introduction", "content": "Some text."},
+    {"title": "Figures"},  # Parsed without content
+]
+
+
+@pytest.fixture
+def paper_with_sections(seed_papers):
+    paper = seed_paper(0, ["test.COMMON"]).model_copy(update={"sections": SECTIONS})
+    seed_papers([paper])
+    return paper.arxiv_id
+
+
+async def test_section_index_counts_missing_content_as_empty(client, paper_with_sections):
+    response = await client.get(f"/api/v1/papers/{paper_with_sections}/sections")
+    assert response.status_code == 200
+    assert response.json()["sections"] == [
+        {"index": 0, "title": "Introduction", "chars": len("Some text.")},
+        {"index": 1, "title": "Figures", "chars": 0},
+    ]
+
+
+async def test_section_without_content(client, paper_with_sections):
+    response = await client.get(f"/api/v1/papers/{paper_with_sections}/sections/1")
+    assert response.status_code == 200
+    assert response.json()["total"] == 2
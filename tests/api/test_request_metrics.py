@@ -0,0 +1,35 @@
+from prometheus_client import REGISTRY
+from src.middlewares import UNMATCHED_ROUTE
+
+
+def _requests(route: str, status: str) -> float:
+    labels = {"method": "GET", "route": route, "status": status}
+    return REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) or 0.0
+
+
+async def test_requests_are_labelled_with_full_route_template(client):
+    route = "/api/v1/papers/{arxiv_id}"
+    before = _requests(route, "404")
+    response = await client.get("/api/v1/papers/9999.99999")
+    assert response.status_code == 404
+    assert _requests(route, "404") == before + 1
+
+
+async def test_routes_of_every_router_have_distinct_labels(client):
+    before = _requests("/api/v1/ping", "200")
+    assert (await client.get("/api/v1/ping")).status_code == 200
+    assert _requests("/api/v1/ping", "200") == before + 1
+
+
+async def test_unmatched_requests_share_one_label(client):
+    before = _requests(UNMATCHED_ROUTE, "404")
+    await client.get("/api/v1/no-such-route")
+    assert _requests(UNMATCHED_ROUTE, "404") == before + 1
+
+
+async def test_server_timing_header(client):
+    response = await client.get("/api/v1/papers/9999.99999")
+    server_timing = response.headers["Server-Timing"]
+    assert server_timing.startswith("app;dur=")
+    assert "db;dur=" in server_timing
+    assert 'desc="1 queries"' in server_timing
@@ -1 +1,51 @@
 # Test configuration and shared fixtures
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+from sqlalchemy import delete
+from src.db.factory import make_database
+from src.models.paper import Paper
+from src.repositories.paper import PaperRepository
+from src.schemas.arxiv.paper import PaperCreate
+
+# arXiv IDs of seeded papers start with this (no real paper uses month 99)
+SEED_PREFIX = "9999."
+SEED_START = datetime(1990, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="session")
+def database():
+    """Database of the test settings (schema created on startup)."""
+    database = make_database()
+    yield database
+    database.teardown()
+
+
+def seed_paper(index: int, categories: List[str], processed: bool = True) -> PaperCreate:
+    """A paper published index days after SEED_START."""
+    return PaperCreate(
+        arxiv_id=f"{SEED_PREFIX}{index:05d}",
+        title=f"Seeded paper {index}",
+        authors=["Test Author"],
+        abstract="Seeded for tests.",
+        categories=categories,
+        published_date=SEED_START + timedelta(days=index),
+        pdf_url=f"https://arxiv.org/pdf/{SEED_PREFIX}{index:05d}",
+        pdf_processed=processed,
+    )
+
+
+@pytest.fixture
+def seed_papers(database):
+    """Write papers for a test and remove them afterwards."""
+
+    def seed(papers: List[PaperCreate]) -> None:
+        with database.get_session() as session:
+            PaperRepository(session).bulk_upsert(papers)
+            session.commit()
+
+    yield seed
+    with database.get_session() as session:
+        session.execute(delete(Paper).where(Paper.arxiv_id.startswith(SEED_PREFIX)))
+        session.commit()
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+from src.admission import AdmissionControl, AdmittedRoute
+from src.config import AdmissionSettings
+from src.routers import API_PREFIX, ping
+
+
+@pytest.fixture
+def blocked():
+    """Event the papers endpoints wait for, so requests hold their slot until it is set."""
+    return asyncio.Event()
+
+
+@pytest.fixture
+def client(blocked):
+    # Same layout as src.main: routers carrying the API prefix, configured by route template
+    router = APIRouter(prefix=f"{API_PREFIX}/papers", route_class=AdmittedRoute)
+
+    @router.get("/")
+    async def list_papers():
+        await blocked.wait()
+        return {"papers": []}
+
+    @router.get("/recent")
+    async def recent_papers():
+        await blocked.wait()
+        return {"papers": []}
+
+    @router.get("/{arxiv_id}")
+    async def get_paper(arxiv_id: str):
+        if arxiv_id == "missing":
+            raise HTTPException(status_code=404)
+        return {"arxiv_id": arxiv_id}
+
+    app = FastAPI()
+    app.include_router(ping.router)
+    app.include_router(router)
+    settings = AdmissionSettings()
+    app.state.admission = AdmissionControl(
+        max_concurrent=1,
+        max_queue=1,
+        queue_timeout_seconds=5,
+        retry_after_seconds=settings.retry_after_seconds,
+        route_limits={"/api/v1/papers/": 1},
+        priority_routes=settings.priority_routes,
+        exempt_routes=settings.exempt_routes,
+    )
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def _started(client: AsyncClient, path: str) -> asyncio.Task:
+    """Send a request in the background and let it reach its limiter."""
+    task = asyncio.create_task(client.get(path))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    return task
+
+
+async def test_ping_is_exempt(client, blocked):
+    # Default limiter: one request running, one waiting
+    running = await _started(client, "/api/v1/papers/recent")
+    waiting = await _started(client, "/api/v1/papers/recent")
+
+    response = await client.get("/api/v1/ping")
+    assert response.status_code == 200
+
+    blocked.set()
+    assert [(await task).status_code for task in (running, waiting)] == [200, 200]
+
+
+async def test_listing_burst_is_rejected_with_retry_after(client, blocked):
+    tasks = [await _started(client, "/api/v1/papers/") for _ in range(3)]
+    assert tasks[2].done()
+    rejected = tasks[2].result()
+    assert rejected.status_code == 503
+    assert rejected.headers["Retry-After"] == str(AdmissionSettings().retry_after_seconds)
+
+    # The listing limit is separate from the default one
+    assert (await client.get("/api/v1/papers/2401.00001")).status_code == 200
+
+    blocked.set()
+    assert [(await task).status_code for task in tasks[:2]] == [200, 200]
+
+
+async def test_priority_request_displaces_normal_waiter(client, blocked):
+    running = await _started(client, "/api/v1/papers/recent")
+    waiting = await _started(client, "/api/v1/papers/recent")
+    priority = await _started(client, "/api/v1/papers/2401.00001")
+
+    # The queue was full: the normal request gave up its place
+    assert waiting.done()
+    assert waiting.result().status_code == 503
+
+    blocked.set()
+    assert (await running).status_code == 200
+    assert (await priority).status_code == 200
+
+
+async def test_failed_request_gives_its_slot_back(client):
+    assert (await client.get("/api/v1/papers/missing")).status_code == 404
+    # With one slot, a leaked one would make this wait out the queue timeout
+    response = await asyncio.wait_for(client.get("/api/v1/papers/2401.00001"), 1)
+    assert response.status_code == 200
@@ -0,0 +1,38 @@
+import httpx
+import pytest
+from src.middlewares import CompressionMiddleware
+from starlette.responses import PlainTextResponse
+
+BODY = "0123456789" * 1000
+
+
+def _app(status_code: int, headers=None):
+    response = PlainTextResponse(BODY, status_code=status_code, headers=headers)
+    return CompressionMiddleware(response, encodings=["gzip"], levels={"gzip": 6}, minimum_size=1024)
+
+
+async def _get(app) -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get("/", headers={"Accept-Encoding": "gzip"})
+
+
+async def test_compresses_full_responses():
+    response = await _get(_app(200))
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == BODY
+
+
+@pytest.mark.parametrize(
+    "status_code, headers",
+    [
+        (206, {"Content-Range": f"bytes 0-{len(BODY) - 1}/{len(BODY) * 2}"}),
+        (200, {"Content-Range": f"bytes 0-{len(BODY) - 1}/{len(BODY)}"}),
+        (416, {"Content-Range": f"bytes */{len(BODY)}"}),
+        (416, None),
+    ],
+)
+async def test_passes_range_responses_through(status_code, headers):
+    response = await _get(_app(status_code, headers))
+    assert response.status_code == status_code
+    assert "content-encoding" not in response.headers
+    assert response.content == BODY.encode()
@@ -0,0 +1,32 @@
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from src.benchmarks.imports import FORBIDDEN_MODULES
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Median import time of src.main in a fresh interpreter (python -m src.benchmarks.imports profiles it)
+IMPORT_BUDGET_MS = 2000
+REPEAT = 3
+
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import src.main
+print(json.dumps({"import_ms": (time.perf_counter() - start) * 1000, "modules": sorted({name.split(".")[0] for name in sys.modules})}))
+"""
+
+
+def _import_api() -> dict:
+    completed = subprocess.run([sys.executable, "-c", _CHILD], capture_output=True, text=True, check=True, cwd=REPO_ROOT)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_api_import_stays_lazy_and_within_budget():
+    runs = [_import_api() for _ in range(REPEAT)]
+
+    assert not set(runs[0]["modules"]) & set(FORBIDDEN_MODULES)
+    assert statistics.median(run["import_ms"] for run in runs) <= IMPORT_BUDGET_MS
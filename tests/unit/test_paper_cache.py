@@ -0,0 +1,118 @@
+from typing import Dict, List, Optional
+
+from src.services.cache.client import TOMBSTONE, CachedResponse, LRUCache, PaperCacheInvalidator, PaperResponseCache
+
+
+class FakePipeline:
+    """Commands run as soon as they are queued."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None, nx: bool = False) -> None:
+        FakeRedis.set(self.redis, key, value, ex=ex, nx=nx)
+
+    def execute(self) -> None:
+        pass
+
+
+class FakeAsyncPipeline(FakePipeline):
+    async def execute(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "FakeAsyncPipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+
+class FakeRedis:
+    """The part of redis.Redis used by the cache; values are shared with FakeAsyncRedis."""
+
+    def __init__(self, values: Dict[str, bytes]):
+        self.values = values
+        self.ttls: Dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.values.get(key)
+
+    def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [self.values.get(key) for key in keys]
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None, nx: bool = False) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+class FakeAsyncRedis(FakeRedis):
+    """The part of redis.asyncio.Redis used by the cache."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return super().get(key)
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return super().mget(keys)
+
+    async def set(self, key: str, value: bytes, ex: Optional[int] = None, nx: bool = False) -> bool:
+        return super().set(key, value, ex=ex, nx=nx)
+
+    def pipeline(self, transaction: bool = True) -> FakeAsyncPipeline:
+        return FakeAsyncPipeline(self)
+
+
+OLD = CachedResponse('"2401.00001@1"', b'{"title": "old"}')
+NEW = CachedResponse('"2401.00001@2"', b'{"title": "new"}')
+
+
+def _caches(values: Dict[str, bytes]):
+    # No local tier: every worker but the one that wrote the entry only sees the shared tier
+    api = PaperResponseCache(LRUCache(max_entries=0, ttl_seconds=30), shared=FakeAsyncRedis(values), tombstone_ttl_seconds=60)
+    return api, PaperCacheInvalidator(FakeRedis(values), tombstone_ttl_seconds=60)
+
+
+async def test_invalidated_paper_misses_shared_tier():
+    values: Dict[str, bytes] = {}
+    api, invalidator = _caches(values)
+    await api.set("2401.00001", OLD)
+    assert await api.get("2401.00001") == OLD
+
+    assert invalidator.invalidate(["2401.00001"]) == 1
+    assert values["paper:v1:2401.00001"] == TOMBSTONE
+    assert invalidator.shared.ttls["paper:v1:2401.00001"] == 60
+    assert await api.get("2401.00001") is None
+    assert await api.get_many(["2401.00001"]) == {}
+
+
+async def test_response_read_before_invalidation_is_not_cached():
+    values: Dict[str, bytes] = {}
+    api, invalidator = _caches(values)
+    # A request read the old version, then ingestion committed and invalidated before it wrote the response
+    invalidator.invalidate(["2401.00001"])
+    await api.set("2401.00001", OLD)
+    assert values["paper:v1:2401.00001"] == TOMBSTONE
+    assert await api.get("2401.00001") is None
+
+
+async def test_paper_is_cached_again_after_tombstone_expires():
+    values: Dict[str, bytes] = {}
+    api, invalidator = _caches(values)
+    invalidator.invalidate(["2401.00001"])
+    del values["paper:v1:2401.00001"]  # Tombstone expired
+    await api.set("2401.00001", NEW)
+    assert await api.get("2401.00001") == NEW
+
+
+async def test_api_invalidation_leaves_tombstone():
+    values: Dict[str, bytes] = {}
+    api, _ = _caches(values)
+    await api.set("2401.00001", OLD)
+    await api.invalidate(["2401.00001"])
+    await api.set("2401.00001", OLD)
+    assert await api.get("2401.00001") is None